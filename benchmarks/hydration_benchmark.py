@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Task Manager - Бенчмарк преобразования строк tasks в объекты Task
+
+Запуск из корня проекта:
+    python benchmarks/hydration_benchmark.py [--rows 100000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.database import DatabaseManager  # noqa: E402
+from modules.task_models import Task, tasks_from_rows  # noqa: E402
+
+
+def legacy_rows_to_tasks(rows):
+    """Прежний вариант: позиционные индексы и полный конструктор Task"""
+    return [
+        Task(
+            id=row[0], title=row[1], content=row[2], importance=row[3],
+            duration=row[4], has_duration=bool(row[5]), priority=row[6],
+            task_type_id=row[7], is_completed=bool(row[8]), quadrant=row[9],
+            date_created=row[10], date_scheduled=row[11], is_recurring=bool(row[12]),
+            recurrence_pattern=row[13], move_count=row[14]
+        )
+        for row in rows
+    ]
+
+
+def fill_database(db: DatabaseManager, count: int):
+    """Заполнение базы тестовыми задачами (одной транзакцией)"""
+    start = date(2024, 1, 1)
+    tasks = [
+        Task(title=f"Задача {i}", content="описание " * 10,
+             importance=i % 10 + 1, priority=i % 10 + 1,
+             is_completed=bool(i % 3), quadrant=i % 5,
+             date_scheduled=(start + timedelta(days=i % 365)).isoformat() if i % 7 else "")
+        for i in range(count)
+    ]
+    db.save_tasks(tasks)
+
+
+def measure(label: str, func, rows, repeat: int):
+    """Лучшее время из repeat прогонов"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(rows)
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<28} {best * 1000:9.1f} ms  {len(rows) / best:12,.0f} rows/s")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, 'bench.db'))
+        fill_database(db, args.rows)
+
+        conn = db._get_connection()
+        rows = conn.execute(db.SELECT_TASKS_SQL).fetchall()
+        print(f"Rows: {len(rows):,}")
+
+        legacy = measure("legacy Task(...)", legacy_rows_to_tasks, rows, args.repeat)
+        fast = measure("tasks_from_rows", tasks_from_rows, rows, args.repeat)
+        print(f"Speedup: {legacy / fast:.2f}x")
+
+        # Полный путь: запрос + преобразование
+        started = time.perf_counter()
+        tasks = db.get_tasks()
+        print(f"{'get_tasks() end-to-end':<28} {(time.perf_counter() - started) * 1000:9.1f} ms"
+              f"  ({len(tasks):,} tasks)")
+
+        assert legacy_rows_to_tasks(rows[:100]) == tasks_from_rows(rows[:100])
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
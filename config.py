@@ -17,10 +17,14 @@ UI_CONFIG = {
     'window_height': 800,
     'window_title': 'Task Manager',
     'responsive_threshold': 900,  # Ширина для переключения на вертикальную компоновку
+    'responsive_hysteresis': 40,  # Полоса вокруг порога, в которой режим не меняется
+    'resize_settle_ms': 150,  # Пауза после изменения размера до перекомпоновки
 
     # Квадранты планирования
     'max_tasks_per_quadrant': 12,  # Увеличено для табличного отображения
     'quadrant_grid_columns': 4,  # Максимум колонок в таблице квадранта
+    'quadrant_render_mode': 'widgets',  # 'widgets' - виджет на задачу, 'canvas' - один Canvas на квадрант
+    'tile_pool_high_water': 64,  # Максимум скрытых плиток задач на вид (квадранты, вкладка списка)
 
     # Список задач
     'task_list_width': 280,  # Увеличено для дополнительной информации
@@ -4,10 +4,19 @@
 Task Manager - Основной файл приложения с паттерном Observer
 """
 
+import os
+import sys
+import time
+
+# Замеры запуска: python main.py --startup-timing (или TASK_MANAGER_STARTUP_TIMING=1)
+STARTUP_STARTED = time.perf_counter()
+STARTUP_TIMING = '--startup-timing' in sys.argv or os.environ.get('TASK_MANAGER_STARTUP_TIMING') == '1'
+
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime, timedelta, date
-from typing import Optional, Dict, List
+from typing import Callable, Optional, Dict, List, Iterable, Set, Tuple
+from contextlib import contextmanager
 import logging
 
 # Настройка логирования
@@ -15,38 +24,271 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(level
 logger = logging.getLogger(__name__)
 
 # Импорт модулей
+# Окна и диалоги импортируются при первом открытии
 from modules import (
     Task, TaskType, DatabaseManager,
     QuadrantsWidget, TaskListWidget, TaskDetailPanel,
-    TaskEditDialog, CalendarWindow,
     get_priority_color, get_completed_color, UI_COLORS
 )
-from modules.event_manager import EventManager, EventType, Event
+from modules.event_manager import EventManager, EventType, Event, EventFilter, EventBatch
+from modules.async_database import AsyncDatabase
+from modules.task_repository import TaskRepository, BACKLOG
+from modules.responsive_layout import ResponsiveLayout
+from modules.scheduler import Scheduler
+from modules.tile_pool import TilePool
+from modules.drag_controller import DragController
+from config import UI_CONFIG
+
+STARTUP_IMPORTED = time.perf_counter()
+
+
+class PendingId:
+    """id новой задачи для потока записи: заполняется вставкой, читается следующими записями.
+
+    Поток записи не трогает Task - до назначения id на потоке Tk записи
+    той же задачи в очереди находят строку через этот объект.
+    """
+
+    __slots__ = ('id',)
+
+    def __init__(self):
+        self.id = 0
 
 
 class TaskService:
     """Сервис для работы с задачами"""
     
-    def __init__(self, db: DatabaseManager, event_manager: EventManager):
+    def __init__(self, db: DatabaseManager, event_manager: EventManager, async_db: AsyncDatabase):
         self.db = db
         self.events = event_manager
-        
+        self.async_db = async_db
+        self.repository = TaskRepository(db, async_db)
+
+        # id(task) -> (задача, PendingId) для новых задач до назначения id
+        self._pending_ids: Dict[int, Tuple[Task, PendingId]] = {}
+
+        # Пакетный режим: записи копятся до выхода из bulk()
+        self._bulk_depth = 0
+        self._bulk_writes: List[tuple] = []  # ('save' | 'delete', task, изменения)
+        self._bulk_batch: Optional[EventBatch] = None
+
+    def _row_ref(self, task: Task):
+        """Ссылка на строку задачи для потока записи: id или PendingId новой задачи"""
+        if task.id:
+            return task.id
+        entry = self._pending_ids.get(id(task))
+        if entry is None:
+            entry = self._pending_ids[id(task)] = (task, PendingId())
+        return entry[1]
+
+    @staticmethod
+    def _resolve(ref) -> int:
+        """id строки по ссылке (выполняется в потоке записи)"""
+        return ref.id if isinstance(ref, PendingId) else ref
+
+    def _on_stored(self, task: Task, task_id: int):
+        """Запись задачи завершена: id новой задачи назначается на потоке Tk"""
+        self._pending_ids.pop(id(task), None)
+        self.repository.mark_stored(task, task_id)
+
+    def _store_task(self, ref, row: Optional[Task], changes: Optional[Dict] = None) -> int:
+        """Сохранение снимка задачи (выполняется в потоке записи); возвращает id строки"""
+        task_id = self._resolve(ref)
+        if not task_id:
+            task_id = ref.id = self.db.save_task(row)
+        elif changes is None:
+            row.id = task_id
+            self.db.save_task(row)
+        else:
+            # Только измененные колонки (снимок сделан на потоке UI)
+            self.db.update_task_fields(task_id, changes)
+        return task_id
+
+    def _remove_task(self, ref):
+        """Удаление строки задачи (выполняется в потоке записи)"""
+        task_id = self._resolve(ref)
+        if task_id:
+            self.db.delete_task(task_id)
+
+    def _persist(self, task: Task, insert: bool = False):
+        """Запись задачи в БД в фоне (память уже обновлена)"""
+        changes = task.take_changes()
+        if insert:
+            changes = None  # Новая задача пишется целиком
+        elif not changes:
+            return  # Ничего не изменилось - запись не нужна
+
+        if self._bulk_depth:
+            self._bulk_writes.append(('save', task, changes))
+            return
+        row = task.snapshot() if changes is None else None
+        self.async_db.write(self._store_task, self._row_ref(task), row, changes,
+                            callback=lambda task_id: self._on_stored(task, task_id))
+
+    @contextmanager
+    def bulk(self):
+        """Пакет операций: одна транзакция в БД и одно событие BATCH_COMPLETED.
+
+        Если в пакете есть задачи без id, BATCH_COMPLETED отправляется
+        после записи пакета, когда их id уже назначены.
+        """
+        with self.events.batch() as batch:
+            self._bulk_depth += 1
+            if self._bulk_depth == 1:
+                self._bulk_batch = batch
+            try:
+                yield self
+            finally:
+                self._bulk_depth -= 1
+                # Записи ставятся в очередь до BATCH_COMPLETED (выход из batch)
+                if self._bulk_depth == 0:
+                    self._bulk_batch = None
+                    self._flush_bulk(batch)
+
+    def _flush_bulk(self, batch: EventBatch):
+        """Запись накопленного пакета одной транзакцией"""
+        writes, self._bulk_writes = self._bulk_writes, []
+        if not writes:
+            return
+
+        # Изменения одной задачи сливаются в одну запись; снимки - на потоке Tk
+        merged: Dict[int, list] = {}  # id(task) -> [задача, изменения или None]
+        deleted = []
+        for kind, task, changes in writes:
+            if kind == 'delete':
+                deleted.append(task)
+                continue
+            entry = merged.get(id(task))
+            if entry is None:
+                merged[id(task)] = [task, changes]
+            elif entry[1] is None or changes is None:
+                entry[1] = None
+            else:
+                entry[1] = {**entry[1], **changes}
+
+        tasks = [task for task, _ in merged.values()]
+        saves = [(self._row_ref(task), task.snapshot() if changes is None else None, changes)
+                 for task, changes in merged.values()]
+        deletes = [self._row_ref(task) for task in deleted]
+
+        # id новых задач известны только после записи - пакет событий ждет ее
+        batch.held = bool(batch.unresolved)
+        self.async_db.write(self._apply_writes, saves, deletes,
+                            callback=lambda ids: self._on_bulk_stored(tasks, ids, deleted, batch),
+                            errback=lambda error: self._on_bulk_failed(error, batch))
+
+    def _apply_writes(self, saves: List[tuple], deletes: list) -> List[int]:
+        """Применение пакета снимков одной транзакцией (выполняется в потоке записи)"""
+        with self.db.transaction():
+            # Новые задачи вставляются целиком
+            inserts = [(ref, row) for ref, row, _ in saves
+                       if row is not None and not self._resolve(ref)]
+            for (ref, _), task_id in zip(inserts, self.db.save_tasks(row for _, row in inserts)):
+                ref.id = task_id
+
+            inserted = {id(ref) for ref, _ in inserts}
+            full = []
+            for ref, row, changes in saves:
+                if changes is None and id(ref) not in inserted:
+                    row.id = self._resolve(ref)
+                    full.append(row)
+            if full:
+                self.db.save_tasks(full)
+            self.db.update_tasks_fields(
+                (self._resolve(ref), changes) for ref, _, changes in saves
+                if changes and id(ref) not in inserted
+            )
+
+            deleted = [task_id for task_id in map(self._resolve, deletes) if task_id]
+            if deleted:
+                self.db.delete_tasks(deleted)
+        return [self._resolve(ref) for ref, _, _ in saves]
+
+    def _on_bulk_stored(self, tasks: List[Task], task_ids: List[int], deleted: List[Task],
+                        batch: EventBatch):
+        """Пакет записан в БД: назначение id новым задачам на потоке Tk"""
+        for task, task_id in zip(tasks, task_ids):
+            self._on_stored(task, task_id)
+        for task in deleted:
+            self._pending_ids.pop(id(task), None)
+            self.repository.mark_deleted(task)
+        self._emit_held(batch)
+
+    def _on_bulk_failed(self, error: BaseException, batch: EventBatch):
+        """Пакет не записан: UI все равно получает BATCH_COMPLETED (без id новых задач)"""
+        logger.error("Bulk write failed: %r", error)
+        self._emit_held(batch)
+
+    def _emit_held(self, batch: EventBatch):
+        """Отправка отложенного BATCH_COMPLETED с уже назначенными id"""
+        if batch.held:
+            batch.held = False
+            batch.resolve()
+            self.events.emit_now(EventType.BATCH_COMPLETED, batch)
+
+    @staticmethod
+    def _event_dates(task: Task, old_date: Optional[str]) -> Set[str]:
+        """Даты события: текущая дата задачи и та, под которой она была в индексе"""
+        dates = {task.date_scheduled or BACKLOG}
+        if old_date is not None:
+            dates.add(old_date)
+        return dates
+
     def create_task(self, task: Task) -> Task:
         """Создание новой задачи"""
-        task.id = self.db.save_task(task)
+        task = self.repository.add(task)
+        self._persist(task, insert=True)
         self.events.emit_now(EventType.TASK_CREATED, task)
         return task
+
+    def create_tasks(self, tasks: Iterable[Task]) -> List[Task]:
+        """Создание нескольких задач одной транзакцией"""
+        with self.bulk():
+            return [self.create_task(task) for task in tasks]
     
     def update_task(self, task: Task) -> Task:
         """Обновление задачи"""
-        self.db.save_task(task)
-        self.events.emit_now(EventType.TASK_UPDATED, task)
+        old_date = self.repository.indexed_date(task)
+        task = self.repository.save(task)
+        self._persist(task)
+        self.events.emit_now(EventType.TASK_UPDATED, task, dates=self._event_dates(task, old_date))
         return task
+
+    def update_tasks(self, tasks: Iterable[Task]) -> List[Task]:
+        """Обновление нескольких задач одной транзакцией"""
+        with self.bulk():
+            return [self.update_task(task) for task in tasks]
     
-    def delete_task(self, task_id: int):
-        """Удаление задачи"""
-        self.db.delete_task(task_id)
-        self.events.emit_now(EventType.TASK_DELETED, task_id)
+    def delete_task(self, task_id: int, task: Optional[Task] = None):
+        """Удаление задачи (task - если id новой задачи еще не назначен)"""
+        task = task or self.repository.get(task_id)
+        dates = None  # Задачи нет в памяти - дата неизвестна
+        if task is None:
+            # Задачи нет в памяти - удаляем только в БД
+            self.async_db.write('delete_task', task_id)
+        else:
+            dates = self._event_dates(task, self.repository.indexed_date(task))
+            self.repository.remove(task)
+            if self._bulk_depth:
+                self._bulk_writes.append(('delete', task, None))
+                if not task.id:
+                    # Событие несет id 0 - задача учитывается в пакете до назначения id
+                    self._bulk_batch.track('deleted', task)
+            else:
+                self.async_db.write(self._remove_task, self._row_ref(task),
+                                    callback=lambda _: self._on_removed(task))
+        self.events.emit_now(EventType.TASK_DELETED, task_id, dates=dates)
+
+    def _on_removed(self, task: Task):
+        """Удаление задачи записано в БД"""
+        self._pending_ids.pop(id(task), None)
+        self.repository.mark_deleted(task)
+
+    def delete_tasks(self, tasks: Iterable[Task]):
+        """Удаление нескольких задач одной транзакцией"""
+        with self.bulk():
+            for task in tasks:
+                self.delete_task(task.id, task)
     
     def move_task_to_quadrant(self, task: Task, quadrant: int) -> Task:
         """Перемещение задачи в квадрант"""
@@ -59,46 +301,67 @@ class TaskService:
             task.importance = min(10, task.importance + 1)
             task.priority = min(10, max(1, task.importance))
         
-        self.db.save_task(task)
+        # Только память и очередь записи - чтений из БД нет
+        old_date = self.repository.indexed_date(task)
+        task = self.repository.save(task)
+        self._persist(task)
         self.events.emit_now(EventType.TASK_MOVED, {
             'task': task,
             'from_quadrant': old_quadrant,
             'to_quadrant': quadrant
-        })
+        }, dates=self._event_dates(task, old_date))
         return task
     
     def toggle_task_completion(self, task: Task, completed: bool) -> Task:
         """Переключение статуса выполнения"""
         task.is_completed = completed
-        self.db.save_task(task)
-        self.events.emit_now(EventType.TASK_COMPLETED, task)
+        old_date = self.repository.indexed_date(task)
+        task = self.repository.save(task)
+        self._persist(task)
+        self.events.emit_now(EventType.TASK_COMPLETED, task, dates=self._event_dates(task, old_date))
         return task
     
-    def get_tasks_for_date(self, date_str: str) -> Dict[int, List[Task]]:
-        """Получение задач для даты, сгруппированных по квадрантам"""
-        tasks = self.db.get_tasks(date_str, include_backlog=False)
-        
-        # Группировка по квадрантам
-        quadrant_tasks = {i: [] for i in range(5)}
-        for task in tasks:
-            quadrant_tasks[task.quadrant].append(task)
-        
-        return quadrant_tasks
+    def get_tasks_for_date(self, date_str: str,
+                           on_loaded: Optional[Callable[[List[Task]], None]] = None) -> Dict[int, List[Task]]:
+        """Получение задач для даты, сгруппированных по квадрантам (из памяти; промах - в фоне)"""
+        return self.repository.get_tasks_for_date(date_str, on_loaded)
+
+    def get_quadrant_tasks(self, date_str: str, quadrant: int) -> List[Task]:
+        """Задачи одного квадранта даты (из памяти)"""
+        return self.repository.get_quadrant_tasks(date_str, quadrant)
 
 
 class TaskManager:
     """Основной класс приложения"""
 
+    # Строк аналитики за один проход mainloop
+    ANALYTICS_BATCH_SIZE = 200
+
+    WEEKDAYS = ('Понедельник', 'Вторник', 'Среда', 'Четверг', 'Пятница', 'Суббота', 'Воскресенье')
+    MONTHS = ('января', 'февраля', 'марта', 'апреля', 'мая', 'июня',
+              'июля', 'августа', 'сентября', 'октября', 'ноября', 'декабря')
+
     def __init__(self):
+        # (этап, момент окончания) для отчета о запуске
+        self.startup_marks: List[Tuple[str, float]] = [('imports', STARTUP_IMPORTED)]
+
         self.root = tk.Tk()
         self.root.title("Task Manager")
         self.root.geometry("1200x800")
         self.root.configure(bg=UI_COLORS['background'])
 
         # Инициализация компонентов
+        # Все периодические задачи UI идут через один таймер; свернутое окно не тикает
+        self.scheduler = Scheduler.install(self.root)
+        self.root.bind('<Unmap>', self.on_root_unmap, add='+')
+        self.root.bind('<Map>', self.on_root_map, add='+')
+
+        self.mark_startup('tk')
         self.db = DatabaseManager()
-        self.events = EventManager()
-        self.task_service = TaskService(self.db, self.events)
+        self.async_db = AsyncDatabase(self.db, self.root)
+        # События задач за один цикл idle сливаются: одно событие на задачу за кадр
+        self.events = EventManager(self.root, coalesce=True)
+        self.task_service = TaskService(self.db, self.events, self.async_db)
         
         # Состояние приложения
         self.current_task: Optional[Task] = None
@@ -109,60 +372,92 @@ class TaskManager:
         # Кеш
         self.task_types_cache: List[TaskType] = []
         self._updating = False  # Флаг для предотвращения циклических обновлений
+        self._analytics_generation = 0  # Счетчик запусков заполнения аналитики
+        self.analytics_tree = None  # Вкладка аналитики строится при первом открытии
+        self._tab_builders: Dict[str, Callable[[], None]] = {}
+
+        # Часы: текст перерисовывается только при изменении
+        self._clock_job = None
+        self._clock_date: Optional[date] = None
+        self._clock_date_str = ""
+        self._clock_text = ""
+
+        self.mark_startup('database')
 
         # Подписка на события
         self.setup_event_handlers()
 
         # Создание интерфейса
         self.setup_ui()
+        self.mark_startup('ui')
 
         # Загрузка данных
         self.load_data()
+        self.mark_startup('data')
 
     def setup_event_handlers(self):
         """Настройка обработчиков событий"""
-        # События задач
-        self.events.subscribe(EventType.TASK_CREATED, self.on_task_created)
-        self.events.subscribe(EventType.TASK_UPDATED, self.on_task_updated)
-        self.events.subscribe(EventType.TASK_DELETED, self.on_task_deleted)
-        self.events.subscribe(EventType.TASK_MOVED, self.on_task_moved)
-        self.events.subscribe(EventType.TASK_COMPLETED, self.on_task_completed)
-        
+        # События задач (и пакетов) - только по текущей дате
+        self.subscribe_task_events()
+
         # События дня
         self.events.subscribe(EventType.DATE_CHANGED, self.on_date_changed)
 
+    def subscribe_task_events(self):
+        """Подписка на события задач текущей даты (повторный вызов меняет фильтр)"""
+        where = EventFilter.on_date(self.current_date)
+        self.events.subscribe(EventType.TASK_CREATED, self.on_task_created, where=where)
+        self.events.subscribe(EventType.TASK_UPDATED, self.on_task_updated, where=where)
+        self.events.subscribe(EventType.TASK_DELETED, self.on_task_deleted, where=where)
+        self.events.subscribe(EventType.TASK_MOVED, self.on_task_moved, where=where)
+        self.events.subscribe(EventType.TASK_COMPLETED, self.on_task_completed, where=where)
+
+        # Пакетные операции: одно обновление UI на весь пакет
+        self.events.subscribe(EventType.BATCH_COMPLETED, self.on_batch_completed, where=where)
+
     def on_task_created(self, event: Event):
         """Обработка создания задачи"""
         task = event.data
-        logger.info(f"Task created: {task.title}")
-        
-        # Обновляем только если задача для текущей даты
-        if task.date_scheduled == self.current_date.isoformat() or not task.date_scheduled:
-            self.refresh_ui_for_task(task)
+        logger.debug("Task created: %s", task.title)
+        self.refresh_ui_for_task(task)
 
     def on_task_updated(self, event: Event):
         """Обработка обновления задачи"""
         task = event.data
-        logger.info(f"Task updated: {task.title}")
+        logger.debug("Task updated: %s", task.title)
         
         # Обновляем текущую задачу если это она
-        if self.current_task and self.current_task.id == task.id:
+        if self._is_current_task(task):
             self.current_task = task
             self.task_detail_panel.show_task(task)
         
         self.refresh_ui_for_task(task)
 
+    def _is_current_task(self, task: Task) -> bool:
+        """Это текущая задача: тот же экземпляр или (у сохраненных) тот же id"""
+        current = self.current_task
+        return current is not None and (current is task or bool(task.id) and current.id == task.id)
+
     def on_task_deleted(self, event: Event):
         """Обработка удаления задачи"""
         task_id = event.data
-        logger.info(f"Task deleted: {task_id}")
+        logger.debug("Task deleted: %s", task_id)
         
-        # Очищаем выбор если удалена текущая задача
-        if self.current_task and self.current_task.id == task_id:
+        # Очищаем выбор если удалена текущая задача (у новой задачи id 0 -
+        # проверяем, осталась ли она в памяти)
+        current = self.current_task
+        if current is not None and (current.id == task_id if task_id
+                                    else self.task_service.repository.indexed_date(current) is None):
             self.current_task = None
             self.task_detail_panel.show_no_task()
         
-        self.refresh_ui()
+        if self._updating:
+            return
+        # Оба виджета опрашиваются всегда; не нашли задачу оба - полный проход
+        in_quadrants = self.quadrants_widget.remove_task(task_id)
+        in_list = self.task_list_widget.remove_task(task_id)
+        if not (in_quadrants or in_list):
+            self.refresh_ui()
 
     def on_task_moved(self, event: Event):
         """Обработка перемещения задачи"""
@@ -171,24 +466,38 @@ class TaskManager:
         from_quad = data['from_quadrant']
         to_quad = data['to_quadrant']
         
-        logger.info(f"Task moved: {task.title} from {from_quad} to {to_quad}")
+        logger.debug("Task moved: %s from %s to %s", task.title, from_quad, to_quad)
         
         # Обновляем UI
         self.refresh_ui_for_task(task)
         
         # Обновляем текущую задачу если это она
-        if self.current_task and self.current_task.id == task.id:
+        if self._is_current_task(task):
             self.current_task = task
             self.task_detail_panel.show_task(task)
 
     def on_task_completed(self, event: Event):
         """Обработка выполнения задачи"""
         task = event.data
-        logger.info(f"Task completed status changed: {task.title} -> {task.is_completed}")
+        logger.debug("Task completed status changed: %s -> %s", task.title, task.is_completed)
         self.refresh_ui_for_task(task)
 
+    def on_batch_completed(self, event: Event):
+        """Обработка пакета изменений: одно обновление UI на весь пакет"""
+        batch = event.data
+        logger.debug("Task batch: %d events (%d created, %d updated, %d moved, %d deleted)",
+                     len(batch), len(batch.created), len(batch.updated),
+                     len(batch.moved), len(batch.deleted))
+
+        if self.current_task and self.current_task.id in batch.deleted:
+            self.current_task = None
+            self.task_detail_panel.show_no_task()
+
+        self.refresh_ui()
+
     def on_date_changed(self, event: Event):
         """Обработка изменения даты"""
+        self.subscribe_task_events()
         self.refresh_ui()
 
     def refresh_ui(self):
@@ -198,8 +507,10 @@ class TaskManager:
             
         self._updating = True
         try:
-            # Получаем все задачи для текущей даты
-            quadrant_tasks = self.task_service.get_tasks_for_date(self.current_date.isoformat())
+            # Задачи текущей даты; незагруженная дата пока пуста и перерисуется после чтения
+            date_str = self.current_date.isoformat()
+            quadrant_tasks = self.task_service.get_tasks_for_date(
+                date_str, lambda _: self._on_date_loaded(date_str))
             all_tasks = []
             for tasks in quadrant_tasks.values():
                 all_tasks.extend(tasks)
@@ -211,14 +522,26 @@ class TaskManager:
         finally:
             self._updating = False
 
+    def _on_date_loaded(self, date_str: str):
+        """Дата прочитана из БД: перерисовка, если она все еще открыта"""
+        if date_str == self.current_date.isoformat():
+            self.refresh_ui()
+
     def refresh_ui_for_task(self, task: Task):
-        """Частичное обновление UI для конкретной задачи"""
+        """Частичное обновление UI: только квадранты и группа списка этой задачи.
+
+        Данные берутся из памяти репозитория, БД не читается.
+        """
         if self._updating:
             return
-            
-        # Для упрощения делаем полное обновление
-        # В будущем можно оптимизировать для обновления только нужных частей
-        self.refresh_ui()
+
+        visible = task.date_scheduled == self.current_date.isoformat()
+        self.quadrants_widget.update_task(task, visible)
+        self.task_list_widget.update_task(task, visible)
+
+    def get_quadrant_tasks(self, quadrant: int) -> List[Task]:
+        """Задачи квадранта текущей даты (из памяти)"""
+        return self.task_service.get_quadrant_tasks(self.current_date.isoformat(), quadrant)
 
     def setup_ui(self):
         """Создание пользовательского интерфейса"""
@@ -226,7 +549,7 @@ class TaskManager:
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill='both', expand=True, padx=5, pady=5)
 
-        # Вкладка Task Manager
+        # Вкладка Task Manager - сразу, остальные строятся при первом открытии
         self.task_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.task_frame, text="Task Manager")
         self.setup_task_manager()
@@ -234,14 +557,15 @@ class TaskManager:
         # Вкладка Аналитика
         self.analytics_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.analytics_frame, text="Аналитика")
-        self.setup_analytics()
+        self._tab_builders[str(self.analytics_frame)] = self.setup_analytics
 
         # Пустые вкладки
         for tab_name in ["Питание", "Деньги", "Здоровье"]:
             frame = ttk.Frame(self.notebook)
             self.notebook.add(frame, text=tab_name)
-            ttk.Label(frame, text=f"Вкладка {tab_name} - в разработке",
-                      font=('Arial', 14)).pack(expand=True)
+            self._tab_builders[str(frame)] = lambda f=frame, n=tab_name: self.setup_placeholder_tab(f, n)
+
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
 
         # Горячие клавиши
         self.setup_hotkeys()
@@ -292,26 +616,35 @@ class TaskManager:
         self.layout_container = ttk.Frame(parent)
         self.layout_container.pack(fill='both', expand=True)
 
+        # Общий пул плиток: при смене дня виджеты задач переиспользуются
+        self.tile_pool = TilePool(high_water=UI_CONFIG['tile_pool_high_water'])
+        # Перетаскивание задач между квадрантами, списком, бэклогом и днями календаря
+        self.drag_controller = DragController(self.root)
+
         # Создание компонентов с передачей event manager
-        self.quadrants_widget = QuadrantsWidget(self.layout_container, self)
-        self.task_list_widget = TaskListWidget(self.layout_container, self)
+        self.quadrants_widget = QuadrantsWidget(self.layout_container, self,
+                                                render_mode=UI_CONFIG['quadrant_render_mode'],
+                                                tile_pool=self.tile_pool)
+        self.task_list_widget = TaskListWidget(self.layout_container, self, tile_pool=self.tile_pool)
+
+        # При узком окне задачи переносятся под планирование; режим меняется
+        # только после окончания изменения размера и вне полосы гистерезиса
+        self.layout = ResponsiveLayout(
+            self.root, self.apply_layout,
+            threshold=UI_CONFIG['responsive_threshold'],
+            hysteresis=UI_CONFIG['responsive_hysteresis'],
+            settle_ms=UI_CONFIG['resize_settle_ms'],
+        )
 
         # Начальная компоновка
-        self.switch_to_horizontal_layout()
-
-        # Привязка события изменения размера
-        self.root.bind('<Configure>', self.on_window_resize)
+        self.layout.apply(ResponsiveLayout.HORIZONTAL)
 
-    def on_window_resize(self, event):
-        """Обработка изменения размера окна"""
-        if event.widget == self.root:
-            width = self.root.winfo_width()
-
-            # При ширине меньше 900px переносим задачи под планирование
-            if width < 900:
-                self.switch_to_vertical_layout()
-            else:
-                self.switch_to_horizontal_layout()
+    def apply_layout(self, mode: str):
+        """Применение режима компоновки (вызывается только при смене режима)"""
+        if mode == ResponsiveLayout.VERTICAL:
+            self.switch_to_vertical_layout()
+        else:
+            self.switch_to_horizontal_layout()
 
     def switch_to_vertical_layout(self):
         """Переключение на вертикальную компоновку"""
@@ -329,8 +662,19 @@ class TaskManager:
         self.quadrants_widget.main_frame.pack(side='left', fill='both', expand=True, padx=(0, 10))
         self.task_list_widget.main_frame.pack(side='right', fill='y', padx=(10, 0))
 
+    def on_tab_changed(self, event):
+        """Построение вкладки при первом открытии"""
+        builder = self._tab_builders.pop(self.notebook.select(), None)
+        if builder is not None:
+            builder()
+
+    def setup_placeholder_tab(self, frame, tab_name: str):
+        """Вкладка-заглушка"""
+        ttk.Label(frame, text=f"Вкладка {tab_name} - в разработке",
+                  font=('Arial', 14)).pack(expand=True)
+
     def setup_analytics(self):
-        """Настройка вкладки аналитики"""
+        """Настройка вкладки аналитики (данные читаются при первом открытии)"""
         ttk.Label(self.analytics_frame, text="Аналитика задач",
                   font=('Arial', 16, 'bold')).pack(pady=10)
 
@@ -348,12 +692,15 @@ class TaskManager:
         ttk.Button(self.analytics_frame, text="Обновить",
                    command=self.update_analytics).pack(pady=5)
 
+        self.update_analytics()
+
     def setup_hotkeys(self):
         """Настройка горячих клавиш"""
         self.root.bind('<Control-n>', lambda e: self.create_new_task_dialog())
         self.root.bind('<Control-s>', lambda e: self.quick_save_task())
         self.root.bind('<Control-d>', lambda e: self.delete_current_task())
         self.root.bind('<F1>', lambda e: self.show_hotkeys())
+        self.root.bind('<Control-E>', lambda e: self.show_event_profiler())
 
     def show_hotkeys(self):
         """Показать окно горячих клавиш"""
@@ -366,6 +713,7 @@ class TaskManager:
             ("Ctrl+S", "Быстрое сохранение"),
             ("Ctrl+D", "Удалить задачу"),
             ("F1", "Показать горячие клавиши"),
+            ("Ctrl+Shift+E", "Профилирование событий"),
         ]
 
         for key, description in hotkeys:
@@ -377,6 +725,7 @@ class TaskManager:
     # Методы работы с задачами
     def create_new_task_dialog(self):
         """Создание новой задачи через диалог"""
+        from modules.task_edit_dialog import TaskEditDialog
         dialog = TaskEditDialog(self.root, self)
         if dialog.result:
             messagebox.showinfo("Успех", "Задача создана!")
@@ -387,6 +736,7 @@ class TaskManager:
             messagebox.showwarning("Предупреждение", "Выберите задачу для редактирования!")
             return
 
+        from modules.task_edit_dialog import TaskEditDialog
         dialog = TaskEditDialog(self.root, self, self.current_task)
         if dialog.result:
             self.current_task = dialog.result
@@ -400,12 +750,14 @@ class TaskManager:
 
     def delete_current_task(self):
         """Удаление текущей задачи"""
-        if not self.current_task or self.current_task.id == 0:
+        task = self.current_task
+        # Новая задача без id тоже удаляется - если она уже есть в памяти
+        if task is None or self.task_service.repository.indexed_date(task) is None:
             messagebox.showwarning("Предупреждение", "Нет задачи для удаления!")
             return
 
-        if messagebox.askyesno("Подтверждение", f"Удалить задачу '{self.current_task.title}'?"):
-            self.task_service.delete_task(self.current_task.id)
+        if messagebox.askyesno("Подтверждение", f"Удалить задачу '{task.title}'?"):
+            self.task_service.delete_task(task.id, task)
             messagebox.showinfo("Успех", "Задача удалена!")
 
     def select_task(self, task: Task):
@@ -419,7 +771,7 @@ class TaskManager:
 
     def move_task_to_quadrant(self, task: Task, quadrant: int):
         """Перемещение задачи в квадрант"""
-        logger.info(f"Moving task '{task.title}' to quadrant {quadrant}")
+        logger.debug("Moving task '%s' to quadrant %s", task.title, quadrant)
         
         # Устанавливаем дату если её нет
         if not task.date_scheduled and quadrant > 0:
@@ -427,9 +779,17 @@ class TaskManager:
         
         self.task_service.move_task_to_quadrant(task, quadrant)
 
+    def move_task_to_date(self, task: Task, target_date: date):
+        """Перенос задачи на другой день (квадрант сохраняется)"""
+        logger.debug("Moving task '%s' to %s", task.title, target_date)
+
+        task.date_scheduled = target_date.isoformat()
+
+        self.task_service.update_task(task)
+
     def move_task_to_backlog(self, task: Task):
         """Перемещение задачи в бэклог"""
-        logger.info(f"Moving task to backlog: {task.title}")
+        logger.debug("Moving task to backlog: %s", task.title)
         
         task.date_scheduled = ""
         task.quadrant = 0
@@ -458,7 +818,8 @@ class TaskManager:
                 self.day_started = False
 
                 end_time = datetime.now()
-                self.db.save_setting(f"day_end_{self.current_date.isoformat()}", end_time.isoformat())
+                self.async_db.write('save_setting', f"day_end_{self.current_date.isoformat()}",
+                                    end_time.isoformat())
 
                 self.current_date += timedelta(days=1)
                 self.day_btn.config(text="Начать день")
@@ -477,6 +838,7 @@ class TaskManager:
 
     def show_calendar(self):
         """Показать календарь"""
+        from modules.calendar_window import CalendarWindow
         CalendarWindow(self.root, self.db, self)
 
     def show_backlog(self):
@@ -484,6 +846,11 @@ class TaskManager:
         from modules.backlog_window import BacklogWindow
         BacklogWindow(self.root, self.db, self)
 
+    def show_event_profiler(self):
+        """Показать окно профилирования событий"""
+        from modules.event_debug_window import EventDebugWindow
+        EventDebugWindow(self.root, self.events)
+
     def go_to_date(self, target_date: date):
         """Переход к указанной дате"""
         self.current_date = target_date
@@ -503,49 +870,69 @@ class TaskManager:
 
     def update_analytics(self):
         """Обновление аналитики"""
-        for item in self.analytics_tree.get_children():
-            self.analytics_tree.delete(item)
-
-        all_tasks = self.db.get_tasks()
-
-        days_data = {}
-        for task in all_tasks:
-            if task.date_scheduled:
-                date = task.date_scheduled
-                if date not in days_data:
-                    days_data[date] = {'completed': 0, 'total_difficulty': 0}
+        if self.analytics_tree is None:
+            return  # Вкладка еще не открывалась
+        self.analytics_tree.delete(*self.analytics_tree.get_children())
+
+        # Новый запуск отменяет незавершенное заполнение
+        self._analytics_generation += 1
+        generation = self._analytics_generation
+
+        # Статистика по дням уже агрегирована в daily_rollup - O(дней), читаем в фоне
+        self.async_db.read(
+            'get_daily_rollup',
+            callback=lambda days_data: self._fill_analytics_tree(days_data, 0, generation)
+        )
+
+    def _fill_analytics_tree(self, days_data: List[tuple], start: int, generation: int):
+        """Порционное заполнение таблицы аналитики, чтобы не блокировать mainloop"""
+        if generation != self._analytics_generation:
+            return
 
-                if task.is_completed:
-                    days_data[date]['completed'] += 1
-                    days_data[date]['total_difficulty'] += task.importance
+        end = min(start + self.ANALYTICS_BATCH_SIZE, len(days_data))
+        for day, _total, completed, completed_importance, _duration in days_data[start:end]:
+            self.analytics_tree.insert('', 'end', values=(day, completed, completed_importance))
 
-        for date, data in sorted(days_data.items(), reverse=True):
-            self.analytics_tree.insert('', 'end', values=(
-                date,
-                data['completed'],
-                data['total_difficulty']
-            ))
+        if end < len(days_data):
+            self.root.after_idle(self._fill_analytics_tree, days_data, end, generation)
 
     def update_datetime(self):
-        """Обновление отображения даты и времени"""
+        """Обновление отображения даты и времени (следующий тик - через планировщик)"""
+        if self._clock_job is not None:
+            self._clock_job.cancel()  # Внеочередной вызов (смена даты)
         now = datetime.now()
 
-        weekdays = ['Понедельник', 'Вторник', 'Среда', 'Четверг', 'Пятница', 'Суббота', 'Воскресенье']
-        months = ['января', 'февраля', 'марта', 'апреля', 'мая', 'июня',
-                  'июля', 'августа', 'сентября', 'октября', 'ноября', 'декабря']
+        # Строка даты пересчитывается только при смене просматриваемой даты
+        if self._clock_date != self.current_date:
+            weekday = self.WEEKDAYS[self.current_date.weekday()]
+            month = self.MONTHS[self.current_date.month - 1]
+            self._clock_date_str = f"{weekday}, {self.current_date.day} {month} {self.current_date.year}"
+            self._clock_date = self.current_date
 
-        weekday = weekdays[self.current_date.weekday()]
-        month = months[self.current_date.month - 1]
+        if self.current_date == now.date():
+            text = f"{self._clock_date_str} | {now:%H:%M:%S}"
+            delay_ms = 1000 - now.microsecond // 1000  # К началу следующей секунды
+        else:
+            # Текст просмотра меняется только с наступлением новых суток
+            text = f"{self._clock_date_str} (просмотр)"
+            midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+            delay_ms = int((midnight - now).total_seconds() * 1000) + 1
 
-        date_str = f"{weekday}, {self.current_date.day} {month} {self.current_date.year}"
-        time_str = now.strftime("%H:%M:%S")
+        if text != self._clock_text:
+            self.datetime_label.config(text=text)
+            self._clock_text = text
 
-        if self.current_date == date.today():
-            self.datetime_label.config(text=f"{date_str} | {time_str}")
-        else:
-            self.datetime_label.config(text=f"{date_str} (просмотр)")
+        self._clock_job = self.scheduler.call_later(delay_ms, self.update_datetime, visual=True)
 
-        self.root.after(1000, self.update_datetime)
+    def on_root_unmap(self, event):
+        """Окно свернуто: визуальные таймеры (часы) приостанавливаются, БД и события - нет"""
+        if event.widget == self.root:
+            self.scheduler.suspend()
+
+    def on_root_map(self, event):
+        """Окно развернуто: просроченные тики (часы) выполняются сразу"""
+        if event.widget == self.root:
+            self.scheduler.resume()
 
     def get_task_types(self, force_refresh: bool = False) -> List[TaskType]:
         """Получение типов задач с кешированием"""
@@ -556,11 +943,56 @@ class TaskManager:
     def load_data(self):
         """Загрузка данных при запуске"""
         self.refresh_ui()
-        self.update_analytics()
+        # Аналитика читается при первом открытии ее вкладки
+
+    def mark_startup(self, stage: str):
+        """Отметка окончания этапа запуска"""
+        self.startup_marks.append((stage, time.perf_counter()))
+
+    def report_startup(self):
+        """Отчет о времени запуска по этапам (после первой отрисовки)"""
+        self.mark_startup('first paint')
+        print("Startup timing:")
+        previous = STARTUP_STARTED
+        for stage, moment in self.startup_marks:
+            print(f"  {stage:<12} {(moment - previous) * 1000:8.1f} ms   "
+                  f"(total {(moment - STARTUP_STARTED) * 1000:8.1f} ms)")
+            previous = moment
+
+    def on_close(self):
+        """Обработка закрытия главного окна"""
+        self.root.destroy()
+
+    def shutdown(self):
+        """Освобождение ресурсов при завершении"""
+        logger.info("Shutting down")
+        stats = self.events.get_delivery_stats()
+        if stats['count']:
+            logger.info("Cross-thread event delivery: %d events, mean %.1f ms, p95 %.1f ms, max %.1f ms",
+                        stats['count'], stats['mean_ms'], stats['p95_ms'], stats['max_ms'])
+        pool_stats = self.tile_pool.stats()
+        if pool_stats['hits'] or pool_stats['misses']:
+            logger.info("Task tile pool: %d hits, %d misses (%.0f%%), %d destroyed",
+                        pool_stats['hits'], pool_stats['misses'], pool_stats['hit_rate'] * 100,
+                        pool_stats['destroyed'])
+        self.layout.close()
+        self.drag_controller.close()
+        self.scheduler.close()
+        self.events.close()
+        # Сначала дописываем очередь записи, затем закрываем соединения
+        self.async_db.shutdown()
+        self.db.close()
 
     def run(self):
         """Запуск приложения"""
-        self.root.mainloop()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        if STARTUP_TIMING:
+            # Idle-обработчики отрисовки уже поставлены - отчет выполнится после них
+            self.root.after_idle(self.report_startup)
+        try:
+            self.root.mainloop()
+        finally:
+            self.shutdown()
 
 
 def main():
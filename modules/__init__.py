@@ -1,54 +1,77 @@
 # -*- coding: utf-8 -*-
 """
 Task Manager - Модули
-"""
-
-# Модели данных
-from modules.task_models import Task, TaskType
-
-# База данных
-from modules.database import DatabaseManager
-
-# Система событий
-from modules.event_manager import EventManager, EventType, Event
 
-# Инкрементальные обновления
-from modules.incremental_updater import IncrementalUpdater, SmartUpdateMixin, UpdateContext
-
-# Цвета
-from modules.colors import get_priority_color, get_completed_color, QUADRANT_COLORS, UI_COLORS
-
-# UI компоненты
-from modules.quadrants_widget import QuadrantsWidget
-from modules.task_list_widget import TaskListWidget
-from modules.task_detail_panel import TaskDetailPanel
-from modules.task_edit_dialog import TaskEditDialog
-from modules.task_type_dialog import TaskTypeDialog
-from modules.calendar_window import CalendarWindow
+Экспорты загружаются при первом обращении (PEP 562): импорт пакета
+не тянет окна и диалоги, которые нужны не при каждом запуске.
+"""
 
-# Утилиты
-from modules.utils import DateUtils, TaskUtils, truncate_text
+import importlib
 
-__all__ = [
+# Имя экспорта -> модуль, в котором он определен
+_EXPORTS = {
     # Модели данных
-    'Task', 'TaskType',
+    'Task': 'modules.task_models',
+    'TaskType': 'modules.task_models',
 
     # База данных
-    'DatabaseManager',
+    'DatabaseManager': 'modules.database',
+    'AsyncDatabase': 'modules.async_database',
+    'TaskRepository': 'modules.task_repository',
 
     # Система событий
-    'EventManager', 'EventType', 'Event',
-    
+    'EventManager': 'modules.event_manager',
+    'EventType': 'modules.event_manager',
+    'Event': 'modules.event_manager',
+    'EventBatch': 'modules.event_manager',
+    'EventFilter': 'modules.event_manager',
+    'Subscription': 'modules.event_manager',
+
+    # Планировщик
+    'Scheduler': 'modules.scheduler',
+    'ScheduledJob': 'modules.scheduler',
+
     # Инкрементальные обновления
-    'IncrementalUpdater', 'SmartUpdateMixin', 'UpdateContext',
+    'IncrementalUpdater': 'modules.incremental_updater',
+    'SmartUpdateMixin': 'modules.incremental_updater',
+    'UpdateContext': 'modules.incremental_updater',
 
     # Цвета
-    'get_priority_color', 'get_completed_color', 'QUADRANT_COLORS', 'UI_COLORS',
+    'get_priority_color': 'modules.colors',
+    'get_completed_color': 'modules.colors',
+    'QUADRANT_COLORS': 'modules.colors',
+    'UI_COLORS': 'modules.colors',
 
     # UI компоненты
-    'QuadrantsWidget', 'TaskListWidget', 'TaskDetailPanel',
-    'TaskEditDialog', 'TaskTypeDialog', 'CalendarWindow',
+    'QuadrantsWidget': 'modules.quadrants_widget',
+    'TaskListWidget': 'modules.task_list_widget',
+    'TaskDetailPanel': 'modules.task_detail_panel',
+    'TaskEditDialog': 'modules.task_edit_dialog',
+    'TaskTypeDialog': 'modules.task_type_dialog',
+    'CalendarWindow': 'modules.calendar_window',
+    'ResponsiveLayout': 'modules.responsive_layout',
+    'DragController': 'modules.drag_controller',
+    'DropTarget': 'modules.drag_controller',
+    'TilePool': 'modules.tile_pool',
 
     # Утилиты
-    'DateUtils', 'TaskUtils', 'truncate_text'
-]
\ No newline at end of file
+    'DateUtils': 'modules.utils',
+    'TaskUtils': 'modules.utils',
+    'truncate_text': 'modules.utils',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Импорт модуля экспорта при первом обращении"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Следующие обращения - без __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
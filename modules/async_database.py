@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Task Manager - Асинхронный доступ к базе данных
+"""
+
+import queue
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Union
+
+from .database import DatabaseManager
+from .scheduler import call_later, cancel_call
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDatabase:
+    """Фасад над DatabaseManager: запись в одном потоке, чтение в пуле потоков.
+
+    Задания ставятся только с потока Tk (там же, где создан объект).
+    Все записи выполняются одним потоком строго в порядке постановки,
+    поэтому изменения одной задачи не обгоняют друг друга. Результаты
+    доставляются в callback'и на потоке Tk через опрос очереди общим
+    планировщиком (пока есть незавершенные задания).
+    """
+
+    POLL_INTERVAL_MS = 15  # Примерно один кадр
+
+    def __init__(self, db: DatabaseManager, root, reader_count: int = 2):
+        self.db = db
+        self.root = root
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+        self._readers = ThreadPoolExecutor(max_workers=reader_count, thread_name_prefix="db-reader")
+
+        # Завершенные задания для доставки на поток Tk
+        self._completed: "queue.SimpleQueue" = queue.SimpleQueue()
+        # Задания ставятся и доставляются только на потоке Tk - счетчику не нужна блокировка
+        self._owner = threading.current_thread()
+        self._pending = 0
+        self._poll_id = None
+        self._closed = False
+
+    def read(self, method: Union[str, Callable], *args,
+             callback: Optional[Callable[[Any], None]] = None,
+             errback: Optional[Callable[[BaseException], None]] = None,
+             after_writes: bool = False, **kwargs) -> Future:
+        """Чтение в фоне. after_writes=True - выполнить после всех поставленных записей"""
+        executor = self._writer if after_writes else self._readers
+        return self._submit(executor, method, args, kwargs, callback, errback)
+
+    def write(self, method: Union[str, Callable], *args,
+              callback: Optional[Callable[[Any], None]] = None,
+              errback: Optional[Callable[[BaseException], None]] = None,
+              **kwargs) -> Future:
+        """Запись в фоне (строго по порядку постановки)"""
+        return self._submit(self._writer, method, args, kwargs, callback, errback)
+
+    def _submit(self, executor: ThreadPoolExecutor, method, args, kwargs,
+                callback, errback) -> Future:
+        """Постановка задания в пул и регистрация доставки результата"""
+        if self._closed:
+            raise RuntimeError("AsyncDatabase is shut down")
+        if threading.current_thread() is not self._owner:
+            raise RuntimeError("AsyncDatabase jobs must be submitted from the Tk thread")
+
+        func = getattr(self.db, method) if isinstance(method, str) else method
+        future = executor.submit(func, *args, **kwargs)
+
+        self._pending += 1
+        future.add_done_callback(lambda f: self._completed.put((f, callback, errback)))
+        self._ensure_polling()
+        return future
+
+    def _ensure_polling(self):
+        """Запуск опроса очереди, если он еще не запущен"""
+        if self._poll_id is None:
+            self._poll_id = call_later(self.root, self.POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        """Доставка готовых результатов на потоке Tk"""
+        self._poll_id = None
+
+        while True:
+            try:
+                future, callback, errback = self._completed.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            self._deliver(future, callback, errback)
+
+        # Опрашиваем только пока есть незавершенные задания
+        if self._pending > 0 and not self._closed:
+            self._ensure_polling()
+
+    def _deliver(self, future: Future, callback, errback):
+        """Вызов callback или errback для завершенного задания"""
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        try:
+            if error is not None:
+                if errback:
+                    errback(error)
+                else:
+                    logger.error("Background database job failed: %r", error)
+            elif callback:
+                callback(future.result())
+        except Exception as e:
+            logger.error(f"Error in database callback: {e}")
+
+    def flush(self, timeout: float = None):
+        """Ожидание завершения всех поставленных записей"""
+        self._writer.submit(lambda: None).result(timeout)
+
+    def shutdown(self):
+        """Остановка потоков (записи дописываются, чтения отменяются)"""
+        if self._closed:
+            return
+        self._closed = True
+
+        cancel_call(self.root, self._poll_id)
+        self._poll_id = None
+
+        self._readers.shutdown(wait=True, cancel_futures=True)
+        self._writer.shutdown(wait=True)
@@ -10,6 +10,9 @@ from datetime import datetime
 import logging
 
 from .task_models import Task
+from .task_repository import BACKLOG
+from .event_manager import EventType, Event, EventFilter
+from .scheduler import call_later, cancel_call
 from .task_edit_dialog import TaskEditDialog
 from .colors import get_priority_color, get_completed_color, UI_COLORS
 from .utils import TaskUtils, truncate_text
@@ -20,6 +23,15 @@ logger = logging.getLogger(__name__)
 class BacklogWindow:
     """Оптимизированное окно бэклога с эффективным использованием пространства"""
 
+    SEARCH_DEBOUNCE_MS = 250  # Поиск запускается после паузы в наборе
+    SEARCH_LIMIT = 500
+
+    # События задач, после которых бэклог перестраивается из памяти
+    TASK_EVENTS = (
+        EventType.TASK_CREATED, EventType.TASK_UPDATED, EventType.TASK_DELETED,
+        EventType.TASK_MOVED, EventType.TASK_COMPLETED, EventType.BATCH_COMPLETED,
+    )
+
     def __init__(self, parent, db_manager, task_manager):
         self.parent = parent
         self.db = db_manager
@@ -27,13 +39,17 @@ class BacklogWindow:
         self.selected_task: Optional[Task] = None
         self.current_filter = "all"
         self.search_var = tk.StringVar()
+        self.search_ranks: Optional[Dict[int, int]] = None  # id -> место в выдаче поиска
+        self._search_after_id = None
+        self._search_generation = 0
+        self._refresh_pending = False  # Перестроение после событий уже запланировано
         
         # Кеш для задач
         self.all_tasks: List[Task] = []
         self.filtered_tasks: List[Task] = []
         
-        # Маппинг item -> task_id для Treeview
-        self.item_to_task_id = {}
+        # Маппинг item -> task для Treeview
+        self.item_to_task: Dict[str, Task] = {}
         
         # Создание окна
         self.window = tk.Toplevel(parent)
@@ -42,8 +58,41 @@ class BacklogWindow:
         self.window.transient(parent)
         
         self.setup_ui()
+        self.subscribe_to_events()
+        self.setup_drop_target()
         self.load_tasks()
 
+    def subscribe_to_events(self):
+        """Подписка на изменения задач бэклога; снимается при закрытии окна"""
+        where = EventFilter.backlog()
+        for event_type in self.TASK_EVENTS:
+            self.task_manager.events.subscribe(event_type, self.on_tasks_changed,
+                                               owner=self.window, where=where)
+
+    def setup_drop_target(self):
+        """Задачи дня, брошенные на список бэклога, переносятся в бэклог"""
+        self.task_manager.drag_controller.add_target(
+            self.tasks_tree,
+            on_drop=self.task_manager.move_task_to_backlog,
+            accepts=lambda t: bool(t.date_scheduled),
+        )
+
+    def on_tasks_changed(self, event: Event):
+        """Изменение задач в другом окне: одно перестроение за цикл idle"""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.window.after_idle(self._refresh_after_change)
+
+    def _refresh_after_change(self):
+        """Перестроение списка после изменений задач"""
+        self._refresh_pending = False
+        if self.window.winfo_exists() and self.repository.is_loaded(BACKLOG):
+            self.refresh_from_memory()
+            if self.search_ranks is not None:
+                # Места в выдаче посчитаны по старым текстам - поиск заново
+                # (чтение идет после записи этих изменений)
+                self.run_search()
+
     def setup_ui(self):
         """Создание оптимизированного интерфейса"""
         # Главный контейнер
@@ -81,7 +130,7 @@ class BacklogWindow:
         ttk.Label(search_frame, text="Поиск:").pack(anchor='w')
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
         search_entry.pack(fill='x', pady=2)
-        search_entry.bind('<KeyRelease>', lambda e: self.apply_filters())
+        search_entry.bind('<KeyRelease>', lambda e: self.schedule_search())
         
         # Разделитель
         ttk.Separator(parent, orient='horizontal').pack(fill='x', pady=10)
@@ -150,7 +199,8 @@ class BacklogWindow:
         
         # Создаем Treeview (без task_id в columns)
         columns = ('type', 'importance', 'priority', 'duration')
-        self.tasks_tree = ttk.Treeview(list_frame, columns=columns, show='tree headings', height=20)
+        self.tasks_tree = ttk.Treeview(list_frame, columns=columns, show='tree headings', height=20,
+                                       selectmode='extended')
         
         # Настройка колонок
         self.tasks_tree.heading('#0', text='Задача')
@@ -215,7 +265,7 @@ class BacklogWindow:
                   command=self.delete_task).pack(side='left', padx=2)
         
         ttk.Button(buttons_frame, text="Обновить",
-                  command=self.load_tasks).pack(side='left', padx=2)
+                  command=self.reload_tasks).pack(side='left', padx=2)
 
     def setup_context_menu(self):
         """Создание контекстного меню"""
@@ -233,11 +283,35 @@ class BacklogWindow:
         self.context_menu.add_command(label="Удалить",
                                      command=self.delete_task)
 
+    @property
+    def repository(self):
+        """Репозиторий задач приложения"""
+        return self.task_manager.task_service.repository
+
     def load_tasks(self):
-        """Загрузка всех задач из бэклога"""
-        # Получаем все задачи
-        all_tasks = self.db.get_tasks(include_backlog=True)
-        self.all_tasks = [t for t in all_tasks if not t.date_scheduled]
+        """Загрузка задач бэклога (из памяти или в фоне из БД)"""
+        if not self.repository.is_loaded(BACKLOG):
+            self.status_label.config(text="Загрузка...")
+        self.repository.load_async(BACKLOG, self.on_tasks_loaded)
+
+    def reload_tasks(self):
+        """Принудительное перечитывание бэклога из БД"""
+        self.repository.invalidate(BACKLOG)
+        self.load_tasks()
+
+    def on_tasks_loaded(self, all_tasks: List[Task]):
+        """Обработка загруженных задач бэклога"""
+        if not self.window.winfo_exists():
+            return  # Окно закрыто до окончания загрузки
+        
+        self.refresh_from_memory()
+
+    def refresh_from_memory(self):
+        """Обновление окна по задачам в памяти без обращения к БД"""
+        # Репозиторий уже переиндексировал задачи, получившие дату
+        self.all_tasks = self.repository.get_cached_tasks(BACKLOG)
+        if self.selected_task and not any(t is self.selected_task for t in self.all_tasks):
+            self.selected_task = None
         
         # Обновляем список типов
         self.update_types_list()
@@ -252,7 +326,7 @@ class BacklogWindow:
             widget.destroy()
         
         # Получаем типы и считаем задачи
-        task_types = self.db.get_task_types()
+        task_types = self.task_manager.get_task_types()
         type_counts = {}
         
         for task in self.all_tasks:
@@ -314,8 +388,18 @@ class BacklogWindow:
             self.current_filter = None
         else:
             self.current_filter = task_type.id
-        
-        self.apply_filters()
+
+        if self.search_ranks is not None:
+            # Выдача поиска ограничена LIMIT - перезапрос с фильтром по типу в SQL
+            self.run_search()
+        else:
+            self.apply_filters()
+
+    def _filter_type_id(self) -> Optional[int]:
+        """Тип для запроса к БД: None - все типы, 0 - без типа"""
+        if self.current_filter == "all":
+            return None
+        return self.current_filter or 0
 
     def apply_filters(self):
         """Применение всех фильтров"""
@@ -329,19 +413,51 @@ class BacklogWindow:
             else:
                 self.filtered_tasks = [t for t in self.filtered_tasks if t.task_type_id == self.current_filter]
         
-        # Фильтр по поиску
-        search_text = self.search_var.get().lower()
-        if search_text:
-            self.filtered_tasks = [t for t in self.filtered_tasks 
-                                 if search_text in t.title.lower() or 
-                                    search_text in t.content.lower()]
-        
-        # Сортировка
-        self.sort_tasks()
+        # Фильтр по поиску (результаты полнотекстового индекса)
+        if self.search_ranks is not None:
+            ranks = self.search_ranks
+            self.filtered_tasks = [t for t in self.filtered_tasks if t.id in ranks]
+            # По релевантности
+            self.filtered_tasks.sort(key=lambda t: ranks[t.id])
+        else:
+            # Сортировка
+            self.sort_tasks()
         
         # Обновляем отображение
         self.update_tasks_display()
 
+    def schedule_search(self):
+        """Отложенный запуск поиска (перезапускается при каждом нажатии)"""
+        cancel_call(self.window, self._search_after_id)
+        self._search_after_id = call_later(self.window, self.SEARCH_DEBOUNCE_MS, self.run_search)
+
+    def run_search(self):
+        """Поиск по индексу в фоне"""
+        self._search_after_id = None
+        if not self.window.winfo_exists():
+            return  # Окно закрыли, пока ждали паузы в наборе
+        query = self.search_var.get().strip()
+        type_id = self._filter_type_id()
+        self._search_generation += 1
+        generation = self._search_generation
+
+        if not query:
+            self.search_ranks = None
+            self.apply_filters()
+            return
+
+        def on_found(tasks: List[Task]):
+            # Окно закрыто, запрос или фильтр по типу уже сменились
+            if (not self.window.winfo_exists() or generation != self._search_generation
+                    or type_id != self._filter_type_id()):
+                return
+            self.search_ranks = {task.id: rank for rank, task in enumerate(tasks)}
+            self.apply_filters()
+
+        self.status_label.config(text="Поиск...")
+        self.task_manager.async_db.read('search_tasks', query, type_id=type_id, limit=self.SEARCH_LIMIT,
+                                        backlog_only=True, callback=on_found, after_writes=True)
+
     def sort_tasks(self):
         """Сортировка задач"""
         sort_by = self.sort_var.get()
@@ -358,12 +474,11 @@ class BacklogWindow:
     def update_tasks_display(self):
         """Обновление отображения задач в дереве"""
         # Очищаем дерево и маппинг
-        for item in self.tasks_tree.get_children():
-            self.tasks_tree.delete(item)
-        self.item_to_task_id.clear()
+        self.tasks_tree.delete(*self.tasks_tree.get_children())
+        self.item_to_task.clear()
         
         # Получаем типы для отображения
-        task_types = {t.id: t for t in self.db.get_task_types()}
+        task_types = {t.id: t for t in self.task_manager.get_task_types()}
         
         # Добавляем задачи
         for task in self.filtered_tasks:
@@ -381,7 +496,7 @@ class BacklogWindow:
                                         tags=(f'priority_{task.priority}',))
             
             # Сохраняем маппинг
-            self.item_to_task_id[item] = task.id
+            self.item_to_task[item] = task
         
         # Обновляем информацию
         self.tasks_info_label.config(text=f"Показано задач: {len(self.filtered_tasks)} из {len(self.all_tasks)}")
@@ -392,9 +507,9 @@ class BacklogWindow:
         selection = self.tasks_tree.selection()
         if selection:
             item = selection[0]
-            task_id = self.item_to_task_id.get(item)
-            if task_id:
-                self.selected_task = next((t for t in self.all_tasks if t.id == task_id), None)
+            task = self.item_to_task.get(item)
+            if task:
+                self.selected_task = task
                 self.update_status()
 
     def show_context_menu(self, event):
@@ -402,43 +517,52 @@ class BacklogWindow:
         # Выбираем элемент под курсором
         item = self.tasks_tree.identify_row(event.y)
         if item:
-            self.tasks_tree.selection_set(item)
+            # Клик внутри выделения сохраняет множественный выбор
+            if item not in self.tasks_tree.selection():
+                self.tasks_tree.selection_set(item)
             self.on_task_select(None)
             self.context_menu.post(event.x_root, event.y_root)
 
+    def get_selected_tasks(self) -> List[Task]:
+        """Все выделенные задачи (Treeview допускает множественный выбор)"""
+        tasks = [self.item_to_task[item] for item in self.tasks_tree.selection()
+                 if item in self.item_to_task]
+        if not tasks and self.selected_task:
+            tasks = [self.selected_task]
+        return tasks
+
+    def _describe(self, tasks: List[Task]) -> str:
+        """Название задачи или количество задач для сообщений"""
+        if len(tasks) == 1:
+            return f"Задача '{tasks[0].title}'"
+        return f"Задач: {len(tasks)}"
+
     def move_to_today(self):
-        """Перемещение задачи на сегодня"""
-        if not self.selected_task:
-            messagebox.showwarning("Предупреждение", "Выберите задачу для перемещения")
-            return
-        
-        self.selected_task.date_scheduled = datetime.now().date().isoformat()
-        self.db.save_task(self.selected_task)
-        
-        # Удаляем из списка
-        self.all_tasks.remove(self.selected_task)
-        self.apply_filters()
-        
-        # Обновляем основное окно
-        self.task_manager.refresh_ui()
-        
-        messagebox.showinfo("Успех", f"Задача '{self.selected_task.title}' перемещена на сегодня")
+        """Перемещение выделенных задач на сегодня"""
+        self._move_selected_to(datetime.now().date(), "на сегодня")
 
     def move_to_tomorrow(self):
-        """Перемещение задачи на завтра"""
-        if not self.selected_task:
+        """Перемещение выделенных задач на завтра"""
+        from datetime import timedelta
+        self._move_selected_to(datetime.now().date() + timedelta(days=1), "на завтра")
+
+    def _move_selected_to(self, target_date, label: str):
+        """Перенос выделенных задач на дату одной транзакцией"""
+        tasks = self.get_selected_tasks()
+        if not tasks:
+            messagebox.showwarning("Предупреждение", "Выберите задачу для перемещения")
             return
         
-        from datetime import timedelta
-        tomorrow = (datetime.now().date() + timedelta(days=1)).isoformat()
+        for task in tasks:
+            task.date_scheduled = target_date.isoformat()
         
-        self.selected_task.date_scheduled = tomorrow
-        self.db.save_task(self.selected_task)
+        # Одна транзакция и одно событие на весь пакет
+        self.task_manager.task_service.update_tasks(tasks)
         
-        self.all_tasks.remove(self.selected_task)
-        self.apply_filters()
+        # Задачи с датой уходят из бэклога
+        self.refresh_from_memory()
         
-        messagebox.showinfo("Успех", f"Задача '{self.selected_task.title}' перемещена на завтра")
+        messagebox.showinfo("Успех", f"{self._describe(tasks)} перемещено {label}")
 
     def edit_task(self):
         """Редактирование задачи"""
@@ -448,42 +572,47 @@ class BacklogWindow:
         
         dialog = TaskEditDialog(self.window, self.task_manager, self.selected_task)
         if dialog.result:
-            self.load_tasks()
+            self.refresh_from_memory()
 
     def duplicate_task(self):
-        """Дублирование задачи"""
-        if not self.selected_task:
+        """Дублирование выделенных задач"""
+        tasks = self.get_selected_tasks()
+        if not tasks:
             return
         
-        # Создаем копию
-        new_task = Task(
-            title=f"{self.selected_task.title} (копия)",
-            content=self.selected_task.content,
-            importance=self.selected_task.importance,
-            priority=self.selected_task.priority,
-            task_type_id=self.selected_task.task_type_id,
-            has_duration=self.selected_task.has_duration,
-            duration=self.selected_task.duration,
-            date_scheduled=""  # В бэклог
-        )
-        
-        self.db.save_task(new_task)
-        self.load_tasks()
-        
-        messagebox.showinfo("Успех", "Задача продублирована")
+        # Создаем копии
+        copies = [
+            Task(
+                title=f"{task.title} (копия)",
+                content=task.content,
+                importance=task.importance,
+                priority=task.priority,
+                task_type_id=task.task_type_id,
+                has_duration=task.has_duration,
+                duration=task.duration,
+                date_scheduled=""  # В бэклог
+            )
+            for task in tasks
+        ]
+        
+        self.task_manager.task_service.create_tasks(copies)
+        self.refresh_from_memory()
+        
+        messagebox.showinfo("Успех", "Задачи продублированы" if len(copies) > 1 else "Задача продублирована")
 
     def delete_task(self):
-        """Удаление задачи"""
-        if not self.selected_task:
+        """Удаление выделенных задач"""
+        tasks = self.get_selected_tasks()
+        if not tasks:
             messagebox.showwarning("Предупреждение", "Выберите задачу для удаления")
             return
         
-        if messagebox.askyesno("Подтверждение", 
-                              f"Удалить задачу '{self.selected_task.title}'?"):
-            self.db.delete_task(self.selected_task.id)
-            self.all_tasks.remove(self.selected_task)
+        question = (f"Удалить задачу '{tasks[0].title}'?" if len(tasks) == 1
+                    else f"Удалить выбранные задачи ({len(tasks)})?")
+        if messagebox.askyesno("Подтверждение", question):
+            self.task_manager.task_service.delete_tasks(tasks)
             self.selected_task = None
-            self.apply_filters()
+            self.refresh_from_memory()
 
     def create_new_task(self):
         """Создание новой задачи в бэклоге"""
@@ -492,12 +621,12 @@ class BacklogWindow:
         
         dialog = TaskEditDialog(self.window, self.task_manager, new_task)
         if dialog.result:
-            self.load_tasks()
+            self.refresh_from_memory()
 
     def update_status(self):
         """Обновление статусной строки"""
         if self.selected_task:
-            task_types = {t.id: t for t in self.db.get_task_types()}
+            task_types = {t.id: t for t in self.task_manager.get_task_types()}
             task_type = task_types.get(self.selected_task.task_type_id)
             type_name = task_type.name if task_type else "Без типа"
             
@@ -7,12 +7,13 @@ import tkinter as tk
 from tkinter import ttk
 import calendar
 from datetime import datetime, date, timedelta
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Tuple
 import logging
 
 from .task_models import Task
 from .task_edit_dialog import TaskEditDialog
 from .incremental_updater import SmartUpdateMixin
+from .event_manager import EventType, Event, EventFilter
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,12 @@ logger = logging.getLogger(__name__)
 class CalendarWindow(SmartUpdateMixin):
     """Оптимизированное окно календаря с инкрементальными обновлениями"""
 
+    # События задач, меняющие сводки дней
+    TASK_EVENTS = (
+        EventType.TASK_CREATED, EventType.TASK_UPDATED, EventType.TASK_DELETED,
+        EventType.TASK_MOVED, EventType.TASK_COMPLETED, EventType.BATCH_COMPLETED,
+    )
+
     def __init__(self, parent, db_manager, task_manager=None):
         super().__init__()
         self.parent = parent
@@ -35,13 +42,74 @@ class CalendarWindow(SmartUpdateMixin):
         
         # Кеши
         self.day_buttons = {}  # date -> button widget
-        self.day_tasks_cache = {}  # date -> list of tasks
-        self.month_tasks_cache = {}  # (year, month) -> {date: tasks}
+        self.day_tasks_cache = {}  # date -> list of tasks (только просмотренные дни)
+        self.month_summaries_cache = {}  # (year, month) -> {date: (total, completed, duration)}
         self.button_states = {}  # date -> (text, bg_color, fg_color)
+        self._refresh_pending = False  # Обновление после событий уже запланировано
         
         self.setup_ui()
+        self.subscribe_to_events()
         self.initial_load()
 
+    def subscribe_to_events(self):
+        """Подписка на изменения задач; снимается при закрытии окна.
+
+        Перестроение - только по событиям видимого месяца, сводки остальных
+        месяцев в кеше лишь сбрасываются.
+        """
+        if not self.task_manager:
+            return
+        events = self.task_manager.events
+        where = self._month_filter()
+        for event_type in self.TASK_EVENTS:
+            events.subscribe(event_type, self.on_tasks_changed, owner=self.window, where=where)
+            events.subscribe(event_type, self.on_summaries_changed, owner=self.window)
+
+    def _month_filter(self) -> EventFilter:
+        """Фильтр событий по видимому месяцу"""
+        first = self.current_date.replace(day=1)
+        last = first.replace(day=calendar.monthrange(first.year, first.month)[1])
+        return EventFilter.between(first, last)
+
+    def _update_event_filter(self):
+        """Перенос фильтра подписки на новый видимый месяц"""
+        if not self.task_manager:
+            return
+        where = self._month_filter()
+        for event_type in self.TASK_EVENTS:
+            self.task_manager.events.subscribe(event_type, self.on_tasks_changed, where=where)
+
+    def on_summaries_changed(self, event: Event):
+        """Сброс закешированных сводок и задач затронутых дней (без перестроения)"""
+        if event.dates is None:
+            self.month_summaries_cache.clear()
+            self.day_tasks_cache.clear()
+            return
+        for date_str in event.dates:
+            if date_str:
+                day_date = date.fromisoformat(date_str)
+                self.month_summaries_cache.pop((day_date.year, day_date.month), None)
+                self.day_tasks_cache.pop(day_date, None)
+
+    def on_tasks_changed(self, event: Event):
+        """Изменение задач: одно обновление календаря за цикл idle"""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.window.after_idle(self._refresh_after_change)
+
+    def _refresh_after_change(self):
+        """Перечитывание сводок месяца и списка дня после изменений"""
+        self._refresh_pending = False
+        if not self.window.winfo_exists():
+            return
+        
+        # Сводки затронутых месяцев уже сброшены в on_summaries_changed
+        # Задачи дней берутся из памяти репозитория
+        self.day_tasks_cache.clear()
+        
+        self.load_month_summaries(self.current_date.year, self.current_date.month)
+        self.refresh_tasks_list()
+
     def setup_ui(self):
         """Создание интерфейса"""
         main_container = ttk.PanedWindow(self.window, orient='horizontal')
@@ -136,7 +204,7 @@ class CalendarWindow(SmartUpdateMixin):
     def initial_load(self):
         """Начальная загрузка"""
         self.update_month_header()
-        self.load_month_tasks(self.current_date.year, self.current_date.month)
+        self.load_month_summaries(self.current_date.year, self.current_date.month)
         self.create_month_buttons()
         self.on_date_selected(date.today())
 
@@ -182,10 +250,12 @@ class CalendarWindow(SmartUpdateMixin):
         
         self.current_date = new_date
         self.update_month_header()
+        if (new_year, new_month) != (old_year, old_month):
+            self._update_event_filter()
         
-        # Загружаем задачи для нового месяца если их нет в кеше
-        if (new_year, new_month) not in self.month_tasks_cache:
-            self.load_month_tasks(new_year, new_month)
+        # Загружаем сводку нового месяца если её нет в кеше
+        if (new_year, new_month) not in self.month_summaries_cache:
+            self.load_month_summaries(new_year, new_month)
         
         # Инкрементальное обновление кнопок
         self.update_month_buttons_incremental()
@@ -199,39 +269,45 @@ class CalendarWindow(SmartUpdateMixin):
         month_name = month_names[self.current_date.month - 1]
         self.month_year_label.config(text=f"{month_name} {self.current_date.year}")
 
-    def load_month_tasks(self, year: int, month: int):
-        """Загрузка всех задач месяца одним запросом"""
-        logger.debug(f"Loading tasks for {year}-{month}")
+    def load_month_summaries(self, year: int, month: int):
+        """Загрузка сводки по дням месяца одним агрегирующим запросом"""
+        logger.debug("Loading day summaries for %s-%s", year, month)
         
         # Определяем диапазон дат месяца
         first_day = date(year, month, 1)
-        if month == 12:
-            last_day = date(year + 1, 1, 1) - timedelta(days=1)
+        last_day = date(year, month, calendar.monthrange(year, month)[1])
+        
+        def on_loaded(summaries: Dict[str, Tuple[int, int, int]]):
+            if not self.window.winfo_exists():
+                return  # Окно закрыто до окончания загрузки
+            
+            # Сохраняем в кеш
+            self.month_summaries_cache[(year, month)] = {
+                date.fromisoformat(day_str): summary for day_str, summary in summaries.items()
+            }
+            
+            # Обновляем кнопки, если месяц все еще отображается
+            if (self.current_date.year, self.current_date.month) == (year, month):
+                self.update_visible_buttons()
+        
+        self._read('get_day_summaries', first_day.isoformat(), last_day.isoformat(), callback=on_loaded)
+
+    def _read(self, method: str, *args, callback, **kwargs):
+        """Чтение из БД в фоне (синхронно, если календарь открыт без TaskManager)"""
+        # Читаем после поставленных записей, чтобы видеть только что сохраненные задачи
+        if self.task_manager:
+            self.task_manager.async_db.read(method, *args, callback=callback, after_writes=True, **kwargs)
         else:
-            last_day = date(year, month + 1, 1) - timedelta(days=1)
-        
-        # Получаем все задачи
-        all_tasks = self.db.get_tasks()
-        
-        # Фильтруем и группируем по датам
-        month_tasks = {}
-        for task in all_tasks:
-            if task.date_scheduled:
-                try:
-                    task_date = datetime.strptime(task.date_scheduled, '%Y-%m-%d').date()
-                    if first_day <= task_date <= last_day:
-                        if task_date not in month_tasks:
-                            month_tasks[task_date] = []
-                        month_tasks[task_date].append(task)
-                except:
-                    pass
-        
-        # Сохраняем в кеш
-        self.month_tasks_cache[(year, month)] = month_tasks
-        
-        # Обновляем кеш отдельных дней
-        for day_date, tasks in month_tasks.items():
-            self.day_tasks_cache[day_date] = tasks
+            callback(getattr(self.db, method)(*args, **kwargs))
+
+    def update_visible_buttons(self):
+        """Обновление кнопок дней отображаемого месяца"""
+        cal = calendar.monthcalendar(self.current_date.year, self.current_date.month)
+        for week in cal:
+            for day in week:
+                if day > 0:
+                    day_date = date(self.current_date.year, self.current_date.month, day)
+                    self.update_day_button_if_changed(day_date)
 
     def create_month_buttons(self):
         """Создание всех кнопок месяца"""
@@ -254,6 +330,7 @@ class CalendarWindow(SmartUpdateMixin):
                     )
                     btn.grid(row=week_num + 1, column=day_num, sticky='nsew', padx=1, pady=1)
                     self.day_buttons[day_date] = btn
+                    self._add_day_drop_target(btn, day_date)
                 
                 # Обновляем кнопку
                 self.update_day_button(day_date)
@@ -262,6 +339,22 @@ class CalendarWindow(SmartUpdateMixin):
         for i in range(len(cal) + 1):
             self.calendar_frame.grid_rowconfigure(i, weight=1)
 
+    def _add_day_drop_target(self, btn: tk.Button, day_date: date):
+        """Задача, брошенная на день, переносится на эту дату.
+
+        Кнопки других месяцев скрыты и контроллером пропускаются,
+        кнопки закрытого окна удаляются из целей вместе с виджетами.
+        """
+        if not self.task_manager:
+            return
+        self.task_manager.drag_controller.add_target(
+            btn,
+            on_drop=lambda t: self.task_manager.move_task_to_date(t, day_date),
+            accepts=lambda t: t.date_scheduled != day_date.isoformat(),
+            on_enter=lambda: btn.config(relief='sunken', bd=3),
+            on_leave=lambda: btn.config(relief='raised', bd=1),
+        )
+
     def update_month_buttons_incremental(self):
         """Инкрементальное обновление кнопок при смене месяца"""
         cal = calendar.monthcalendar(self.current_date.year, self.current_date.month)
@@ -302,6 +395,7 @@ class CalendarWindow(SmartUpdateMixin):
                     )
                     btn.grid(row=week_num + 1, column=day_num, sticky='nsew', padx=1, pady=1)
                     self.day_buttons[day_date] = btn
+                    self._add_day_drop_target(btn, day_date)
                 
                 # Обновляем только если изменилось состояние
                 self.update_day_button_if_changed(day_date)
@@ -316,18 +410,8 @@ class CalendarWindow(SmartUpdateMixin):
         # Получаем стиль
         style = self.get_day_style(day_date)
         
-        # Получаем задачи из кеша
-        tasks = self.get_cached_tasks_for_date(day_date)
-        
-        # Формируем текст
-        if tasks:
-            task_count = len(tasks)
-            completed_count = sum(1 for t in tasks if t.is_completed)
-            text = f"{day_date.day}\n({completed_count}/{task_count})"
-            font = ('Arial', 8)
-        else:
-            text = str(day_date.day)
-            font = style.get('font', ('Arial', 10))
+        # Формируем текст по сводке дня
+        text = self.get_day_text(day_date)
         
         # Применяем стиль
         btn.config(text=text, **style)
@@ -342,14 +426,7 @@ class CalendarWindow(SmartUpdateMixin):
         
         # Получаем новое состояние
         style = self.get_day_style(day_date)
-        tasks = self.get_cached_tasks_for_date(day_date)
-        
-        if tasks:
-            task_count = len(tasks)
-            completed_count = sum(1 for t in tasks if t.is_completed)
-            new_text = f"{day_date.day}\n({completed_count}/{task_count})"
-        else:
-            new_text = str(day_date.day)
+        new_text = self.get_day_text(day_date)
         
         new_bg = style.get('bg')
         new_fg = style.get('fg')
@@ -359,21 +436,34 @@ class CalendarWindow(SmartUpdateMixin):
         if (new_text, new_bg, new_fg) != old_state:
             self.update_day_button(day_date)
 
-    def get_cached_tasks_for_date(self, target_date: date) -> List[Task]:
-        """Получение задач из кеша"""
-        # Сначала проверяем кеш дня
-        if target_date in self.day_tasks_cache:
-            return self.day_tasks_cache[target_date]
-        
-        # Затем кеш месяца
+    def get_day_summary(self, target_date: date) -> Tuple[int, int, int]:
+        """Сводка дня из кеша месяца: (всего, выполнено, длительность)"""
         month_key = (target_date.year, target_date.month)
-        if month_key in self.month_tasks_cache:
-            tasks = self.month_tasks_cache[month_key].get(target_date, [])
+        month_summaries = self.month_summaries_cache.get(month_key, {})
+        return month_summaries.get(target_date, (0, 0, 0))
+
+    def get_day_text(self, day_date: date) -> str:
+        """Текст кнопки дня"""
+        total, completed, _ = self.get_day_summary(day_date)
+        if total:
+            return f"{day_date.day}\n({completed}/{total})"
+        return str(day_date.day)
+
+    def load_day_tasks(self, target_date: date):
+        """Фоновая загрузка полных задач дня (только для выбранного дня)"""
+        def on_loaded(tasks: List[Task]):
+            if not self.window.winfo_exists():
+                return
+            
             self.day_tasks_cache[target_date] = tasks
-            return tasks
+            if target_date == self.selected_date:
+                self.refresh_tasks_list()
         
-        # Если нет в кеше - пустой список (не делаем запрос к БД)
-        return []
+        if self.task_manager:
+            # Через репозиторий - те же экземпляры задач, что и в главном окне
+            self.task_manager.task_service.repository.load_async(target_date.isoformat(), on_loaded)
+        else:
+            self._read('get_tasks', target_date.isoformat(), include_backlog=False, callback=on_loaded)
 
     def get_day_style(self, day_date: date) -> dict:
         """Получение стиля для дня"""
@@ -429,11 +519,14 @@ class CalendarWindow(SmartUpdateMixin):
     def refresh_tasks_list(self):
         """Обновление списка задач для выбранной даты"""
         # Очистка
-        for item in self.tasks_tree.get_children():
-            self.tasks_tree.delete(item)
+        self.tasks_tree.delete(*self.tasks_tree.get_children())
 
-        # Получаем задачи из кеша
-        tasks = self.get_cached_tasks_for_date(self.selected_date)
+        # Загружаем задачи только выбранного дня
+        if self.selected_date not in self.day_tasks_cache:
+            self.load_day_tasks(self.selected_date)
+            return
+        
+        tasks = self.day_tasks_cache[self.selected_date]
 
         for task in tasks:
             status = "Выполнено" if task.is_completed else "В работе"
@@ -452,21 +545,14 @@ class CalendarWindow(SmartUpdateMixin):
 
     def refresh_current_month(self):
         """Обновление текущего месяца"""
-        # Очищаем кеш месяца
-        month_key = (self.current_date.year, self.current_date.month)
-        if month_key in self.month_tasks_cache:
-            del self.month_tasks_cache[month_key]
-        
-        # Перезагружаем задачи
-        self.load_month_tasks(self.current_date.year, self.current_date.month)
+        # Очищаем кеши месяца
+        year, month = self.current_date.year, self.current_date.month
+        self.month_summaries_cache.pop((year, month), None)
+        for day_date in [d for d in self.day_tasks_cache if (d.year, d.month) == (year, month)]:
+            del self.day_tasks_cache[day_date]
         
-        # Обновляем только видимые кнопки
-        cal = calendar.monthcalendar(self.current_date.year, self.current_date.month)
-        for week in cal:
-            for day in week:
-                if day > 0:
-                    day_date = date(self.current_date.year, self.current_date.month, day)
-                    self.update_day_button_if_changed(day_date)
+        # Перезагружаем сводку (видимые кнопки обновятся по готовности)
+        self.load_month_summaries(year, month)
         
         # Обновляем список задач для текущей даты
         self.refresh_tasks_list()
@@ -492,14 +578,17 @@ class CalendarWindow(SmartUpdateMixin):
     def _refresh_single_day(self, day_date: date):
         """Обновление одного дня после изменения"""
         # Удаляем из кеша
-        if day_date in self.day_tasks_cache:
-            del self.day_tasks_cache[day_date]
+        self.day_tasks_cache.pop(day_date, None)
         
-        # Получаем новые задачи
-        try:
-            date_str = day_date.isoformat()
-            tasks = self.db.get_tasks(date_str, include_backlog=False)
-            self.day_tasks_cache[day_date] = tasks
+        date_str = day_date.isoformat()
+        
+        def on_loaded(summaries: Dict[str, Tuple[int, int, int]]):
+            if not self.window.winfo_exists():
+                return
+            
+            month_key = (day_date.year, day_date.month)
+            if month_key in self.month_summaries_cache:
+                self.month_summaries_cache[month_key][day_date] = summaries.get(date_str, (0, 0, 0))
             
             # Обновляем кнопку
             self.update_day_button_if_changed(day_date)
@@ -507,8 +596,9 @@ class CalendarWindow(SmartUpdateMixin):
             # Если это выбранная дата - обновляем список
             if day_date == self.selected_date:
                 self.refresh_tasks_list()
-        except Exception as e:
-            logger.error(f"Error refreshing day {day_date}: {e}")
+        
+        # Новая сводка дня читается после записи задачи
+        self._read('get_day_summaries', date_str, date_str, callback=on_loaded)
 
     def on_task_double_click(self, event):
         """Двойной клик по задаче"""
@@ -525,7 +615,7 @@ class CalendarWindow(SmartUpdateMixin):
         clean_title = task_title.replace("📅 ", "").replace("✓ ", "")
 
         # Находим задачу
-        tasks = self.get_cached_tasks_for_date(self.selected_date)
+        tasks = self.day_tasks_cache.get(self.selected_date, [])
         for task in tasks:
             if task.title == clean_title:
                 if self.task_manager:
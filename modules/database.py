@@ -3,21 +3,132 @@
 Task Manager - Менеджер базы данных
 """
 
+import re
 import sqlite3
-from typing import List
-from .task_models import Task, TaskType
+import threading
+import logging
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from .task_models import Task, TaskType, TASK_COLUMNS, TASK_TRACKED_FIELDS, tasks_from_rows
+
+logger = logging.getLogger(__name__)
+
+
+def _py_lower(value):
+    """lower() с Unicode для SQL (py_lower): SQLite приводит к нижнему регистру только ASCII"""
+    return value.lower() if isinstance(value, str) else value
 
 
 class DatabaseManager:
     """Менеджер базы данных"""
 
+    # Настройки соединения (применяются к каждому новому соединению)
+    CONNECTION_PRAGMAS = (
+        ('journal_mode', 'WAL'),      # Читатели не блокируют писателя
+        ('synchronous', 'NORMAL'),    # В режиме WAL fsync только на checkpoint
+        ('cache_size', -16000),       # ~16 МБ страничного кеша
+        ('mmap_size', 134217728),     # 128 МБ memory-mapped I/O
+        ('temp_store', 'MEMORY'),
+    )
+
+    # Явный список колонок: после ALTER TABLE has_duration стоит в конце таблицы
+    SELECT_TASKS_SQL = f"SELECT {', '.join(TASK_COLUMNS)} FROM tasks"
+
+    INSERT_TASK_SQL = '''
+        INSERT INTO tasks (title, content, importance, duration, has_duration, priority,
+                           task_type_id, is_completed, quadrant, date_created,
+                           date_scheduled, is_recurring, recurrence_pattern, move_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
+    UPDATE_TASK_SQL = '''
+        UPDATE tasks SET title=?, content=?, importance=?, duration=?, has_duration=?,
+                         priority=?, task_type_id=?, is_completed=?,
+                         quadrant=?, date_scheduled=?, is_recurring=?,
+                         recurrence_pattern=?, move_count=?
+        WHERE id=?
+    '''
+
     def __init__(self, db_path: str = "tasks.db"):
         self.db_path = db_path
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._closed = False
+        self._has_fts: Optional[bool] = None
         self.init_database()
 
+    def _get_connection(self) -> sqlite3.Connection:
+        """Долгоживущее соединение текущего потока"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            return conn
+
+        if self._closed:
+            raise sqlite3.ProgrammingError("DatabaseManager is closed")
+
+        # Соединение используется только своим потоком, но закрывается из close()
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        for pragma, value in self.CONNECTION_PRAGMAS:
+            conn.execute(f'PRAGMA {pragma}={value}')
+        # lower() SQLite меняет регистр только у ASCII - для кириллицы нужен Python
+        conn.create_function('py_lower', 1, _py_lower, deterministic=True)
+
+        self._local.conn = conn
+        with self._connections_lock:
+            self._connections.append(conn)
+        logger.debug("Opened SQLite connection for thread %s", threading.current_thread().name)
+        return conn
+
+    def close(self):
+        """Закрытие всех соединений (вызывается при завершении приложения)"""
+        with self._connections_lock:
+            connections = self._connections
+            self._connections = []
+            self._closed = True
+
+        for conn in connections:
+            try:
+                conn.execute('PRAGMA optimize')
+                conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"Error closing database connection: {e}")
+        self._local = threading.local()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Транзакция на соединении текущего потока (один commit на весь блок).
+
+        Вложенные блоки становятся точками сохранения внешней транзакции:
+        ошибка внутри откатывает только вложенный блок.
+        """
+        conn = self._get_connection()
+        depth = getattr(self._local, 'tx_depth', 0)
+        savepoint = f'sp_{depth}'
+
+        # IMMEDIATE сразу берет блокировку записи - без SQLITE_BUSY на середине блока
+        conn.execute('BEGIN IMMEDIATE' if depth == 0 else f'SAVEPOINT {savepoint}')
+        self._local.tx_depth = depth + 1
+        try:
+            yield conn
+        except BaseException:
+            if depth == 0:
+                conn.rollback()
+            else:
+                conn.execute(f'ROLLBACK TO {savepoint}')
+                conn.execute(f'RELEASE {savepoint}')
+            raise
+        else:
+            if depth == 0:
+                conn.commit()
+            else:
+                conn.execute(f'RELEASE {savepoint}')
+        finally:
+            self._local.tx_depth = depth
+
     def init_database(self):
         """Инициализация базы данных"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
 
         # Таблица типов задач
@@ -52,13 +163,6 @@ class DatabaseManager:
             )
         ''')
 
-        # Добавляем колонку has_duration если её нет
-        try:
-            cursor.execute('ALTER TABLE tasks ADD COLUMN has_duration BOOLEAN DEFAULT FALSE')
-            conn.commit()
-        except sqlite3.OperationalError:
-            pass  # Колонка уже существует
-
         # Таблица настроек
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS settings (
@@ -82,145 +186,443 @@ class DatabaseManager:
             )
 
         conn.commit()
-        conn.close()
+
+        # Приводим схему к актуальной версии
+        self.migrate()
+
+    def get_migrations(self) -> List[Tuple[int, str, Callable[[sqlite3.Cursor], None]]]:
+        """Упорядоченный список миграций схемы: (версия, описание, шаг)"""
+        return [
+            (1, "add tasks.has_duration", self._migrate_add_has_duration),
+            (2, "secondary indexes on tasks", self._migrate_add_task_indexes),
+            (3, "daily_rollup table and triggers", self._migrate_add_daily_rollup),
+            (4, "tasks_fts full-text index", self._migrate_add_tasks_fts),
+        ]
+
+    def get_schema_version(self) -> int:
+        """Текущая версия схемы (PRAGMA user_version)"""
+        conn = self._get_connection()
+        return conn.execute('PRAGMA user_version').fetchone()[0]
+
+    def migrate(self):
+        """Применение недостающих миграций по порядку, каждая в своей транзакции"""
+        conn = self._get_connection()
+        current_version = self.get_schema_version()
+        applied = False
+
+        for version, description, step in self.get_migrations():
+            if version <= current_version:
+                continue
+
+            logger.info("Applying schema migration %d: %s", version, description)
+            cursor = conn.cursor()
+            try:
+                # DDL не открывает транзакцию неявно - начинаем явно
+                cursor.execute('BEGIN')
+                step(cursor)
+                cursor.execute(f'PRAGMA user_version = {version}')
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+                logger.exception("Schema migration %d failed", version)
+                raise
+            applied = True
+
+        if applied:
+            # Обновляем статистику планировщика под новые индексы
+            conn.execute('ANALYZE')
+            conn.commit()
+
+    def _migrate_add_has_duration(self, cursor: sqlite3.Cursor):
+        """Миграция 1: колонка has_duration для старых баз"""
+        cursor.execute('PRAGMA table_info(tasks)')
+        columns = {row[1] for row in cursor.fetchall()}
+        if 'has_duration' not in columns:
+            cursor.execute('ALTER TABLE tasks ADD COLUMN has_duration BOOLEAN DEFAULT FALSE')
+
+    def _migrate_add_task_indexes(self, cursor: sqlite3.Cursor):
+        """Миграция 2: индексы под горячие запросы"""
+        # Бэклог хранится как пустая строка - убираем NULL
+        cursor.execute("UPDATE tasks SET date_scheduled = '' WHERE date_scheduled IS NULL")
+
+        # Задачи дня по квадрантам (get_tasks(date), диапазоны календаря)
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_tasks_date_quadrant
+            ON tasks (date_scheduled, quadrant)
+        ''')
+
+        # Покрывающий индекс для дневных сводок
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_tasks_day_stats
+            ON tasks (date_scheduled, is_completed, has_duration, duration, importance)
+        ''')
+
+        # Частичный индекс только по строкам бэклога
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tasks_backlog
+            ON tasks (task_type_id, priority)
+            WHERE date_scheduled = ''
+        """)
+
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_tasks_type
+            ON tasks (task_type_id)
+        ''')
+
+    def _migrate_add_daily_rollup(self, cursor: sqlite3.Cursor):
+        """Миграция 3: материализованная статистика по дням, поддерживаемая триггерами"""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS daily_rollup (
+                date TEXT PRIMARY KEY,
+                total INTEGER NOT NULL DEFAULT 0,
+                completed INTEGER NOT NULL DEFAULT 0,
+                completed_importance INTEGER NOT NULL DEFAULT 0,
+                total_duration INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID
+        ''')
+
+        # Вклад строки задачи в статистику дня
+        add_new = '''
+            INSERT INTO daily_rollup (date, total, completed, completed_importance, total_duration)
+            SELECT NEW.date_scheduled, 1,
+                   CASE WHEN NEW.is_completed THEN 1 ELSE 0 END,
+                   CASE WHEN NEW.is_completed THEN NEW.importance ELSE 0 END,
+                   CASE WHEN NEW.has_duration THEN NEW.duration ELSE 0 END
+            WHERE NEW.date_scheduled <> ''
+            ON CONFLICT (date) DO UPDATE SET
+                total = total + excluded.total,
+                completed = completed + excluded.completed,
+                completed_importance = completed_importance + excluded.completed_importance,
+                total_duration = total_duration + excluded.total_duration;
+        '''
+        remove_old = '''
+            UPDATE daily_rollup SET
+                total = total - 1,
+                completed = completed - (CASE WHEN OLD.is_completed THEN 1 ELSE 0 END),
+                completed_importance = completed_importance
+                    - (CASE WHEN OLD.is_completed THEN OLD.importance ELSE 0 END),
+                total_duration = total_duration - (CASE WHEN OLD.has_duration THEN OLD.duration ELSE 0 END)
+            WHERE date = OLD.date_scheduled;
+            DELETE FROM daily_rollup WHERE date = OLD.date_scheduled AND total <= 0;
+        '''
+
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_rollup_insert AFTER INSERT ON tasks
+            BEGIN {add_new} END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_rollup_delete AFTER DELETE ON tasks
+            BEGIN {remove_old} END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_rollup_update
+            AFTER UPDATE OF date_scheduled, is_completed, importance, has_duration, duration ON tasks
+            BEGIN {remove_old} {add_new} END
+        ''')
+
+        self._fill_daily_rollup(cursor)
+
+    def _migrate_add_tasks_fts(self, cursor: sqlite3.Cursor):
+        """Миграция 4: полнотекстовый индекс FTS5 по title/content, зеркалируемый триггерами"""
+        try:
+            # external content: текст хранится только в tasks, в индексе - токены
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+                    title, content,
+                    content='tasks', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2',
+                    prefix='2 3'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            # SQLite без FTS5 - поиск работает через LIKE
+            logger.warning("FTS5 is not available, search falls back to LIKE: %s", e)
+            return
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_fts_insert AFTER INSERT ON tasks BEGIN
+                INSERT INTO tasks_fts (rowid, title, content) VALUES (NEW.id, NEW.title, NEW.content);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_fts_delete AFTER DELETE ON tasks BEGIN
+                INSERT INTO tasks_fts (tasks_fts, rowid, title, content)
+                VALUES ('delete', OLD.id, OLD.title, OLD.content);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_fts_update AFTER UPDATE OF title, content ON tasks BEGIN
+                INSERT INTO tasks_fts (tasks_fts, rowid, title, content)
+                VALUES ('delete', OLD.id, OLD.title, OLD.content);
+                INSERT INTO tasks_fts (rowid, title, content) VALUES (NEW.id, NEW.title, NEW.content);
+            END
+        ''')
+
+        cursor.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
 
     def get_tasks(self, date: str = None, include_backlog: bool = False) -> List[Task]:
         """Получить задачи за определенную дату"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
 
         if date and not include_backlog:
             # Только задачи для конкретной даты
-            cursor.execute('SELECT * FROM tasks WHERE date_scheduled = ?', (date,))
+            cursor.execute(f'{self.SELECT_TASKS_SQL} WHERE date_scheduled = ?', (date,))
         elif include_backlog and not date:
-            # Только задачи из бэклога (без даты)
-            cursor.execute('SELECT * FROM tasks WHERE date_scheduled = "" OR date_scheduled IS NULL')
+            # Только задачи из бэклога (без даты, NULL убран миграцией 2)
+            cursor.execute(f"{self.SELECT_TASKS_SQL} WHERE date_scheduled = ''")
         elif date and include_backlog:
             # Задачи для даты + бэклог
             cursor.execute(
-                'SELECT * FROM tasks WHERE date_scheduled = ? OR date_scheduled = "" OR date_scheduled IS NULL',
+                f"{self.SELECT_TASKS_SQL} WHERE date_scheduled IN (?, '')",
                 (date,)
             )
         else:
             # Все задачи
-            cursor.execute('SELECT * FROM tasks')
+            cursor.execute(self.SELECT_TASKS_SQL)
 
         rows = cursor.fetchall()
-        conn.close()
-
-        tasks = []
-        for row in rows:
-            # Проверяем наличие поля has_duration
-            if len(row) >= 15:  # Новая структура с has_duration
-                task = Task(
-                    id=row[0], title=row[1], content=row[2], importance=row[3],
-                    duration=row[4], has_duration=bool(row[5]), priority=row[6],
-                    task_type_id=row[7], is_completed=bool(row[8]), quadrant=row[9],
-                    date_created=row[10], date_scheduled=row[11], is_recurring=bool(row[12]),
-                    recurrence_pattern=row[13], move_count=row[14]
-                )
-            else:  # Старая структура без has_duration
-                task = Task(
-                    id=row[0], title=row[1], content=row[2], importance=row[3],
-                    duration=row[4], has_duration=False, priority=row[5],
-                    task_type_id=row[6], is_completed=bool(row[7]), quadrant=row[8],
-                    date_created=row[9], date_scheduled=row[10], is_recurring=bool(row[11]),
-                    recurrence_pattern=row[12], move_count=row[13]
-                )
-            tasks.append(task)
+        return self._rows_to_tasks(rows)
+
+    def get_tasks_between(self, start: str, end: str) -> List[Task]:
+        """Получить задачи в диапазоне дат (ISO, включительно)"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            f'{self.SELECT_TASKS_SQL} WHERE date_scheduled BETWEEN ? AND ? ORDER BY date_scheduled, id',
+            (start, end)
+        )
+        return self._rows_to_tasks(cursor.fetchall())
+
+    # Поиск
+
+    def has_fts(self) -> bool:
+        """Есть ли полнотекстовый индекс tasks_fts"""
+        if self._has_fts is None:
+            conn = self._get_connection()
+            row = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts'"
+            ).fetchone()
+            self._has_fts = row is not None
+        return self._has_fts
+
+    @staticmethod
+    def _search_terms(query: str) -> List[str]:
+        """Слова запроса (операторы FTS5 и кавычки пользователя не интерпретируются)"""
+        return re.findall(r'\w+', query.lower())
+
+    def search_tasks(self, query: str, type_id: Optional[int] = None, limit: int = 100,
+                     backlog_only: bool = False) -> List[Task]:
+        """Поиск задач по title/content: все слова запроса как префиксы,
+        лучшие совпадения первыми (совпадение в названии весит больше)"""
+        terms = self._search_terms(query)
+        if not terms:
+            return []
+
+        conditions = []
+        params: List[object] = []
+        if type_id is not None:
+            conditions.append('t.task_type_id = ?')
+            params.append(type_id)
+        if backlog_only:
+            conditions.append("t.date_scheduled = ''")
+        columns = ', '.join(f't.{column}' for column in TASK_COLUMNS)
+        conn = self._get_connection()
+
+        if self.has_fts():
+            # "слово"* - префиксный поиск; слова через пробел - AND
+            match = ' '.join(f'"{term}"*' for term in terms)
+            where = ''.join(f' AND {condition}' for condition in conditions)
+            cursor = conn.execute(f'''
+                SELECT {columns}
+                FROM tasks_fts JOIN tasks t ON t.id = tasks_fts.rowid
+                WHERE tasks_fts MATCH ?{where}
+                ORDER BY bm25(tasks_fts, 10.0, 1.0)
+                LIMIT ?
+            ''', [match] + params + [limit])
+        else:
+            # Без индекса: LIKE по py_lower() - регистр не важен и для кириллицы
+            for term in terms:
+                conditions.append("(py_lower(t.title) LIKE ? ESCAPE '\\' "
+                                  "OR py_lower(t.content) LIKE ? ESCAPE '\\')")
+                pattern = '%' + re.sub(r'([%_\\])', r'\\\1', term) + '%'
+                params.extend((pattern, pattern))
+            cursor = conn.execute(f'''
+                SELECT {columns} FROM tasks t
+                WHERE {' AND '.join(conditions)}
+                ORDER BY t.priority DESC
+                LIMIT ?
+            ''', params + [limit])
+
+        return self._rows_to_tasks(cursor.fetchall())
+
+    def get_day_summaries(self, start: str, end: str) -> Dict[str, Tuple[int, int, int]]:
+        """Сводка по дням диапазона: дата -> (всего, выполнено, суммарная длительность)"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            'SELECT date, total, completed, total_duration FROM daily_rollup WHERE date BETWEEN ? AND ?',
+            (start, end)
+        )
+        return {row[0]: (row[1], row[2], row[3]) for row in cursor.fetchall()}
 
-        return tasks
+    # Аналитика
+
+    def get_daily_rollup(self, start: str = None, end: str = None) -> List[Tuple[str, int, int, int, int]]:
+        """Материализованная статистика по дням (новые дни первыми):
+        (дата, всего, выполнено, сумма важности выполненных, длительность)"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT date, total, completed, completed_importance, total_duration
+            FROM daily_rollup
+            WHERE date BETWEEN ? AND ?
+            ORDER BY date DESC
+        ''', (start or '0000-00-00', end or '9999-99-99'))
+        return cursor.fetchall()
+
+    def rebuild_daily_rollup(self):
+        """Полный пересчет daily_rollup (триггеры поддерживают его сами)"""
+        with self.transaction() as conn:
+            self._fill_daily_rollup(conn.cursor())
+
+    def _fill_daily_rollup(self, cursor: sqlite3.Cursor):
+        """Заполнение daily_rollup агрегатом по tasks"""
+        cursor.execute('DELETE FROM daily_rollup')
+        cursor.execute('''
+            INSERT INTO daily_rollup (date, total, completed, completed_importance, total_duration)
+            SELECT date_scheduled,
+                   COUNT(*),
+                   SUM(CASE WHEN is_completed THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN is_completed THEN importance ELSE 0 END),
+                   SUM(CASE WHEN has_duration THEN duration ELSE 0 END)
+            FROM tasks
+            WHERE date_scheduled <> ''
+            GROUP BY date_scheduled
+        ''')
+
+    def _rows_to_tasks(self, rows) -> List[Task]:
+        """Преобразование строк SELECT_TASKS_SQL в объекты Task"""
+        return tasks_from_rows(rows)
 
     def save_task(self, task: Task) -> int:
         """Сохранить задачу"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        return self.save_tasks([task])[0]
 
-        if task.id == 0:  # Новая задача
-            cursor.execute('''
-                INSERT INTO tasks (title, content, importance, duration, has_duration, priority,
-                                 task_type_id, is_completed, quadrant, date_created,
-                                 date_scheduled, is_recurring, recurrence_pattern, move_count)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (task.title, task.content, task.importance, task.duration,
-                  task.has_duration, task.priority, task.task_type_id, task.is_completed,
-                  task.quadrant, task.date_created, task.date_scheduled,
-                  task.is_recurring, task.recurrence_pattern, task.move_count))
-            task_id = cursor.lastrowid
-        else:  # Обновление
-            cursor.execute('''
-                UPDATE tasks SET title=?, content=?, importance=?, duration=?, has_duration=?,
-                               priority=?, task_type_id=?, is_completed=?,
-                               quadrant=?, date_scheduled=?, is_recurring=?,
-                               recurrence_pattern=?, move_count=?
-                WHERE id=?
-            ''', (task.title, task.content, task.importance, task.duration,
-                  task.has_duration, task.priority, task.task_type_id, task.is_completed,
-                  task.quadrant, task.date_scheduled, task.is_recurring,
-                  task.recurrence_pattern, task.move_count, task.id))
-            task_id = task.id
+    def save_tasks(self, tasks: Iterable[Task]) -> List[int]:
+        """Сохранить несколько задач одной транзакцией; id в порядке задач"""
+        tasks = list(tasks)
+        task_ids = []
+        updates = []
 
-        conn.commit()
-        conn.close()
-        return task_id
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+
+            for task in tasks:
+                if task.id == 0:  # Новая задача - нужен lastrowid, вставляем по одной
+                    cursor.execute(self.INSERT_TASK_SQL, (
+                        task.title, task.content, task.importance, task.duration,
+                        task.has_duration, task.priority, task.task_type_id, task.is_completed,
+                        task.quadrant, task.date_created, task.date_scheduled,
+                        task.is_recurring, task.recurrence_pattern, task.move_count))
+                    task_ids.append(cursor.lastrowid)
+                else:  # Обновления - одним executemany
+                    updates.append((
+                        task.title, task.content, task.importance, task.duration,
+                        task.has_duration, task.priority, task.task_type_id, task.is_completed,
+                        task.quadrant, task.date_scheduled, task.is_recurring,
+                        task.recurrence_pattern, task.move_count, task.id))
+                    task_ids.append(task.id)
+
+            if updates:
+                cursor.executemany(self.UPDATE_TASK_SQL, updates)
+
+        return task_ids
+
+    def update_task_fields(self, task_id: int, changes: Dict[str, object]) -> bool:
+        """UPDATE только измененных колонок; без изменений запись не выполняется"""
+        return self.update_tasks_fields([(task_id, changes)]) > 0
+
+    def update_tasks_fields(self, updates: Iterable[Tuple[int, Dict[str, object]]]) -> int:
+        """Минимальные UPDATE для нескольких задач одной транзакцией.
+
+        Задачи с одинаковым набором измененных колонок пишутся одним
+        executemany. Возвращает количество обновленных задач.
+        """
+        groups: Dict[Tuple[str, ...], List[tuple]] = {}
+        for task_id, changes in updates:
+            if not changes:
+                continue
+            unknown = set(changes) - TASK_TRACKED_FIELDS
+            if unknown:
+                raise ValueError(f"Unknown task columns: {sorted(unknown)}")
+            columns = tuple(sorted(changes))
+            groups.setdefault(columns, []).append(
+                tuple(changes[column] for column in columns) + (task_id,))
+
+        if not groups:
+            return 0
+
+        with self.transaction() as conn:
+            for columns, rows in groups.items():
+                # Имена колонок только из TASK_TRACKED_FIELDS
+                assignments = ', '.join(f'{column}=?' for column in columns)
+                conn.executemany(f'UPDATE tasks SET {assignments} WHERE id=?', rows)
+
+        return sum(len(rows) for rows in groups.values())
 
     def delete_task(self, task_id: int):
         """Удалить задачу"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM tasks WHERE id=?', (task_id,))
-        conn.commit()
-        conn.close()
+        self.delete_tasks([task_id])
+
+    def delete_tasks(self, task_ids: Iterable[int]):
+        """Удалить несколько задач одной транзакцией"""
+        with self.transaction() as conn:
+            conn.executemany('DELETE FROM tasks WHERE id=?', [(task_id,) for task_id in task_ids])
 
     def get_task_types(self) -> List[TaskType]:
         """Получить типы задач"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
-        cursor.execute('SELECT * FROM task_types')
+        cursor.execute('SELECT id, name, color, description FROM task_types')
         rows = cursor.fetchall()
-        conn.close()
 
         return [TaskType(id=row[0], name=row[1], color=row[2], description=row[3])
                 for row in rows]
 
     def save_task_type(self, task_type: TaskType) -> int:
         """Сохранить тип задачи"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self.transaction() as conn:
+            cursor = conn.cursor()
 
-        if task_type.id == 0:  # Новый тип
-            cursor.execute(
-                'INSERT INTO task_types (name, color, description) VALUES (?, ?, ?)',
-                (task_type.name, task_type.color, task_type.description)
-            )
-            type_id = cursor.lastrowid
-        else:  # Обновление
-            cursor.execute(
-                'UPDATE task_types SET name=?, color=?, description=? WHERE id=?',
-                (task_type.name, task_type.color, task_type.description, task_type.id)
-            )
-            type_id = task_type.id
+            if task_type.id == 0:  # Новый тип
+                cursor.execute(
+                    'INSERT INTO task_types (name, color, description) VALUES (?, ?, ?)',
+                    (task_type.name, task_type.color, task_type.description)
+                )
+                type_id = cursor.lastrowid
+            else:  # Обновление
+                cursor.execute(
+                    'UPDATE task_types SET name=?, color=?, description=? WHERE id=?',
+                    (task_type.name, task_type.color, task_type.description, task_type.id)
+                )
+                type_id = task_type.id
 
-        conn.commit()
-        conn.close()
         return type_id
 
     def save_setting(self, key: str, value: str):
         """Сохранить настройку"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            'INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)',
-            (key, value)
-        )
-        conn.commit()
-        conn.close()
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                'INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)',
+                (key, value)
+            )
 
     def get_setting(self, key: str, default: str = "") -> str:
         """Получить настройку"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         cursor.execute('SELECT value FROM settings WHERE key=?', (key,))
         result = cursor.fetchone()
-        conn.close()
         return result[0] if result else default
\ No newline at end of file
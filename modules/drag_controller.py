@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Task Manager - Общий контроллер перетаскивания задач
+"""
+
+import tkinter as tk
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+
+from .task_models import Task
+from .colors import get_priority_color
+from .scheduler import call_later, cancel_call
+
+logger = logging.getLogger(__name__)
+
+Rect = Tuple[int, int, int, int]
+
+
+class DropTarget:
+    """Цель перетаскивания: виджет и действие при отпускании задачи над ним"""
+
+    __slots__ = ('widget', 'on_drop', 'accepts', 'on_enter', 'on_leave')
+
+    def __init__(self, widget: tk.Misc, on_drop: Callable[[Task], None],
+                 accepts: Optional[Callable[[Task], bool]] = None,
+                 on_enter: Optional[Callable[[], None]] = None,
+                 on_leave: Optional[Callable[[], None]] = None):
+        self.widget = widget
+        self.on_drop = on_drop
+        self.accepts = accepts
+        self.on_enter = on_enter
+        self.on_leave = on_leave
+
+
+class DragController:
+    """Перетаскивание задач для всех окон приложения.
+
+    Прямоугольники целей снимаются один раз в начале перетаскивания и
+    раскладываются по ячейкам сетки - поиск цели под курсором не зависит
+    от числа целей и не обращается к Tk. Движение мыши только запоминает
+    позицию: призрак двигается и подсветка меняется не чаще раза за кадр.
+    Окно-призрак одно на приложение и между перетаскиваниями скрыто.
+    """
+
+    FRAME_MS = 16  # ~60 кадров в секунду
+    DRAG_THRESHOLD = 4  # Смещение (px), после которого нажатие становится перетаскиванием
+    CELL_SIZE = 64  # Размер ячейки сетки поиска целей (px)
+    GHOST_OFFSET = (20, 10)
+
+    def __init__(self, root: tk.Misc):
+        self.root = root
+        self._targets: Dict[DropTarget, None] = {}  # В порядке регистрации
+
+        self._task: Optional[Task] = None
+        self._start: Tuple[int, int] = (0, 0)
+        self._pointer: Tuple[int, int] = (0, 0)
+        self._dragging = False
+        self._frame_job = None
+
+        # Снимок целей на время перетаскивания: ячейка -> [(rect, цель)], верхние первыми;
+        # цель None - окно, закрывающее цели под собой
+        self._cells: Dict[Tuple[int, int], List[Tuple[Rect, Optional[DropTarget]]]] = {}
+        self._hover: Optional[DropTarget] = None
+
+        self._ghost: Optional[tk.Toplevel] = None
+        self._ghost_label: Optional[tk.Label] = None
+
+    # Цели
+
+    def add_target(self, widget: tk.Misc, on_drop: Callable[[Task], None],
+                   accepts: Optional[Callable[[Task], bool]] = None,
+                   on_enter: Optional[Callable[[], None]] = None,
+                   on_leave: Optional[Callable[[], None]] = None) -> DropTarget:
+        """Регистрация цели; цель удаляется вместе с виджетом (<Destroy>)"""
+        target = DropTarget(widget, on_drop, accepts, on_enter, on_leave)
+        self._targets[target] = None
+
+        widget_path = str(widget)
+
+        def on_destroy(event):
+            # У окна (Toplevel) <Destroy> приходит и от каждого дочернего виджета
+            if str(event.widget) == widget_path:
+                self.remove_target(target)
+
+        widget.bind('<Destroy>', on_destroy, add='+')
+        return target
+
+    def remove_target(self, target: DropTarget):
+        self._targets.pop(target, None)
+
+    # Нажатие, движение, отпускание
+
+    def press(self, event, task: Optional[Task]):
+        """Нажатие на задачу: перетаскивание начнется после DRAG_THRESHOLD"""
+        self._task = task
+        self._start = self._pointer = (event.x_root, event.y_root)
+        self._dragging = False
+
+    def motion(self, event):
+        """Движение с нажатой кнопкой: только запоминание позиции до ближайшего кадра"""
+        if self._task is None:
+            return
+        self._pointer = (event.x_root, event.y_root)
+
+        if not self._dragging:
+            dx = self._pointer[0] - self._start[0]
+            dy = self._pointer[1] - self._start[1]
+            if max(abs(dx), abs(dy)) < self.DRAG_THRESHOLD:
+                return
+            self._begin()
+
+        if self._frame_job is None:
+            self._frame_job = call_later(self.root, self.FRAME_MS, self._on_frame)
+
+    def release(self, event) -> bool:
+        """Отпускание: задача передается цели под курсором; True - задача брошена на цель"""
+        task, dragging = self._task, self._dragging
+        self._task = None
+        self._dragging = False
+        if not dragging:
+            return False
+
+        self._cancel_frame()
+        target = self._target_at(event.x_root, event.y_root, task)
+        self._set_hover(None)
+        self._ghost.withdraw()
+        self._cells = {}
+
+        if target is None:
+            return False
+        try:
+            target.on_drop(task)
+        except Exception:
+            logger.exception("Error dropping task %s", task.id)
+        return True
+
+    @property
+    def dragging(self) -> bool:
+        return self._dragging
+
+    # Перетаскивание
+
+    def _begin(self):
+        self._dragging = True
+        self._snapshot_targets()
+        self._show_ghost(self._task)
+
+    def _snapshot_targets(self):
+        """Прямоугольники видимых целей по ячейкам; верхнее окно - раньше в списке ячейки"""
+        tk_app = self.root.tk
+        stack = {name: level for level, name in
+                 enumerate(tk_app.splitlist(tk_app.call('wm', 'stackorder', str(self.root))))}
+
+        alive = []
+        visible = []
+        for name, level in stack.items():
+            window = self.root.nametowidget(name)
+            x, y = window.winfo_rootx(), window.winfo_rooty()
+            visible.append(((level, -1), (x, y, x + window.winfo_width(), y + window.winfo_height()), None))
+
+        for order, target in enumerate(self._targets):
+            widget = target.widget
+            if not widget.winfo_exists():
+                continue
+            alive.append(target)
+
+            level = stack.get(str(widget.winfo_toplevel()))
+            if level is None or not widget.winfo_viewable():
+                continue
+            x, y = widget.winfo_rootx(), widget.winfo_rooty()
+            rect = (x, y, x + widget.winfo_width(), y + widget.winfo_height())
+            visible.append(((level, order), rect, target))
+        self._targets = dict.fromkeys(alive)
+
+        # Поверх - окна выше в стеке, в окне - зарегистрированные позже (вложенные цели),
+        # последней - само окно
+        visible.sort(key=lambda item: item[0], reverse=True)
+        cells: Dict[Tuple[int, int], List[Tuple[Rect, Optional[DropTarget]]]] = {}
+        size = self.CELL_SIZE
+        for _, rect, target in visible:
+            x0, y0, x1, y1 = rect
+            for cx in range(x0 // size, (x1 - 1) // size + 1):
+                for cy in range(y0 // size, (y1 - 1) // size + 1):
+                    cells.setdefault((cx, cy), []).append((rect, target))
+        self._cells = cells
+
+    def _target_at(self, x: int, y: int, task: Task) -> Optional[DropTarget]:
+        size = self.CELL_SIZE
+        for (x0, y0, x1, y1), target in self._cells.get((x // size, y // size), ()):
+            if x0 <= x < x1 and y0 <= y < y1:
+                if target is not None and (target.accepts is None or target.accepts(task)):
+                    return target
+                return None  # Верхняя цель или окно закрывает нижние
+        return None
+
+    def _on_frame(self):
+        """Кадр: призрак - в последнюю позицию, подсветка цели под курсором"""
+        self._frame_job = None
+        if not self._dragging:
+            return
+        x, y = self._pointer
+        self._ghost.geometry(f"+{x - self.GHOST_OFFSET[0]}+{y - self.GHOST_OFFSET[1]}")
+        self._set_hover(self._target_at(x, y, self._task))
+
+    def _set_hover(self, target: Optional[DropTarget]):
+        if target is self._hover:
+            return
+        previous, self._hover = self._hover, target
+        if previous is not None and previous.on_leave is not None and previous.widget.winfo_exists():
+            previous.on_leave()
+        if target is not None and target.on_enter is not None:
+            target.on_enter()
+
+    # Призрак
+
+    def _show_ghost(self, task: Task):
+        """Одно окно-призрак на приложение: при повторных перетаскиваниях меняется только текст"""
+        if self._ghost is None or not self._ghost.winfo_exists():
+            self._ghost = tk.Toplevel(self.root)
+            self._ghost.withdraw()
+            self._ghost.overrideredirect(True)
+            try:
+                self._ghost.attributes("-alpha", 0.8)
+            except tk.TclError:
+                pass  # Прозрачность поддерживается не везде
+            self._ghost_label = tk.Label(self._ghost, fg='white', font=('Arial', 9, 'bold'),
+                                         padx=10, pady=5)
+            self._ghost_label.pack()
+
+        title = task.title[:20] + "..." if len(task.title) > 20 else task.title
+        self._ghost_label.config(text=title, bg=get_priority_color(task.priority))
+        x, y = self._pointer
+        self._ghost.geometry(f"+{x - self.GHOST_OFFSET[0]}+{y - self.GHOST_OFFSET[1]}")
+        self._ghost.deiconify()
+        self._ghost.lift()
+
+    def _cancel_frame(self):
+        job, self._frame_job = self._frame_job, None
+        cancel_call(self.root, job)
+
+    def close(self):
+        """Остановка (при завершении приложения)"""
+        self._cancel_frame()
+        self._targets.clear()
+        self._cells = {}
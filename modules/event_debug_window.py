@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Task Manager - Окно профилирования событий
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from .event_manager import EventManager
+from .scheduler import call_later, cancel_call
+
+
+class EventDebugWindow:
+    """Окно с замерами доставки событий по обработчикам"""
+
+    REFRESH_MS = 1000
+
+    def __init__(self, parent, event_manager: EventManager):
+        self.events = event_manager
+        self._refresh_id = None
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Профилирование событий")
+        self.window.geometry("900x450")
+
+        self.setup_ui()
+        self.window.bind('<Destroy>', self.on_destroy, add='+')
+        self.refresh()
+
+    def setup_ui(self):
+        """Создание интерфейса"""
+        top_frame = ttk.Frame(self.window)
+        top_frame.pack(fill='x', padx=10, pady=5)
+
+        self.profiling_var = tk.BooleanVar(value=self.events.profiling)
+        ttk.Checkbutton(top_frame, text="Замерять", variable=self.profiling_var,
+                        command=self.toggle_profiling).pack(side='left')
+        ttk.Button(top_frame, text="Сбросить", command=self.reset).pack(side='left', padx=(10, 0))
+
+        self.summary_label = ttk.Label(top_frame, text="")
+        self.summary_label.pack(side='right')
+
+        columns = ('event', 'count', 'total', 'p50', 'p95', 'p99', 'max')
+        self.tree = ttk.Treeview(self.window, columns=columns, show='tree headings')
+        self.tree.heading('#0', text='Обработчик')
+        self.tree.heading('event', text='Событие')
+        self.tree.heading('count', text='Вызовов')
+        self.tree.heading('total', text='Всего, мс')
+        self.tree.heading('p50', text='p50')
+        self.tree.heading('p95', text='p95')
+        self.tree.heading('p99', text='p99')
+        self.tree.heading('max', text='max')
+
+        self.tree.column('#0', width=280)
+        self.tree.column('event', width=140)
+        for column in columns[1:]:
+            self.tree.column(column, width=70, anchor='e')
+
+        # Обработчики дольше кадра
+        self.tree.tag_configure('slow', foreground='#D32F2F')
+        self.tree.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+
+    def toggle_profiling(self):
+        """Включение/выключение замеров"""
+        self.events.enable_profiling(self.profiling_var.get())
+        self.refresh()
+
+    def reset(self):
+        """Сброс замеров"""
+        self.events.reset_profile()
+        self.refresh()
+
+    def refresh(self):
+        """Обновление таблицы (раз в секунду, пока окно открыто)"""
+        self._refresh_id = None
+        profile = self.events.get_profile()
+        delivery = self.events.get_delivery_stats()
+
+        self.summary_label.config(
+            text=f"Очередь: {profile['queue_depth']} (макс. {profile['max_queue_depth']}) | "
+                 f"Повторных входов: {profile['reentrant_emits']} | "
+                 f"Из потоков: {delivery['count']}, p95 {delivery['p95_ms']:.1f} мс"
+        )
+
+        self.tree.delete(*self.tree.get_children())
+
+        # Самые дорогие обработчики сверху
+        callbacks = sorted(profile['callbacks'].items(), key=lambda item: item[1]['total_ms'], reverse=True)
+        for (event_name, callback_name), stats in callbacks:
+            tags = ('slow',) if stats['max_ms'] > self.events.SLOW_HANDLER_MS else ()
+            self.tree.insert('', 'end', text=callback_name, tags=tags, values=(
+                event_name, stats['count'], f"{stats['total_ms']:.1f}",
+                f"{stats['p50_ms']:.2f}", f"{stats['p95_ms']:.2f}",
+                f"{stats['p99_ms']:.2f}", f"{stats['max_ms']:.1f}",
+            ))
+
+        self._refresh_id = call_later(self.window, self.REFRESH_MS, self.refresh, visual=True)
+
+    def on_destroy(self, event):
+        """Остановка обновления при закрытии окна"""
+        if event.widget is self.window and self._refresh_id is not None:
+            cancel_call(self.window, self._refresh_id)
+            self._refresh_id = None
@@ -3,10 +3,20 @@
 Task Manager - Менеджер событий (паттерн Observer)
 """
 
-from typing import Dict, List, Callable, Any
+import inspect
+import queue
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Callable, Any, Deque, Hashable, Optional, Set, Tuple
 from enum import Enum, auto
 import logging
 
+from .scheduler import call_later, cancel_call
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,44 +41,463 @@ class EventType(Enum):
     REFRESH_REQUIRED = auto()
     SELECTION_CHANGED = auto()
 
+    # Итог пакета операций (data - EventBatch)
+    BATCH_COMPLETED = auto()
+
 
 class Event:
     """Класс события"""
-    def __init__(self, event_type: EventType, data: Any = None, source: Any = None):
+    def __init__(self, event_type: EventType, data: Any = None, source: Any = None,
+                 dates: Optional[Iterable[str]] = None):
         self.type = event_type
         self.data = data
         self.source = source
-        
+        # Затронутые даты ('' - бэклог) и задачи - по ним отбираются подписчики с where.
+        # dates=None - даты определяются по данным события (None - неизвестны)
+        self.dates: Optional[FrozenSet[str]] = frozenset(dates) if dates is not None else _event_dates(data)
+        self.task_ids: FrozenSet[int] = _event_task_ids(data)
+
     def __repr__(self):
         return f"Event({self.type.name}, data={self.data})"
 
 
+@dataclass
+class EventBatch:
+    """Итог пакета: id затронутых задач по видам изменений и сами события.
+
+    Новые задачи, id которых еще не назначен, ждут в unresolved и попадают
+    в множества id при resolve() - после записи пакета в БД.
+    held=True - BATCH_COMPLETED отправит владелец пакета, а не выход из batch().
+    """
+    created: Set[int] = field(default_factory=set)
+    updated: Set[int] = field(default_factory=set)
+    deleted: Set[int] = field(default_factory=set)
+    moved: Set[int] = field(default_factory=set)
+    # Затронутые даты ('' - бэклог); None - среди событий есть событие без дат
+    dates: Optional[Set[str]] = field(default_factory=set)
+    events: List[Event] = field(default_factory=list, repr=False)
+    unresolved: List[Tuple[str, Any]] = field(default_factory=list, repr=False)
+    held: bool = field(default=False, repr=False)
+
+    # Вид изменения для каждого типа события задачи
+    KINDS = {
+        EventType.TASK_CREATED: 'created',
+        EventType.TASK_UPDATED: 'updated',
+        EventType.TASK_COMPLETED: 'updated',
+        EventType.TASK_MOVED: 'moved',
+        EventType.TASK_DELETED: 'deleted',
+    }
+
+    def add(self, event: Event):
+        """Учет события задачи в пакете"""
+        self.events.append(event)
+        kind = self.KINDS[event.type]
+        for task_id in event.task_ids:
+            getattr(self, kind).add(task_id)
+
+        task = _event_task(event.data)
+        if not event.task_ids and task is not None and not isinstance(task, int):
+            self.track(kind, task)
+
+        if event.dates is None:
+            self.dates = None
+        elif self.dates is not None:
+            self.dates |= event.dates
+
+    def track(self, kind: str, task: Any):
+        """Задача без id: попадет в множество kind при resolve()"""
+        self.unresolved.append((kind, task))
+
+    def resolve(self):
+        """Перенос задач, получивших id, из unresolved в множества id"""
+        pending = []
+        for kind, task in self.unresolved:
+            if task.id:
+                getattr(self, kind).add(task.id)
+            else:
+                pending.append((kind, task))
+        self.unresolved = pending
+
+    @property
+    def task_ids(self) -> Set[int]:
+        """Все затронутые задачи"""
+        return self.created | self.updated | self.deleted | self.moved
+
+    def __len__(self):
+        return len(self.events)
+
+
+def _event_task(data: Any) -> Any:
+    """Задача (или id) из данных события: сама задача либо {'task': ...}"""
+    return data.get('task') if isinstance(data, dict) else data
+
+
+def _event_dates(data: Any) -> Optional[FrozenSet[str]]:
+    """Даты, которых касается событие, по его данным (None - неизвестны)"""
+    if isinstance(data, EventBatch):
+        return frozenset(data.dates) if data.dates is not None else None
+    date_scheduled = getattr(_event_task(data), 'date_scheduled', None)
+    if date_scheduled is None:
+        return None
+    return frozenset((date_scheduled or '',))
+
+
+def _event_task_ids(data: Any) -> FrozenSet[int]:
+    """id задач, которых касается событие"""
+    if isinstance(data, EventBatch):
+        return frozenset(data.task_ids)
+    task = _event_task(data)
+    task_id = task if isinstance(task, int) else getattr(task, 'id', 0)
+    return frozenset((task_id,)) if task_id else frozenset()
+
+
+def _as_date_str(value) -> str:
+    """Дата фильтра в формате ключей событий (YYYY-MM-DD)"""
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+class EventFilter:
+    """Условие подписки (where): даты, диапазоны дат, бэклог, задачи.
+
+    Условия объединяются через | (подходит любое). Подписчики с фильтром
+    хранятся в индексах по дате и id задачи - при доставке неподходящие
+    не вызываются. События с неизвестными датами (не про задачи)
+    доставляются всем подписчикам.
+    """
+
+    __slots__ = ('dates', 'date_ranges', 'task_ids')
+
+    def __init__(self, dates: Iterable = (), date_ranges: Iterable[Tuple[Any, Any]] = (),
+                 task_ids: Iterable[int] = ()):
+        self.dates = frozenset(_as_date_str(d) for d in dates)
+        self.date_ranges = tuple((_as_date_str(start), _as_date_str(end)) for start, end in date_ranges)
+        self.task_ids = frozenset(task_ids)
+
+    @classmethod
+    def on_date(cls, *dates) -> 'EventFilter':
+        """События задач на указанные даты"""
+        return cls(dates=dates)
+
+    @classmethod
+    def between(cls, start, end) -> 'EventFilter':
+        """События задач с датой в диапазоне [start, end]"""
+        return cls(date_ranges=((start, end),))
+
+    @classmethod
+    def backlog(cls) -> 'EventFilter':
+        """События задач бэклога (без даты)"""
+        return cls(dates=('',))
+
+    @classmethod
+    def task(cls, *task_ids: int) -> 'EventFilter':
+        """События конкретных задач"""
+        return cls(task_ids=task_ids)
+
+    def matches_range(self, dates: Iterable[str]) -> bool:
+        """Попадает ли одна из дат в диапазоны фильтра"""
+        return any(start <= d <= end for d in dates if d for start, end in self.date_ranges)
+
+    def __or__(self, other: 'EventFilter') -> 'EventFilter':
+        result = EventFilter()
+        result.dates = self.dates | other.dates
+        result.date_ranges = self.date_ranges + other.date_ranges
+        result.task_ids = self.task_ids | other.task_ids
+        return result
+
+    def _key(self):
+        return self.dates, self.date_ranges, self.task_ids
+
+    def __eq__(self, other):
+        return isinstance(other, EventFilter) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return (f"EventFilter(dates={sorted(self.dates)}, date_ranges={list(self.date_ranges)}, "
+                f"task_ids={sorted(self.task_ids)})")
+
+
+def _callback_name(callback: Callable) -> str:
+    """Имя обработчика для профиля и логов"""
+    return getattr(callback, '__qualname__', None) or repr(callback)
+
+
+class _LatencyStats:
+    """Счетчик вызовов и времени: сумма, максимум, перцентили по последним замерам"""
+
+    __slots__ = ('count', 'total', 'max', 'samples')
+
+    SAMPLES = 1024
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: Deque[float] = deque(maxlen=self.SAMPLES)
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.samples.append(seconds)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Статистика в миллисекундах"""
+        samples = sorted(self.samples)
+
+        def percentile(p: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(p * len(samples)))] * 1000
+
+        return {
+            'count': self.count,
+            'total_ms': self.total * 1000,
+            'mean_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'p99_ms': percentile(0.99),
+            'max_ms': self.max * 1000,
+        }
+
+
+def _callback_ref(callback: Callable) -> Callable[[], Optional[Callable]]:
+    """Ссылка на обработчик: bound-метод - слабая, функции и lambda - сильная"""
+    if inspect.ismethod(callback):
+        return weakref.WeakMethod(callback)
+    return lambda: callback
+
+
+class Subscription:
+    """Хэндл подписки: release() отписывает, release_on_destroy() - вместе с окном"""
+
+    def __init__(self, manager: 'EventManager', event_type: EventType, ref: Callable,
+                 where: Optional[EventFilter] = None, order: int = 0):
+        self._manager = manager
+        self.event_type = event_type
+        self._ref = ref
+        self.where = where
+        self.order = order  # Порядок подписки - в нем вызываются обработчики
+
+    @property
+    def active(self) -> bool:
+        """Подписка действует и обработчик еще жив"""
+        return self._ref is not None and self._ref() is not None
+
+    def release(self):
+        """Отписка (повторный вызов безопасен)"""
+        if self._ref is not None:
+            self._manager._remove_subscription(self)
+            self._ref = None
+
+    def release_on_destroy(self, widget) -> 'Subscription':
+        """Отписка при уничтожении окна (Toplevel) виджета"""
+        toplevel = widget.winfo_toplevel()
+        toplevel_path = str(toplevel)
+
+        def on_destroy(event):
+            # <Destroy> окна приходит и от каждого дочернего виджета
+            if str(event.widget) == toplevel_path:
+                self.release()
+
+        toplevel.bind('<Destroy>', on_destroy, add='+')
+        return self
+
+
+class _Subscribers:
+    """Подписчики одного типа события: без фильтра и в индексах по дате/задаче/диапазону.
+
+    Списки не изменяются на месте, а заменяются - доставка идет по снимку.
+    """
+
+    __slots__ = ('entries', 'unfiltered', 'by_date', 'by_task', 'ranged', '_order')
+
+    def __init__(self):
+        self.entries: List[Subscription] = []
+        self._order = 0
+        self._rebuild()
+
+    def next_order(self) -> int:
+        self._order += 1
+        return self._order
+
+    def find(self, callback: Callable) -> Optional[Subscription]:
+        """Действующая подписка обработчика"""
+        for subscription in self.entries:
+            if subscription._ref is not None and subscription._ref() == callback:
+                return subscription
+        return None
+
+    def add(self, subscription: Subscription):
+        self.entries = self.entries + [subscription]
+        self._rebuild()
+
+    def remove(self, subscription: Subscription):
+        self.entries = [s for s in self.entries if s is not subscription]
+        self._rebuild()
+
+    def set_filter(self, subscription: Subscription, where: Optional[EventFilter]):
+        subscription.where = where
+        self._rebuild()
+
+    def prune(self):
+        """Удаление подписок с собранными обработчиками"""
+        self.entries = [s for s in self.entries if s.active]
+        self._rebuild()
+
+    def _rebuild(self):
+        """Перестроение индексов (только при подписке/отписке)"""
+        self.unfiltered: List[Subscription] = []
+        self.by_date: Dict[str, List[Subscription]] = {}
+        self.by_task: Dict[int, List[Subscription]] = {}
+        self.ranged: List[Subscription] = []
+
+        for subscription in self.entries:
+            where = subscription.where
+            if where is None:
+                self.unfiltered.append(subscription)
+                continue
+            for date_str in where.dates:
+                self.by_date.setdefault(date_str, []).append(subscription)
+            for task_id in where.task_ids:
+                self.by_task.setdefault(task_id, []).append(subscription)
+            if where.date_ranges:
+                self.ranged.append(subscription)
+
+    def match(self, event: Event) -> List[Subscription]:
+        """Подписки, которым нужно событие (в порядке подписки)"""
+        if event.dates is None or len(self.unfiltered) == len(self.entries):
+            # Даты неизвестны или фильтров нет - доставка всем
+            return self.entries
+
+        matched = list(self.unfiltered)
+        for date_str in event.dates:
+            matched.extend(self.by_date.get(date_str, ()))
+        for task_id in event.task_ids:
+            matched.extend(self.by_task.get(task_id, ()))
+        for subscription in self.ranged:
+            if subscription.where.matches_range(event.dates):
+                matched.append(subscription)
+
+        if len(matched) == len(self.unfiltered):
+            return matched
+        # Подписка может подойти по нескольким условиям - вызывается один раз
+        return sorted(set(matched), key=lambda s: s.order)
+
+
 class EventManager:
     """Менеджер событий для координации компонентов"""
+
+    # События задач, которые в режиме слияния объединяются по (тип, задача)
+    COALESCED_TYPES = frozenset({
+        EventType.TASK_CREATED, EventType.TASK_UPDATED, EventType.TASK_DELETED,
+        EventType.TASK_MOVED, EventType.TASK_COMPLETED,
+    })
     
-    def __init__(self):
-        self._observers: Dict[EventType, List[Callable]] = {}
-        self._event_queue: List[Event] = []
+    # Опрос очереди событий из других потоков: чаще при активности, реже в простое
+    POST_POLL_MIN_MS = 16
+    POST_POLL_MAX_MS = 200
+
+    SLOW_HANDLER_MS = 16.0  # Бюджет кадра: медленные обработчики попадают в лог
+
+    def __init__(self, root=None, coalesce: bool = False):
+        # Подписки по типам (bound-методы - слабые ссылки, мертвые удаляются при доставке)
+        self._observers: Dict[EventType, _Subscribers] = {}
+        self._event_queue: Deque[Event] = deque()
         self._processing = False
+
+        # Режим слияния: события одного цикла idle доставляются одним проходом
+        self.root = root
+        self.coalesce = coalesce and root is not None
+        self._pending: Dict[Hashable, Event] = {}
+        self._pending_seq = 0
+        self._flush_id = None
+
+        # Пакетный режим: события задач копятся в EventBatch до выхода из batch()
+        self._batch_depth = 0
+        self._batch: Optional[EventBatch] = None
+
+        # Мост из рабочих потоков: emit() только кладет в очередь, поток Tk
+        # забирает ее опросом через планировщик. root из рабочего потока не
+        # трогается: after() оттуда ждет поток Tk и может зависнуть навсегда,
+        # если тот сам ждет рабочий поток (flush/shutdown при закрытии)
+        self._owner_thread = threading.get_ident()
+        self._posted: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._post_poll_ms = self.POST_POLL_MIN_MS
+        self._drain_job = None
+        self._closed = False
+        self._delivery_latency = _LatencyStats()
+        if root is not None:
+            self._drain_job = call_later(root, self.POST_POLL_MIN_MS, self._drain_posted)
+
+        # Профилирование доставки (по умолчанию выключено - без накладных расходов)
+        self.profiling = False
+        self.reset_profile()
         
-    def subscribe(self, event_type: EventType, callback: Callable):
-        """Подписка на событие"""
-        if event_type not in self._observers:
-            self._observers[event_type] = []
-        
-        if callback not in self._observers[event_type]:
-            self._observers[event_type].append(callback)
-            logger.debug(f"Subscribed {callback.__name__} to {event_type.name}")
+    def subscribe(self, event_type: EventType, callback: Callable, owner=None,
+                  where: Optional[EventFilter] = None) -> Subscription:
+        """Подписка на событие.
+
+        where - фильтр по датам/задачам (повторная подписка обработчика заменяет его),
+        owner - виджет, с окном которого подписка снимается.
+        """
+        subscribers = self._observers.get(event_type)
+        if subscribers is None:
+            subscribers = self._observers[event_type] = _Subscribers()
+
+        subscription = subscribers.find(callback)
+        if subscription is not None:
+            if subscription.where != where:
+                subscribers.set_filter(subscription, where)
+        else:
+            subscription = Subscription(self, event_type, _callback_ref(callback), where,
+                                        subscribers.next_order())
+            subscribers.add(subscription)
+            logger.debug("Subscribed %s to %s (where=%s)", _callback_name(callback), event_type.name, where)
+
+        if owner is not None:
+            subscription.release_on_destroy(owner)
+        return subscription
     
     def unsubscribe(self, event_type: EventType, callback: Callable):
         """Отписка от события"""
-        if event_type in self._observers and callback in self._observers[event_type]:
-            self._observers[event_type].remove(callback)
-            logger.debug(f"Unsubscribed {callback.__name__} from {event_type.name}")
+        subscribers = self._observers.get(event_type)
+        subscription = subscribers.find(callback) if subscribers is not None else None
+        if subscription is not None:
+            subscription.release()
+            logger.debug("Unsubscribed %s from %s", _callback_name(callback), event_type.name)
+
+    def _remove_subscription(self, subscription: Subscription):
+        """Удаление подписки из индексов"""
+        subscribers = self._observers.get(subscription.event_type)
+        if subscribers is not None:
+            subscribers.remove(subscription)
+
+    def subscriber_count(self, event_type: EventType) -> int:
+        """Количество живых подписчиков события"""
+        subscribers = self._observers.get(event_type)
+        return sum(1 for s in subscribers.entries if s.active) if subscribers is not None else 0
     
     def emit(self, event: Event):
-        """Отправка события"""
-        logger.info(f"Emitting event: {event}")
+        """Отправка события (из любого потока)"""
+        if self.root is not None and threading.get_ident() != self._owner_thread:
+            # Рабочий поток: доставка на потоке Tk
+            self._posted.put((event, time.perf_counter()))
+            return
+
+        logger.debug("Emitting event: %s", event)
+        if self.profiling and self._processing:
+            self._reentrant_emits += 1  # Событие из обработчика другого события
+
+        if self._batch is not None and event.type in EventBatch.KINDS:
+            self._batch.add(event)
+            return
+
+        if self.coalesce:
+            self._add_pending(event)
+            return
         
         # Добавляем в очередь для предотвращения рекурсии
         self._event_queue.append(event)
@@ -86,17 +515,223 @@ class EventManager:
         
         try:
             while self._event_queue:
-                event = self._event_queue.pop(0)
+                if self.profiling and len(self._event_queue) > self._max_queue_depth:
+                    self._max_queue_depth = len(self._event_queue)
+                event = self._event_queue.popleft()
                 
                 if event.type in self._observers:
-                    for callback in self._observers[event.type][:]:  # Копия для безопасности
-                        try:
-                            callback(event)
-                        except Exception as e:
-                            logger.error(f"Error in callback {callback.__name__}: {e}")
+                    if self.profiling:
+                        self._dispatch_profiled(event)
+                    else:
+                        self._dispatch(event)
         finally:
             self._processing = False
+
+    def _dispatch(self, event: Event):
+        """Вызов обработчиков события"""
+        dead = False
+        for subscription in self._observers[event.type].match(event):
+            ref = subscription._ref
+            if ref is None:
+                continue  # Отписан во время доставки
+            callback = ref()
+            if callback is None:
+                dead = True  # Владелец обработчика уже собран
+                continue
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Error in callback %s for %s", _callback_name(callback), event.type.name)
+        if dead:
+            self._prune(event.type)
+
+    def _dispatch_profiled(self, event: Event):
+        """Вызов обработчиков с замером времени каждого"""
+        clock = time.perf_counter
+        dead = False
+        started = clock()
+
+        for subscription in self._observers[event.type].match(event):
+            ref = subscription._ref
+            if ref is None:
+                continue
+            callback = ref()
+            if callback is None:
+                dead = True
+                continue
+
+            callback_started = clock()
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Error in callback %s for %s", _callback_name(callback), event.type.name)
+            elapsed = clock() - callback_started
+
+            name = _callback_name(callback)
+            key = (event.type.name, name)
+            stats = self._callback_stats.get(key)
+            if stats is None:
+                stats = self._callback_stats[key] = _LatencyStats()
+            stats.add(elapsed)
+
+            if elapsed * 1000 > self.SLOW_HANDLER_MS:
+                logger.warning("Slow event handler %s for %s: %.1f ms (budget %.0f ms)",
+                               name, event.type.name, elapsed * 1000, self.SLOW_HANDLER_MS)
+
+        stats = self._event_stats.get(event.type.name)
+        if stats is None:
+            stats = self._event_stats[event.type.name] = _LatencyStats()
+        stats.add(clock() - started)
+
+        if dead:
+            self._prune(event.type)
+
+    # Профилирование
+
+    def enable_profiling(self, enabled: bool = True):
+        """Включение/выключение замеров доставки событий"""
+        self.profiling = enabled
+
+    def reset_profile(self):
+        """Сброс накопленных замеров"""
+        self._event_stats: Dict[str, _LatencyStats] = {}
+        self._callback_stats: Dict[Tuple[str, str], _LatencyStats] = {}
+        self._max_queue_depth = 0
+        self._reentrant_emits = 0
+
+    def get_profile(self) -> Dict[str, Any]:
+        """Замеры доставки: по типам событий, по обработчикам, глубина очереди, повторные входы"""
+        return {
+            'enabled': self.profiling,
+            'event_types': {name: stats.snapshot() for name, stats in self._event_stats.items()},
+            'callbacks': {key: stats.snapshot() for key, stats in self._callback_stats.items()},
+            'queue_depth': len(self._event_queue) + len(self._pending),
+            'max_queue_depth': self._max_queue_depth,
+            'reentrant_emits': self._reentrant_emits,
+        }
     
-    def emit_now(self, event_type: EventType, data: Any = None, source: Any = None):
-        """Быстрый метод для отправки события"""
-        self.emit(Event(event_type, data, source))
\ No newline at end of file
+    def _prune(self, event_type: EventType):
+        """Удаление ссылок на собранные обработчики"""
+        self._observers[event_type].prune()
+
+    def emit_now(self, event_type: EventType, data: Any = None, source: Any = None,
+                 dates: Optional[Iterable[str]] = None):
+        """Быстрый метод для отправки события (dates - затронутые даты, если их больше одной)"""
+        self.emit(Event(event_type, data, source, dates))
+
+    # События из других потоков
+
+    def _drain_posted(self):
+        """Доставка событий из других потоков (опрос очереди на потоке Tk)"""
+        self._drain_job = None
+        if self._closed:
+            return
+
+        now = time.perf_counter()
+        delivered = 0
+        while True:
+            try:
+                event, posted_at = self._posted.get_nowait()
+            except queue.Empty:
+                break
+            self._delivery_latency.add(now - posted_at)
+            self.emit(event)
+            delivered += 1
+
+        # После событий опрашиваем часто, в простое интервал удваивается
+        if delivered:
+            self._post_poll_ms = self.POST_POLL_MIN_MS
+        else:
+            self._post_poll_ms = min(self._post_poll_ms * 2, self.POST_POLL_MAX_MS)
+        self._drain_job = call_later(self.root, self._post_poll_ms, self._drain_posted)
+
+    def get_delivery_stats(self) -> Dict[str, float]:
+        """Задержка доставки событий из других потоков, мс (перцентили по последним)"""
+        stats = self._delivery_latency.snapshot()
+        stats['pending'] = self._posted.qsize()
+        return stats
+
+    def close(self):
+        """Остановка доставки (при завершении приложения)"""
+        self._closed = True
+        cancel_call(self.root, self._drain_job)
+        cancel_call(self.root, self._flush_id)
+        self._drain_job = self._flush_id = None
+
+    @contextmanager
+    def batch(self):
+        """Пакет: события задач внутри блока заменяются одним BATCH_COMPLETED.
+
+        Остальные события доставляются как обычно; вложенные блоки
+        входят во внешний пакет. Пакет с held=True отправляет его владелец.
+        """
+        if self._batch_depth == 0:
+            self._batch = EventBatch()
+        self._batch_depth += 1
+        try:
+            yield self._batch
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                batch, self._batch = self._batch, None
+                if batch and not batch.held:
+                    self.emit(Event(EventType.BATCH_COMPLETED, batch))
+
+    # Слияние событий
+
+    @staticmethod
+    def _coalesce_key(event: Event) -> Optional[Hashable]:
+        """Ключ слияния (тип, задача) или None, если событие не сливается"""
+        if event.type not in EventManager.COALESCED_TYPES:
+            return None
+
+        task = _event_task(event.data)
+        if isinstance(task, int):
+            return (event.type, task) if task else None
+        task_id = getattr(task, 'id', 0)
+        # У новой задачи id еще нет - сливаем по самому объекту
+        return event.type, task_id if task_id else ('object', id(task))
+
+    @staticmethod
+    def _merge(first: Event, last: Event) -> Event:
+        """Объединение двух событий об одной задаче (даты - обоих событий)"""
+        data = last.data
+        if last.type == EventType.TASK_MOVED:
+            data = dict(last.data)
+            data['from_quadrant'] = first.data['from_quadrant']
+        merged = Event(last.type, data, last.source)
+        merged.dates = None if first.dates is None or last.dates is None else first.dates | last.dates
+        return merged
+
+    def _add_pending(self, event: Event):
+        """Событие в буфер текущего цикла; повтор по той же задаче заменяет прежнее"""
+        key = self._coalesce_key(event)
+        if key is None:
+            self._pending_seq += 1
+            key = ('unique', self._pending_seq)
+        else:
+            previous = self._pending.pop(key, None)
+            if previous is not None:
+                # Объединенное событие встает на место последнего
+                event = self._merge(previous, event)
+        self._pending[key] = event
+
+        if self._flush_id is None:
+            self._flush_id = self.root.after_idle(self.flush)
+
+    def flush(self):
+        """Доставка накопленных событий (вызывается из after_idle или вручную)"""
+        if self._flush_id is not None:
+            try:
+                self.root.after_cancel(self._flush_id)
+            except Exception:
+                pass  # Окно уже уничтожено
+            self._flush_id = None
+
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        self._event_queue.extend(pending.values())
+        if not self._processing:
+            self._process_event_queue()
@@ -11,6 +11,7 @@ import logging
 
 from .task_models import Task
 from .event_manager import EventType
+from .scheduler import call_later as _call_later
 
 logger = logging.getLogger(__name__)
 
@@ -112,6 +113,8 @@ class IncrementalUpdater:
             to_rgb = self._hex_to_rgb(to_color)
             
             def update_color(step):
+                if not widget.winfo_exists():
+                    return  # Виджет удален во время анимации
                 if step >= steps:
                     widget.config(bg=to_color)
                     return
@@ -126,7 +129,7 @@ class IncrementalUpdater:
                 widget.config(bg=color)
                 
                 # Следующий шаг
-                widget.after(step_duration, lambda: update_color(step + 1))
+                _call_later(widget, step_duration, update_color, step + 1, visual=True)
             
             update_color(0)
             
@@ -142,6 +145,8 @@ class IncrementalUpdater:
     def fade_out_widget(self, widget: tk.Widget, callback: callable = None):
         """Плавное исчезновение виджета"""
         def fade_step(alpha):
+            if not widget.winfo_exists():
+                return
             if alpha <= 0:
                 widget.destroy()
                 if callback:
@@ -149,7 +154,7 @@ class IncrementalUpdater:
                 return
             
             # Уменьшаем прозрачность (эмуляция через изменение цвета)
-            widget.after(20, lambda: fade_step(alpha - 0.1))
+            _call_later(widget, 20, fade_step, alpha - 0.1)
         
         fade_step(1.0)
     
@@ -195,7 +200,7 @@ class SmartUpdateMixin:
         
         # Планируем следующий пакет
         if hasattr(self, 'after'):
-            self.after(10, self._process_update_queue)
+            _call_later(self, 10, self._process_update_queue)
         else:
             self._process_update_queue()
     
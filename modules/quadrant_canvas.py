@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+Task Manager - Отрисовка задач квадранта на одном Canvas
+"""
+
+import tkinter as tk
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+
+from .task_models import Task
+from .colors import get_priority_color, get_completed_color
+
+logger = logging.getLogger(__name__)
+
+
+class QuadrantCanvas:
+    """Квадрант на одном tk.Canvas: задача - прямоугольник и текст с тегом задачи.
+
+    Вместо Frame и Label на каждую задачу - элементы холста. Обработчики
+    привязаны один раз к тегу 'task', задача под курсором определяется
+    по тегу элемента, изменения задачи применяются через itemconfig.
+    """
+
+    TASK_TAG = 'task'
+    PAD = 4
+    MIN_TILE_HEIGHT = 40
+    TITLE_LENGTH = 20
+
+    def __init__(self, parent, on_click: Callable, on_drag: Callable,
+                 on_release: Callable, on_context_menu: Callable, bg: str = 'white'):
+        self.canvas = tk.Canvas(parent, bg=bg, highlightthickness=0)
+        self.on_click = on_click
+        self.on_drag = on_drag
+        self.on_release = on_release
+        self.on_context_menu = on_context_menu
+
+        # Ключ задачи - id объекта: у новой задачи id из БД еще может не быть
+        self._tasks: List[Task] = []
+        self._by_key: Dict[int, Task] = {}
+        self._items: Dict[int, Tuple[int, int, int]] = {}  # ключ -> (rect, title, duration)
+        self._states: Dict[int, tuple] = {}
+        self._size: Tuple[int, int] = (0, 0)
+        self._pressed: Optional[Task] = None
+
+        self._empty_item = self.canvas.create_text(
+            0, 0, text="Перетащите задачи сюда", fill='gray', font=('Arial', 10))
+
+        canvas = self.canvas
+        canvas.tag_bind(self.TASK_TAG, '<Button-1>', self._on_press)
+        canvas.tag_bind(self.TASK_TAG, '<B1-Motion>', self._on_motion)
+        canvas.tag_bind(self.TASK_TAG, '<ButtonRelease-1>', self._on_release)
+        canvas.tag_bind(self.TASK_TAG, '<Button-3>', self._on_context_menu)
+        canvas.bind('<Configure>', self._on_configure)
+
+    # Данные
+
+    def set_tasks(self, tasks: List[Task]):
+        """Синхронизация элементов с задачами: удаление, добавление, itemconfig измененных"""
+        new_keys = [id(task) for task in tasks]
+        old_keys = [id(task) for task in self._tasks]
+
+        for key in set(old_keys).difference(new_keys):
+            self.canvas.delete(self._tag(key))
+            del self._items[key]
+            del self._states[key]
+            del self._by_key[key]
+
+        for task in tasks:
+            key = id(task)
+            if key not in self._items:
+                self._create_items(task)
+            elif self._states[key] != self._state(task):
+                self._update_items(task)
+
+        self._tasks = list(tasks)
+        if new_keys != old_keys:
+            self._layout()
+
+    def task_at(self, x: int, y: int) -> Optional[Task]:
+        """Задача под точкой холста"""
+        for item in reversed(self.canvas.find_overlapping(x, y, x, y)):
+            task = self._task_for_item(item)
+            if task is not None:
+                return task
+        return None
+
+    # Элементы
+
+    @staticmethod
+    def _tag(key: int) -> str:
+        return f"t{key}"
+
+    @staticmethod
+    def _state(task: Task) -> tuple:
+        return task.title, task.is_completed, task.priority, task.has_duration, task.duration
+
+    def _title_text(self, task: Task) -> str:
+        title = task.title
+        if len(title) > self.TITLE_LENGTH:
+            title = title[:self.TITLE_LENGTH] + "..."
+        return f"✓ {title}" if task.is_completed else title
+
+    def _create_items(self, task: Task):
+        """Прямоугольник, заголовок и длительность задачи (размещаются в _layout)"""
+        key = id(task)
+        tags = (self.TASK_TAG, self._tag(key))
+        color = get_completed_color() if task.is_completed else get_priority_color(task.priority)
+
+        rect = self.canvas.create_rectangle(0, 0, 0, 0, fill=color, outline='#555555', tags=tags)
+        title = self.canvas.create_text(0, 0, text=self._title_text(task), fill='white',
+                                        font=('Arial', 9, 'bold'), justify='center', tags=tags)
+        duration = self.canvas.create_text(0, 0, text=f"{task.duration}м", fill='white',
+                                           font=('Arial', 8), tags=tags,
+                                           state='normal' if task.has_duration else 'hidden')
+
+        self._items[key] = (rect, title, duration)
+        self._states[key] = self._state(task)
+        self._by_key[key] = task
+
+    def _update_items(self, task: Task):
+        """Изменения задачи - на месте, без пересоздания элементов"""
+        key = id(task)
+        rect, title, duration = self._items[key]
+        color = get_completed_color() if task.is_completed else get_priority_color(task.priority)
+
+        self.canvas.itemconfigure(rect, fill=color)
+        self.canvas.itemconfigure(title, text=self._title_text(task))
+        self.canvas.itemconfigure(duration, text=f"{task.duration}м",
+                                  state='normal' if task.has_duration else 'hidden')
+        self._states[key] = self._state(task)
+
+    def _task_for_item(self, item: int) -> Optional[Task]:
+        for tag in self.canvas.gettags(item):
+            if tag != self.TASK_TAG and tag.startswith('t'):
+                return self._by_key.get(int(tag[1:]))
+        return None
+
+    # Компоновка
+
+    def _on_configure(self, event):
+        size = (event.width, event.height)
+        if size != self._size:
+            self._size = size
+            self._layout()
+
+    def _layout(self):
+        """Размещение плиток сеткой (колонки - как у виджетного квадранта)"""
+        width, height = self._size
+        count = len(self._tasks)
+
+        self.canvas.coords(self._empty_item, width / 2, height / 2)
+        self.canvas.itemconfigure(self._empty_item, state='hidden' if count else 'normal')
+        if not count or width <= 1:
+            return
+
+        cols = 2 if count <= 4 else 3 if count <= 9 else 4
+        rows = (count + cols - 1) // cols
+        pad = self.PAD
+        tile_width = (width - pad * (cols + 1)) / cols
+        tile_height = max(self.MIN_TILE_HEIGHT, (height - pad * (rows + 1)) / rows)
+
+        coords = self.canvas.coords
+        itemconfigure = self.canvas.itemconfigure
+        for i, task in enumerate(self._tasks):
+            rect, title, duration = self._items[id(task)]
+            x0 = pad + (i % cols) * (tile_width + pad)
+            y0 = pad + (i // cols) * (tile_height + pad)
+            center_x = x0 + tile_width / 2
+
+            coords(rect, x0, y0, x0 + tile_width, y0 + tile_height)
+            coords(title, center_x, y0 + tile_height / 2 - 6)
+            coords(duration, center_x, y0 + tile_height - 10)
+            itemconfigure(title, width=max(10, tile_width - 8))
+
+        self.canvas.configure(scrollregion=(0, 0, width, pad + rows * (tile_height + pad)))
+
+    # События (привязаны к тегу, а не к элементам)
+
+    def _current_task(self) -> Optional[Task]:
+        current = self.canvas.find_withtag('current')
+        return self._task_for_item(current[0]) if current else None
+
+    def _on_press(self, event):
+        self._pressed = self._current_task()
+        if self._pressed is not None:
+            self.on_click(event, self._pressed)
+
+    def _on_motion(self, event):
+        # Пока кнопка нажата, 'current' не меняется - тянем нажатую задачу
+        if self._pressed is not None:
+            self.on_drag(event, self._pressed, self.canvas)
+
+    def _on_release(self, event):
+        self._pressed = None
+        self.on_release(event)
+
+    def _on_context_menu(self, event):
+        task = self._current_task()
+        if task is not None:
+            return self.on_context_menu(event, task)
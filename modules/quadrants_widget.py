@@ -12,26 +12,130 @@ import logging
 from .task_models import Task
 from .colors import get_priority_color, get_completed_color, QUADRANT_COLORS
 from .incremental_updater import IncrementalUpdater, SmartUpdateMixin
+from .quadrant_canvas import QuadrantCanvas
+from .tile_pool import TilePool
 
 logger = logging.getLogger(__name__)
 
 
+class QuadrantTile:
+    """Плитка задачи квадранта: прямые ссылки на виджеты и последние отрисованные значения.
+
+    render() сравнивает новые значения с отрисованными и вызывает config
+    только для изменившихся - без обхода winfo_children().
+    """
+
+    __slots__ = ('frame', 'content_frame', 'title_label', 'duration_label',
+                 'task', 'quadrant', 'state', '_bg', '_title', '_duration')
+
+    TITLE_LENGTH = 20
+
+    def __init__(self, parent, on_click, on_drag, on_release, on_context_menu):
+        self.task: Optional[Task] = None
+        self.quadrant: Optional[int] = None
+        self.state: Optional[tuple] = None
+        self._bg: Optional[str] = None
+        self._title: Optional[str] = None
+        self._duration: Optional[str] = None  # None - метка длительности скрыта
+
+        self.frame = tk.Frame(parent, relief='raised', bd=1)
+
+        self.content_frame = tk.Frame(self.frame)
+        self.content_frame.pack(fill='both', expand=True, padx=3, pady=3)
+
+        self.title_label = tk.Label(
+            self.content_frame,
+            fg='white',
+            font=('Arial', 9, 'bold'),
+            wraplength=100,
+            justify='center'
+        )
+        self.title_label.pack(expand=True, pady=(5, 2))
+
+        # Длительность (показывается в render)
+        self.duration_label = tk.Label(self.content_frame, fg='white', font=('Arial', 8))
+
+        # Обработчики берут задачу из плитки: плитку из пула можно отдать другой задаче
+        for widget in (self.frame, self.content_frame, self.title_label):
+            widget.bind("<Button-1>", lambda e: on_click(e, self.task))
+            widget.bind("<B1-Motion>", lambda e: on_drag(e, self.task, self.frame))
+            widget.bind("<ButtonRelease-1>", on_release)
+            widget.bind("<Button-3>", lambda e: on_context_menu(e, self.task, self.quadrant))
+
+    @staticmethod
+    def state_of(task: Task) -> tuple:
+        return task.title, task.is_completed, task.priority, task.has_duration, task.duration
+
+    @classmethod
+    def title_text(cls, task: Task) -> str:
+        title_text = task.title[:cls.TITLE_LENGTH] + "..." if len(task.title) > cls.TITLE_LENGTH else task.title
+        return f"✓ {title_text}" if task.is_completed else title_text
+
+    def render(self, task: Task):
+        """Привязка к задаче и отрисовка только изменившихся значений"""
+        self.task = task
+        state = self.state_of(task)
+        if state == self.state:
+            return
+        self.state = state
+
+        bg = get_completed_color() if task.is_completed else get_priority_color(task.priority)
+        if bg != self._bg:
+            self._bg = bg
+            self.frame.config(bg=bg)
+            self.content_frame.config(bg=bg)
+            self.title_label.config(bg=bg)
+            self.duration_label.config(bg=bg)
+
+        title = self.title_text(task)
+        if title != self._title:
+            self._title = title
+            self.title_label.config(text=title)
+
+        duration = f"{task.duration}м" if task.has_duration else None
+        if duration != self._duration:
+            if duration is None:
+                self.duration_label.pack_forget()
+            else:
+                self.duration_label.config(text=duration)
+                if self._duration is None:
+                    self.duration_label.pack()
+            self._duration = duration
+
+    def release(self):
+        """Отвязка от задачи перед возвратом в пул"""
+        self.task = None
+        self.quadrant = None
+
+
 class QuadrantsWidget(SmartUpdateMixin):
     """Виджет квадрантов с оптимизированными обновлениями"""
 
-    def __init__(self, parent, task_manager):
+    # Режимы отрисовки задач: виджет на задачу или элементы одного Canvas на квадрант
+    RENDER_WIDGETS = 'widgets'
+    RENDER_CANVAS = 'canvas'
+
+    # Ключ плиток в пуле: плитки создаются в grid_frame и подходят любому квадранту
+    TILE_KEY = ('quadrant',)
+
+    def __init__(self, parent, task_manager, render_mode: str = RENDER_WIDGETS,
+                 tile_pool: Optional[TilePool] = None):
         super().__init__()
         self.parent = parent
         self.task_manager = task_manager
+        self.render_mode = render_mode
+        self.tile_pool = tile_pool if tile_pool is not None else TilePool()
         self.quadrants = {}
         self.time_labels = {}
         self.selected_task: Optional[Task] = None
-        self.drag_data = {"task": None, "widget": None}
+        self.drag = task_manager.drag_controller
         self.updater = IncrementalUpdater()
         
         # Кеш для отслеживания состояния
-        self._task_widgets_cache = {}  # task_id -> widget
-        self._current_tasks = {}  # quadrant -> set of task_ids
+        # Кеши плиток по id(task): у новых задач id еще 0, а экземпляр задачи
+        # каноничен (identity map репозитория) и не меняется при назначении id
+        self._task_widgets_cache: Dict[int, QuadrantTile] = {}  # id(task) -> плитка
+        self._current_tasks = {}  # quadrant -> set of id(task)
         
         # Для контекстного меню
         self.context_menu = None
@@ -116,9 +220,13 @@ class QuadrantsWidget(SmartUpdateMixin):
         quad_frame = tk.Frame(self.grid_frame, bg=color, relief='solid', bd=2)
         quad_frame.grid(row=row, column=col, sticky='nsew', padx=2, pady=2)
 
-        quad_frame.bind("<Enter>", lambda e, q=quad_id: self._on_quadrant_enter(e, q))
-        quad_frame.bind("<Leave>", lambda e, q=quad_id: self._on_quadrant_leave(e, q))
-        quad_frame.bind("<ButtonRelease-1>", lambda e, q=quad_id: self._on_quadrant_drop(e, q))
+        self.drag.add_target(
+            quad_frame,
+            on_drop=lambda t, q=quad_id: self._on_quadrant_drop(t, q),
+            accepts=lambda t, q=quad_id: t.quadrant != q,
+            on_enter=lambda q=quad_id: self._on_quadrant_enter(q),
+            on_leave=lambda q=quad_id: self._on_quadrant_leave(q),
+        )
 
         header_frame = tk.Frame(quad_frame, bg=color)
         header_frame.pack(fill='x', padx=5, pady=(5, 0))
@@ -147,15 +255,24 @@ class QuadrantsWidget(SmartUpdateMixin):
         task_container = tk.Frame(quad_frame, bg='white')
         task_container.pack(fill='both', expand=True, padx=5, pady=5)
 
-        inner_table = tk.Frame(task_container, bg='white')
-        inner_table.pack(fill='both', expand=True)
-
-        task_container.bind("<ButtonRelease-1>", lambda e, q=quad_id: self._on_quadrant_drop(e, q))
+        canvas = inner_table = empty_label = None
+        if self.render_mode == self.RENDER_CANVAS:
+            canvas = QuadrantCanvas(
+                task_container,
+                on_click=self._on_task_click,
+                on_drag=self._on_task_drag,
+                on_release=self._on_task_release,
+                on_context_menu=lambda e, t, q=quad_id: self._show_context_menu(e, t, q),
+            )
+            canvas.canvas.pack(fill='both', expand=True)
+        else:
+            inner_table = tk.Frame(task_container, bg='white')
+            inner_table.pack(fill='both', expand=True)
 
-        # Сохраняем пустой заполнитель
-        empty_label = tk.Label(inner_table, text="Перетащите задачи сюда",
-                              bg='white', fg='gray', font=('Arial', 10))
-        empty_label.pack(expand=True)
+            # Сохраняем пустой заполнитель
+            empty_label = tk.Label(inner_table, text="Перетащите задачи сюда",
+                                  bg='white', fg='gray', font=('Arial', 10))
+            empty_label.pack(expand=True)
 
         self.quadrants[quad_id] = {
             'frame': quad_frame,
@@ -166,7 +283,15 @@ class QuadrantsWidget(SmartUpdateMixin):
             'tasks': [],
             'color': color,
             'task_widgets': {},
-            'empty_label': empty_label
+            'empty_label': empty_label,
+            'canvas': canvas,
+            # Кеш раскладки: id(task) -> (плитка, строка, колонка), форма сетки (строки, колонки)
+            'slots': {},
+            'grid_shape': (0, 0),
+            # Вклад задач в длительность квадранта и их сумма (без пересчета по всем задачам)
+            'durations': {},
+            'total_duration': 0,
+            'info': None,  # Показанные (текст, цвет) заголовка
         }
 
         self.time_labels[quad_id] = time_label
@@ -179,6 +304,43 @@ class QuadrantsWidget(SmartUpdateMixin):
             new_tasks = quadrant_tasks.get(quad_id, [])
             self._update_single_quadrant(quad_id, new_tasks)
 
+    def update_task(self, task: Task, visible: bool = True):
+        """Точечное обновление: квадрант, где задача показана, и квадрант, где она теперь.
+
+        Списки квадрантов берутся из памяти.
+        """
+        old_quad = self._quadrant_of(task)
+        new_quad = task.quadrant if visible and task.quadrant in self.quadrants else None
+
+        # Сначала старый квадрант: его удаление не должно затереть кеш нового виджета
+        for quad_id in (old_quad, new_quad):
+            if quad_id is not None:
+                self._update_single_quadrant(quad_id, self.task_manager.get_quadrant_tasks(quad_id))
+                if old_quad == new_quad:
+                    break
+
+    def remove_task(self, task_id: int) -> bool:
+        """Удаление задачи из ее квадранта без прохода по остальным.
+
+        False - задача в квадрантах не найдена (или без id не опознается).
+        """
+        if not task_id:
+            return False
+
+        for quad_id, quad_data in self.quadrants.items():
+            if any(t.id == task_id for t in quad_data['tasks']):
+                self._update_single_quadrant(quad_id, self.task_manager.get_quadrant_tasks(quad_id))
+                return True
+        return False
+
+    def _quadrant_of(self, task: Task) -> Optional[int]:
+        """Квадрант, в котором задача сейчас показана"""
+        key = id(task)
+        for quad_id, keys in self._current_tasks.items():
+            if key in keys:
+                return quad_id
+        return None
+
     def _update_single_quadrant(self, quad_id: int, new_tasks: List[Task]):
         """Обновление одного квадранта только при необходимости"""
         if quad_id not in self.quadrants:
@@ -186,7 +348,15 @@ class QuadrantsWidget(SmartUpdateMixin):
         
         quad_data = self.quadrants[quad_id]
         current_task_ids = self._current_tasks[quad_id]
-        new_task_ids = {t.id for t in new_tasks}
+        new_task_ids = {id(t) for t in new_tasks}
+
+        if quad_data['canvas'] is not None:
+            # Холст сам сверяет элементы с задачами и обновляет их на месте
+            quad_data['canvas'].set_tasks(new_tasks)
+            self._update_quadrant_info(quad_id, new_tasks)
+            self._current_tasks[quad_id] = new_task_ids
+            quad_data['tasks'] = new_tasks
+            return
         
         # Определяем изменения
         added_ids = new_task_ids - current_task_ids
@@ -194,7 +364,7 @@ class QuadrantsWidget(SmartUpdateMixin):
         common_ids = current_task_ids & new_task_ids
         
         # Нет изменений - не обновляем
-        if not added_ids and not removed_ids and not any(self._task_changed(t) for t in new_tasks if t.id in common_ids):
+        if not added_ids and not removed_ids and not any(self._task_changed(t) for t in new_tasks if id(t) in common_ids):
             return
         
         logger.debug(f"Updating quadrant {quad_id}: +{len(added_ids)} -{len(removed_ids)} ~{len(common_ids)}")
@@ -204,20 +374,20 @@ class QuadrantsWidget(SmartUpdateMixin):
             quad_data['empty_label'].pack_forget()
         
         # Удаляем виджеты удаленных задач
-        for task_id in removed_ids:
-            if task_id in quad_data['task_widgets']:
-                widget = quad_data['task_widgets'][task_id]
-                self.queue_update(self._remove_task_widget, widget, task_id, quad_id)
+        for key in removed_ids:
+            if key in quad_data['task_widgets']:
+                widget = quad_data['task_widgets'][key]
+                self.queue_update(self._remove_task_widget, widget, key, quad_id)
         
         # Обновляем существующие задачи
         for task in new_tasks:
-            if task.id in common_ids:
+            if id(task) in common_ids:
                 if self._task_changed(task):
                     self.queue_update(self._update_task_widget, task, quad_id)
         
         # Добавляем новые задачи
         for task in new_tasks:
-            if task.id in added_ids:
+            if id(task) in added_ids:
                 self.queue_update(self._add_task_widget, task, quad_id)
         
         # Обновляем layout и информацию
@@ -229,88 +399,69 @@ class QuadrantsWidget(SmartUpdateMixin):
 
     def _task_changed(self, task: Task) -> bool:
         """Проверка, изменилась ли задача"""
-        if task.id not in self._task_widgets_cache:
-            return True
-        
-        cached_widget = self._task_widgets_cache[task.id]
-        if not hasattr(cached_widget, '_task_state'):
-            return True
-        
-        old_state = cached_widget._task_state
-        new_state = (task.title, task.is_completed, task.priority, task.has_duration, task.duration)
-        
-        return old_state != new_state
+        tile = self._task_widgets_cache.get(id(task))
+        return tile is None or tile.state != QuadrantTile.state_of(task)
 
-    def _remove_task_widget(self, widget: tk.Widget, task_id: int, quad_id: int):
-        """Удаление виджета задачи с анимацией"""
-        if widget.winfo_exists():
-            # Простое удаление (можно добавить fade-out анимацию)
-            widget.destroy()
+    def _remove_task_widget(self, tile: QuadrantTile, key: int, quad_id: int):
+        """Возврат плитки задачи (key - id(task)) в пул"""
+        quad_data = self.quadrants[quad_id]
+        tile.release()
+        self.tile_pool.release(self.TILE_KEY, tile)
+        quad_data['slots'].pop(key, None)
+        self._set_task_duration(quad_id, key, None)
         
-        # Очистка из кешей
-        if task_id in self.quadrants[quad_id]['task_widgets']:
-            del self.quadrants[quad_id]['task_widgets'][task_id]
-        if task_id in self._task_widgets_cache:
-            del self._task_widgets_cache[task_id]
+        # Очистка из кешей (задача могла уже получить плитку в другом квадранте)
+        if quad_data['task_widgets'].get(key) is tile:
+            del quad_data['task_widgets'][key]
+        if self._task_widgets_cache.get(key) is tile:
+            del self._task_widgets_cache[key]
 
     def _update_task_widget(self, task: Task, quad_id: int):
-        """Обновление существующего виджета задачи"""
-        if task.id not in self.quadrants[quad_id]['task_widgets']:
-            return
-        
-        widget = self.quadrants[quad_id]['task_widgets'][task.id]
-        if not widget.winfo_exists():
-            return
-        
-        # Обновляем цвет если изменился приоритет или статус
-        new_color = get_completed_color() if task.is_completed else get_priority_color(task.priority)
-        current_color = widget.cget('bg')
-        
-        if current_color != new_color:
-            # Можно добавить анимацию изменения цвета
-            widget.config(bg=new_color)
-            for child in widget.winfo_children():
-                if isinstance(child, tk.Frame):
-                    child.config(bg=new_color)
-                    for subchild in child.winfo_children():
-                        if isinstance(subchild, tk.Label):
-                            subchild.config(bg=new_color)
-        
-        # Обновляем текст
-        for child in widget.winfo_children():
-            if isinstance(child, tk.Frame):
-                for subchild in child.winfo_children():
-                    if isinstance(subchild, tk.Label) and hasattr(subchild, '_is_title'):
-                        title_text = task.title[:20] + "..." if len(task.title) > 20 else task.title
-                        if task.is_completed:
-                            title_text = f"✓ {title_text}"
-                        subchild.config(text=title_text)
-                    elif isinstance(subchild, tk.Label) and hasattr(subchild, '_is_duration'):
-                        if task.has_duration:
-                            subchild.config(text=f"{task.duration}м")
-                            subchild.pack()
-                        else:
-                            subchild.pack_forget()
-        
-        # Сохраняем новое состояние
-        widget._task_state = (task.title, task.is_completed, task.priority, task.has_duration, task.duration)
+        """Обновление существующей плитки задачи"""
+        tile = self.quadrants[quad_id]['task_widgets'].get(id(task))
+        if tile is not None:
+            tile.render(task)
+            self._set_task_duration(quad_id, id(task), self._task_duration(task))
 
     def _add_task_widget(self, task: Task, quad_id: int):
-        """Добавление нового виджета задачи"""
-        table = self.quadrants[quad_id]['table']
-        
-        # Создаем виджет
-        task_widget = self._create_task_widget(table, task, quad_id)
+        """Добавление плитки задачи: из пула или новой"""
+        tile, _ = self.tile_pool.acquire(self.TILE_KEY, self._create_task_widget)
+        tile.quadrant = quad_id
+        tile.render(task)
+        self._set_task_duration(quad_id, id(task), self._task_duration(task))
         
         # Сохраняем в кеши
-        self.quadrants[quad_id]['task_widgets'][task.id] = task_widget
-        self._task_widgets_cache[task.id] = task_widget
-        
-        # Сохраняем состояние
-        task_widget._task_state = (task.title, task.is_completed, task.priority, task.has_duration, task.duration)
+        self.quadrants[quad_id]['task_widgets'][id(task)] = tile
+        self._task_widgets_cache[id(task)] = tile
+
+    @staticmethod
+    def _task_duration(task: Task) -> int:
+        """Вклад задачи в длительность квадранта (без длительности - 30 минут)"""
+        return task.duration if task.has_duration else 30
+
+    def _set_task_duration(self, quad_id: int, key: int, minutes: Optional[int]):
+        """Поправка суммарной длительности квадранта на изменение одной задачи (key - id(task))"""
+        quad_data = self.quadrants[quad_id]
+        durations = quad_data['durations']
+        quad_data['total_duration'] -= durations.pop(key, 0)
+        if minutes is not None:
+            durations[key] = minutes
+            quad_data['total_duration'] += minutes
+
+    @staticmethod
+    def _grid_columns(num_tasks: int) -> int:
+        if num_tasks <= 4:
+            return 2
+        if num_tasks <= 9:
+            return 3
+        return 4
 
     def _update_quadrant_layout(self, quad_id: int, tasks: List[Task]):
-        """Обновление layout квадранта"""
+        """Обновление layout квадранта.
+
+        Перемещаются только плитки, чья ячейка изменилась; веса строк и
+        колонок трогаются только при смене формы сетки.
+        """
         quad_data = self.quadrants[quad_id]
         table = quad_data['table']
         
@@ -318,7 +469,7 @@ class QuadrantsWidget(SmartUpdateMixin):
             # Показываем пустой заполнитель
             if not quad_data['empty_label'].winfo_manager():
                 quad_data['empty_label'].pack(expand=True)
-            quad_data['info_label'].config(text="")
+            self._set_quadrant_info(quad_id, 0, 0)
             return
         
         # Скрываем пустой заполнитель
@@ -327,85 +478,64 @@ class QuadrantsWidget(SmartUpdateMixin):
         
         # Вычисляем оптимальную сетку
         num_tasks = len(tasks)
-        if num_tasks <= 4:
-            cols = 2
-        elif num_tasks <= 9:
-            cols = 3
-        else:
-            cols = 4
+        cols = self._grid_columns(num_tasks)
+        rows = (num_tasks + cols - 1) // cols
         
-        # Размещаем виджеты в сетке
+        # Размещаем в сетке только плитки, сменившие ячейку (или новые)
+        task_widgets = quad_data['task_widgets']
+        slots = quad_data['slots']
         for i, task in enumerate(tasks):
-            if task.id in quad_data['task_widgets']:
-                widget = quad_data['task_widgets'][task.id]
-                if widget.winfo_exists():
-                    row = i // cols
-                    col = i % cols
-                    widget.grid(row=row, column=col, padx=2, pady=2, sticky='nsew')
-        
-        # Настройка весов сетки
-        for i in range((num_tasks + cols - 1) // cols):
-            table.grid_rowconfigure(i, weight=1)
-        for i in range(cols):
-            table.grid_columnconfigure(i, weight=1)
-        
-        # Обновляем информацию
-        total_duration = sum(t.duration if t.has_duration else 30 for t in tasks)
-        hours = total_duration // 60
-        minutes = total_duration % 60
-        info_text = f"Задач: {len(tasks)} | {hours}ч {minutes}м"
-        
-        quad_data['info_label'].config(
-            text=info_text,
-            fg='red' if total_duration > 180 else 'black'
-        )
-
-    def _create_task_widget(self, parent, task: Task, quadrant: int) -> tk.Frame:
-        """Создание виджета для одной задачи (без чекбокса)"""
-        bg_color = get_completed_color() if task.is_completed else get_priority_color(task.priority)
-        
-        task_frame = tk.Frame(parent, bg=bg_color, relief='raised', bd=1)
-
-        content_frame = tk.Frame(task_frame, bg=bg_color)
-        content_frame.pack(fill='both', expand=True, padx=3, pady=3)
-
-        title_text = task.title[:20] + "..." if len(task.title) > 20 else task.title
-        if task.is_completed:
-            title_text = f"✓ {title_text}"
-            
-        title_label = tk.Label(
-            content_frame, 
-            text=title_text,
-            bg=bg_color,
-            fg='white', 
-            font=('Arial', 9, 'bold'),
-            wraplength=100, 
-            justify='center'
-        )
-        title_label._is_title = True  # Маркер для идентификации
-        title_label.pack(expand=True, pady=(5, 2))
-
-        # Длительность
-        duration_label = tk.Label(
-            content_frame, 
-            text=f"{task.duration}м",
-            bg=bg_color,
-            fg='white', 
-            font=('Arial', 8)
+            tile = task_widgets.get(id(task))
+            if tile is None:
+                continue
+            slot = (tile, i // cols, i % cols)
+            if slots.get(id(task)) != slot:
+                slots[id(task)] = slot
+                tile.frame.grid(in_=table, row=slot[1], column=slot[2], padx=2, pady=2, sticky='nsew')
+        
+        # Веса сетки - только при смене формы; лишние строки и колонки обнуляются
+        old_rows, old_cols = quad_data['grid_shape']
+        if (rows, cols) != (old_rows, old_cols):
+            for i in range(rows, old_rows):
+                table.grid_rowconfigure(i, weight=0)
+            for i in range(old_rows, rows):
+                table.grid_rowconfigure(i, weight=1)
+            for i in range(cols, old_cols):
+                table.grid_columnconfigure(i, weight=0)
+            for i in range(old_cols, cols):
+                table.grid_columnconfigure(i, weight=1)
+            quad_data['grid_shape'] = (rows, cols)
+
+        self._set_quadrant_info(quad_id, num_tasks, quad_data['total_duration'])
+
+    def _update_quadrant_info(self, quad_id: int, tasks: List[Task]):
+        """Количество задач и суммарная длительность в заголовке квадранта"""
+        self._set_quadrant_info(quad_id, len(tasks), sum(self._task_duration(t) for t in tasks))
+
+    def _set_quadrant_info(self, quad_id: int, count: int, total_duration: int):
+        """Заголовок квадранта; config - только если текст или цвет изменились"""
+        quad_data = self.quadrants[quad_id]
+        if count:
+            hours = total_duration // 60
+            minutes = total_duration % 60
+            info = (f"Задач: {count} | {hours}ч {minutes}м",
+                    'red' if total_duration > 180 else 'black')
+        else:
+            info = ("", 'black')
+
+        if info != quad_data['info']:
+            quad_data['info'] = info
+            quad_data['info_label'].config(text=info[0], fg=info[1])
+
+    def _create_task_widget(self) -> QuadrantTile:
+        """Создание плитки задачи (без чекбокса) в общей для квадрантов рамке"""
+        return QuadrantTile(
+            self.grid_frame,
+            on_click=self._on_task_click,
+            on_drag=self._on_task_drag,
+            on_release=self._on_task_release,
+            on_context_menu=self._show_context_menu,
         )
-        duration_label._is_duration = True  # Маркер для идентификации
-        
-        if task.has_duration:
-            duration_label.pack()
-
-        # События
-        for widget in [task_frame, content_frame, title_label]:
-            widget.bind("<Button-1>", lambda e, t=task: self._on_task_click(e, t))
-            widget.bind("<B1-Motion>", lambda e, t=task, w=task_frame: self._on_task_drag(e, t, w))
-            widget.bind("<ButtonRelease-1>", lambda e: self._on_task_release(e))
-            widget.bind("<Button-3>", lambda e, t=task, q=quadrant: self._show_context_menu(e, t, q))
-
-        return task_frame
 
     def _global_right_click_handler(self, event):
         """Глобальный обработчик правого клика для закрытия меню"""
@@ -464,64 +594,28 @@ class QuadrantsWidget(SmartUpdateMixin):
     def _on_task_click(self, event, task: Task):
         """Обработка клика по задаче"""
         self.select_task(task)
-        self.drag_data["task"] = task
-        self.drag_data["start_x"] = event.x_root
-        self.drag_data["start_y"] = event.y_root
+        self.drag.press(event, task)
 
     def _on_task_drag(self, event, task: Task, widget: tk.Widget):
         """Обработка перетаскивания задачи"""
-        if not self.drag_data["widget"]:
-            self.drag_data["widget"] = tk.Toplevel(self.task_manager.root)
-            self.drag_data["widget"].overrideredirect(True)
-            self.drag_data["widget"].attributes("-alpha", 0.8)
-            
-            drag_label = tk.Label(
-                self.drag_data["widget"],
-                text=task.title[:20] + "..." if len(task.title) > 20 else task.title,
-                bg=get_priority_color(task.priority),
-                fg='white',
-                font=('Arial', 9, 'bold'),
-                padx=10,
-                pady=5
-            )
-            drag_label.pack()
-        
-        x = event.x_root - 20
-        y = event.y_root - 10
-        self.drag_data["widget"].geometry(f"+{x}+{y}")
+        self.drag.motion(event)
 
     def _on_task_release(self, event):
-        """Обработка отпускания задачи"""
-        if self.drag_data["widget"]:
-            self.drag_data["widget"].destroy()
-            self.drag_data["widget"] = None
-
-    def _on_quadrant_enter(self, event, quadrant: int):
-        """Обработка входа в квадрант при перетаскивании"""
-        if self.drag_data["task"] and self.drag_data["widget"]:
-            self.quadrants[quadrant]['frame'].config(relief='groove', bd=4)
-
-    def _on_quadrant_leave(self, event, quadrant: int):
-        """Обработка выхода из квадранта при перетаскивании"""
-        if self.drag_data["task"] and self.drag_data["widget"]:
-            self.quadrants[quadrant]['frame'].config(relief='solid', bd=2)
-
-    def _on_quadrant_drop(self, event, quadrant: int):
-        """Обработка отпускания задачи в квадранте"""
-        if self.drag_data["task"] and self.drag_data["task"].quadrant != quadrant:
-            task = self.drag_data["task"]
-            logger.info(f"Dropping task '{task.title}' into quadrant {quadrant}")
-            
-            self.task_manager.move_task_to_quadrant(task, quadrant)
-            
-            # Сбрасываем визуальные эффекты только если была подсветка
-            if self.quadrants[quadrant]['frame']['relief'] == 'groove':
-                self.quadrants[quadrant]['frame'].config(relief='solid', bd=2)
-        
-        # Очищаем данные перетаскивания
-        self.drag_data["task"] = None
-        if self.drag_data["widget"]:
-            self.drag_data["widget"] = None
+        """Обработка отпускания задачи (цель определяет контроллер перетаскивания)"""
+        self.drag.release(event)
+
+    def _on_quadrant_enter(self, quadrant: int):
+        """Подсветка квадранта под перетаскиваемой задачей"""
+        self.quadrants[quadrant]['frame'].config(relief='groove', bd=4)
+
+    def _on_quadrant_leave(self, quadrant: int):
+        """Снятие подсветки квадранта"""
+        self.quadrants[quadrant]['frame'].config(relief='solid', bd=2)
+
+    def _on_quadrant_drop(self, task: Task, quadrant: int):
+        """Задача брошена в квадрант"""
+        logger.debug("Dropping task '%s' into quadrant %s", task.title, quadrant)
+        self.task_manager.move_task_to_quadrant(task, quadrant)
 
     def select_task(self, task: Task):
         """Выбор задачи"""
@@ -586,7 +680,7 @@ class QuadrantsWidget(SmartUpdateMixin):
         if not self.selected_task:
             return
 
-        logger.info(f"Moving selected task to quadrant {target_quadrant}")
+        logger.debug("Moving selected task to quadrant %s", target_quadrant)
         self.task_manager.move_task_to_quadrant(self.selected_task, target_quadrant)
         self.hide_context_menu()
 
@@ -612,7 +706,7 @@ class QuadrantsWidget(SmartUpdateMixin):
             return
 
         if messagebox.askyesno("Подтверждение", f"Удалить задачу '{self.selected_task.title}'?"):
-            self.task_manager.task_service.delete_task(self.selected_task.id)
+            self.task_manager.task_service.delete_task(self.selected_task.id, self.selected_task)
             self.hide_context_menu()
 
     def edit_start_time(self):
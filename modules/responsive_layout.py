@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Task Manager - Адаптивная компоновка главного окна
+"""
+
+from typing import Callable, Optional
+import logging
+
+from .scheduler import call_later, cancel_call
+
+logger = logging.getLogger(__name__)
+
+
+class ResponsiveLayout:
+    """Переключение горизонтальной/вертикальной компоновки по ширине окна.
+
+    Режим меняется только при выходе ширины за полосу гистерезиса вокруг
+    порога, а перекомпоновка откладывается до конца жеста изменения размера.
+    """
+
+    HORIZONTAL = 'horizontal'
+    VERTICAL = 'vertical'
+
+    def __init__(self, root, apply_layout: Callable[[str], None], threshold: int,
+                 hysteresis: int = 40, settle_ms: int = 150):
+        self.root = root
+        self.apply_layout = apply_layout
+        self.threshold = threshold
+        self.hysteresis = hysteresis
+        self.settle_ms = settle_ms
+
+        self.mode: Optional[str] = None
+        self._width: Optional[int] = None
+        self._settle_id = None
+
+        root.bind('<Configure>', self.on_configure, add='+')
+
+    def on_configure(self, event):
+        """<Configure> окна: перекомпоновка после паузы в изменении ширины"""
+        if event.widget != self.root or event.width == self._width:
+            return  # Дочерний виджет, перемещение окна или изменение только высоты
+
+        self._width = event.width
+        cancel_call(self.root, self._settle_id)
+        self._settle_id = call_later(self.root, self.settle_ms, self._on_settled)
+
+    def _on_settled(self):
+        """Изменение размера закончилось"""
+        self._settle_id = None
+        self.apply(self.mode_for_width(self._width))
+
+    def mode_for_width(self, width: int) -> str:
+        """Режим для ширины с учетом текущего (гистерезис вокруг порога)"""
+        if self.mode == self.VERTICAL:
+            return self.HORIZONTAL if width >= self.threshold + self.hysteresis else self.VERTICAL
+        if self.mode == self.HORIZONTAL:
+            return self.VERTICAL if width < self.threshold - self.hysteresis else self.HORIZONTAL
+        return self.VERTICAL if width < self.threshold else self.HORIZONTAL
+
+    def apply(self, mode: str):
+        """Применение режима (повтор текущего ничего не делает)"""
+        if mode == self.mode:
+            return
+        logger.debug("Switching layout %s -> %s (width %s)", self.mode, mode, self._width)
+        self.mode = mode
+        self.apply_layout(mode)
+
+    def close(self):
+        """Отмена отложенной перекомпоновки"""
+        cancel_call(self.root, self._settle_id)
+        self._settle_id = None
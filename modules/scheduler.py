@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Task Manager - Общий планировщик отложенных задач (один root.after на приложение)
+"""
+
+import heapq
+import itertools
+import math
+import time
+from typing import Any, Callable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledJob:
+    """Отложенная (или повторяющаяся) задача планировщика"""
+
+    __slots__ = ('callback', 'args', 'interval', 'deadline', 'visual', 'cancelled')
+
+    def __init__(self, callback: Callable, args: tuple, deadline: float, interval: Optional[float],
+                 visual: bool = False):
+        self.callback = callback
+        self.args = args
+        self.deadline = deadline
+        self.interval = interval  # Секунды между вызовами; None - однократно
+        self.visual = visual  # Только для видимого окна: ждет, пока планировщик приостановлен
+        self.cancelled = False
+
+    def cancel(self):
+        """Отмена (повторный вызов безопасен)"""
+        self.cancelled = True
+
+
+class Scheduler:
+    """Куча задач по сроку и один root.after на ближайшую из них.
+
+    Пока задач нет, таймер Tk не взведен - в простое приложение не
+    просыпается. Приостановка (окно свернуто) откладывает только задачи
+    с visual=True (часы, обновление экрана); доставка результатов БД и
+    событий продолжается. Отмененные задачи удаляются из кучи лениво,
+    когда до них доходит очередь.
+    """
+
+    _current: Optional['Scheduler'] = None
+
+    EARLY_TOLERANCE = 0.001  # after() может сработать на долю миллисекунды раньше срока
+
+    def __init__(self, root):
+        self.root = root
+        self._heap: List[Tuple[float, int, ScheduledJob]] = []
+        self._seq = itertools.count()
+        self._after_id = None
+        self._armed_deadline: Optional[float] = None
+        self._parked: List[ScheduledJob] = []  # Визуальные задачи на время приостановки
+        self._suspended = False
+        self._closed = False
+
+    @classmethod
+    def install(cls, root) -> 'Scheduler':
+        """Создание общего планировщика приложения"""
+        cls._current = cls(root)
+        return cls._current
+
+    @classmethod
+    def current(cls) -> Optional['Scheduler']:
+        """Общий планировщик (None - приложение его не создавало)"""
+        return cls._current
+
+    # Постановка задач
+
+    def call_later(self, delay_ms: float, callback: Callable, *args: Any,
+                   visual: bool = False) -> ScheduledJob:
+        """Однократный вызов через delay_ms (visual - приостанавливается со свернутым окном)"""
+        return self._push(ScheduledJob(callback, args, time.monotonic() + delay_ms / 1000, None, visual))
+
+    def call_every(self, interval_ms: float, callback: Callable, *args: Any,
+                   visual: bool = False) -> ScheduledJob:
+        """Повторяющийся вызов каждые interval_ms (первый - через interval_ms)"""
+        interval = interval_ms / 1000
+        return self._push(ScheduledJob(callback, args, time.monotonic() + interval, interval, visual))
+
+    def _push(self, job: ScheduledJob) -> ScheduledJob:
+        if job.visual and self._suspended:
+            self._parked.append(job)
+            return job
+        heapq.heappush(self._heap, (job.deadline, next(self._seq), job))
+        self._arm()
+        return job
+
+    # Приостановка (окно свернуто)
+
+    def suspend(self):
+        """Приостановка визуальных задач: они ждут resume(), остальные выполняются"""
+        if self._suspended:
+            return
+        self._suspended = True
+        self._parked.extend(job for _, _, job in self._heap if job.visual and not job.cancelled)
+        self._heap = [entry for entry in self._heap if not entry[2].visual]
+        heapq.heapify(self._heap)
+        self._disarm()
+        self._arm()
+        logger.debug("Scheduler suspended: %d visual jobs parked, %d running",
+                     len(self._parked), len(self._heap))
+
+    def resume(self):
+        """Возобновление: просроченные задачи выполняются один раз, без догоняющих повторов"""
+        if not self._suspended:
+            return
+        self._suspended = False
+        parked, self._parked = self._parked, []
+        for job in parked:
+            if not job.cancelled:
+                heapq.heappush(self._heap, (job.deadline, next(self._seq), job))
+        logger.debug("Scheduler resumed")
+        self._arm()
+
+    @property
+    def suspended(self) -> bool:
+        return self._suspended
+
+    def pending_count(self) -> int:
+        """Количество действующих задач (включая приостановленные)"""
+        return (sum(1 for _, _, job in self._heap if not job.cancelled)
+                + sum(1 for job in self._parked if not job.cancelled))
+
+    def close(self):
+        """Остановка планировщика (при завершении приложения)"""
+        self._closed = True
+        self._disarm()
+        self._heap.clear()
+        self._parked.clear()
+        if Scheduler._current is self:
+            Scheduler._current = None
+
+    # Таймер
+
+    def _arm(self):
+        """Взвести root.after на ближайшую задачу (перевзвести, если она раньше текущей)"""
+        if self._closed:
+            return
+
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            self._disarm()
+            return
+
+        deadline = self._heap[0][0]
+        if self._after_id is not None:
+            if self._armed_deadline <= deadline:
+                return
+            self._disarm()
+
+        delay_ms = max(0, math.ceil((deadline - time.monotonic()) * 1000))
+        self._armed_deadline = deadline
+        self._after_id = self.root.after(delay_ms, self._run)
+
+    def _disarm(self):
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass  # Окно уже уничтожено
+        self._after_id = None
+        self._armed_deadline = None
+
+    def _run(self):
+        """Выполнение наступивших задач (единственная точка входа из after)"""
+        self._after_id = None
+        self._armed_deadline = None
+
+        now = time.monotonic() + self.EARLY_TOLERANCE
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, _, job = heapq.heappop(heap)
+            if job.cancelled:
+                continue
+            if job.visual and self._suspended:
+                self._parked.append(job)  # Приостановлено из предыдущей задачи
+                continue
+            try:
+                job.callback(*job.args)
+            except Exception:
+                logger.exception("Error in scheduled job %s",
+                                 getattr(job.callback, '__qualname__', job.callback))
+            if job.interval is not None and not job.cancelled:
+                # Просроченный повтор (после простоя) переносится от текущего момента
+                job.deadline += job.interval
+                if job.deadline <= now:
+                    job.deadline = now + job.interval
+                if job.visual and self._suspended:
+                    self._parked.append(job)
+                else:
+                    heapq.heappush(heap, (job.deadline, next(self._seq), job))
+
+        self._arm()
+
+
+def call_later(widget, delay_ms: float, callback: Callable, *args: Any, visual: bool = False):
+    """Отложенный вызов через общий планировщик (after виджета, если его нет).
+
+    visual=True - только для видимого окна (ждет, пока планировщик приостановлен).
+    Возвращает ScheduledJob или id after - для cancel_call().
+    """
+    scheduler = Scheduler.current()
+    if scheduler is not None:
+        return scheduler.call_later(delay_ms, callback, *args, visual=visual)
+    return widget.after(int(delay_ms), callback, *args)
+
+
+def cancel_call(widget, handle):
+    """Отмена вызова, поставленного через call_later (None - ничего не делать)"""
+    if handle is None:
+        return
+    if isinstance(handle, ScheduledJob):
+        handle.cancel()
+        return
+    try:
+        widget.after_cancel(handle)
+    except Exception:
+        pass  # Окно уже уничтожено
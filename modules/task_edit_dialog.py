@@ -291,7 +291,7 @@ class TaskEditDialog:
 
         # Сохраняем выбор места сохранения
         if self.is_new_task and not hasattr(self.task, 'date_scheduled'):
-            self.task_manager.db.save_setting("last_save_location", date_option)
+            self.task_manager.async_db.write('save_setting', "last_save_location", date_option)
 
         # Обновляем объект задачи
         self.task.title = self.title_var.get().strip()
@@ -5,35 +5,140 @@ Task Manager - Виджет списка задач с инкременталь
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 import logging
 
 from .task_models import Task
 from .colors import get_priority_color, get_completed_color
 from .incremental_updater import IncrementalUpdater, SmartUpdateMixin
+from .tile_pool import TilePool
 
 logger = logging.getLogger(__name__)
 
 
+class TaskListTile:
+    """Плитка задачи списка: прямые ссылки на виджеты и последние отрисованные значения.
+
+    render() вызывает config только для изменившихся значений -
+    без обхода winfo_children() и маркеров на метках.
+    """
+
+    __slots__ = ('frame', 'main_info_frame', 'info_frame', 'plan_label', 'title_label',
+                 'info_label', 'task', 'state', '_bg', '_title', '_info', '_plan')
+
+    def __init__(self, parent, on_click, on_drag, on_release, on_context_menu):
+        self.task: Optional[Task] = None
+        self.state: Optional[tuple] = None
+        self._bg: Optional[str] = None
+        self._title: Optional[str] = None
+        self._info: Optional[str] = None
+        self._plan: Optional[str] = None
+
+        self.frame = tk.Frame(parent, relief='solid', bd=1, cursor='hand2')
+
+        self.main_info_frame = tk.Frame(self.frame)
+        self.main_info_frame.pack(fill='x', padx=5, pady=(3, 0))
+
+        # Метка есть всегда: плитку из пула можно отдать задаче с другим is_planned
+        self.plan_label = tk.Label(self.main_info_frame, font=('Arial', 8))
+        self.plan_label.pack(side='right', padx=2)
+
+        self.title_label = tk.Label(self.main_info_frame,
+                                    fg='white', font=('Arial', 9, 'bold'),
+                                    anchor='w')
+        self.title_label.pack(fill='x')
+
+        self.info_frame = tk.Frame(self.frame)
+        self.info_frame.pack(fill='x', padx=5, pady=(0, 3))
+
+        self.info_label = tk.Label(self.info_frame,
+                                   fg='white', font=('Arial', 8),
+                                   anchor='w')
+        self.info_label.pack(fill='x')
+
+        # Обработчики берут задачу из плитки, а не из замыкания
+        for widget in (self.frame, self.main_info_frame, self.title_label, self.info_frame, self.info_label):
+            widget.bind("<Button-1>", lambda e: on_click(e, self.task))
+            widget.bind("<B1-Motion>", lambda e: on_drag(e, self.task, self.frame))
+            widget.bind("<ButtonRelease-1>", on_release)
+            widget.bind("<Button-3>", lambda e: on_context_menu(e, self.task))
+
+    @staticmethod
+    def state_of(task: Task) -> tuple:
+        return (task.title, task.is_completed, task.priority, task.importance,
+                task.has_duration, task.duration, task.is_planned)
+
+    @staticmethod
+    def title_text(task: Task) -> str:
+        title = task.title
+        if len(title) > 25:
+            title = title[:22] + "..."
+        return f"✓ {title}" if task.is_completed else title
+
+    @staticmethod
+    def info_text(task: Task) -> str:
+        info_parts = [f"В:{task.importance}", f"С:{task.priority}"]
+        if task.has_duration:
+            info_parts.append(f"Д:{task.duration}м")
+        return " | ".join(info_parts)
+
+    def render(self, task: Task):
+        """Привязка к задаче и отрисовка только изменившихся значений"""
+        self.task = task
+        state = self.state_of(task)
+        if state == self.state:
+            return
+        self.state = state
+
+        bg = get_completed_color() if task.is_completed else get_priority_color(task.priority)
+        if bg != self._bg:
+            self._bg = bg
+            for widget in (self.frame, self.main_info_frame, self.plan_label,
+                           self.title_label, self.info_frame, self.info_label):
+                widget.config(bg=bg)
+
+        title = self.title_text(task)
+        if title != self._title:
+            self._title = title
+            self.title_label.config(text=title)
+
+        info = self.info_text(task)
+        if info != self._info:
+            self._info = info
+            self.info_label.config(text=info)
+
+        plan = "📅" if task.is_planned else ""
+        if plan != self._plan:
+            self._plan = plan
+            self.plan_label.config(text=plan)
+
+
 class TaskListWidget(SmartUpdateMixin):
     """Виджет списка задач с оптимизированными обновлениями"""
 
-    def __init__(self, parent, task_manager):
+    def __init__(self, parent, task_manager, tile_pool: Optional[TilePool] = None):
         super().__init__()
         self.parent = parent
         self.task_manager = task_manager
+        self.tile_pool = tile_pool if tile_pool is not None else TilePool()
         self.selected_task: Optional[Task] = None
         self.task_groups = {}  # Хранение групп задач
         self.group_widgets = {}  # Виджеты групп
         self.group_states = {}  # Состояния групп (свернута/развернута)
-        self.drag_data = {"task": None, "widget": None}
+        self.drag = task_manager.drag_controller
         self.updater = IncrementalUpdater()
         
         # Кеш для отслеживания состояния
-        self._task_widgets_cache = {}  # task_id -> widget
+        # Отдельно по вкладкам: при переходе задачи между вкладками новый
+        # виджет появляется раньше, чем старый возвращается в пул.
+        # Ключ - id(task): у новых задач id еще 0, а экземпляр каноничен
+        self._task_widgets_cache = {
+            'active': {},  # id(task) -> TaskListTile
+            'completed': {}
+        }
         self._current_tasks = {
-            'active': {},  # type_name -> set of task_ids
-            'completed': {}  # type_name -> set of task_ids
+            'active': {},  # type_name -> set of id(task)
+            'completed': {}  # type_name -> set of id(task)
         }
         
         self.setup_task_list()
@@ -74,6 +179,13 @@ class TaskListWidget(SmartUpdateMixin):
         self.notebook = ttk.Notebook(self.main_frame)
         self.notebook.pack(fill='both', expand=True, padx=5, pady=5)
 
+        # Задача из квадранта, брошенная на список, возвращается в список дня
+        self.drag.add_target(
+            self.main_frame,
+            on_drop=lambda t: self.task_manager.move_task_to_quadrant(t, 0),
+            accepts=lambda t: t.quadrant != 0,
+        )
+
         # Вкладка "Активные"
         self.active_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.active_frame, text="Активные (0)")
@@ -144,10 +256,10 @@ class TaskListWidget(SmartUpdateMixin):
         self._update_tab_incremental(self.active_scrollable_frame, active_groups, "active", self.active_empty_label)
         self._update_tab_incremental(self.completed_scrollable_frame, completed_groups, "completed", self.completed_empty_label)
         
-        # Обновляем заголовки только если изменилось количество
-        active_count = len(active_tasks)
-        completed_count = len(completed_tasks)
-        
+        self._update_tab_titles(len(active_tasks), len(completed_tasks))
+
+    def _update_tab_titles(self, active_count: int, completed_count: int):
+        """Обновление заголовков вкладок только если изменилось количество"""
         current_active_text = self.notebook.tab(0, "text")
         current_completed_text = self.notebook.tab(1, "text")
         
@@ -158,6 +270,114 @@ class TaskListWidget(SmartUpdateMixin):
             self.notebook.tab(0, text=new_active_text)
         if current_completed_text != new_completed_text:
             self.notebook.tab(1, text=new_completed_text)
+
+    def update_task(self, task: Task, visible: bool = True):
+        """Точечное обновление одной задачи: только ее старая и новая группа"""
+        old_place = self._find_place(id(task))
+        new_place = self._place_for(task) if visible else None
+
+        if old_place == new_place:
+            tile = self._task_widgets_cache[old_place[0]].get(id(task)) if old_place else None
+            if tile is not None:
+                tile.render(task)
+            return
+
+        if old_place is not None:
+            self._remove_from_group(id(task), *old_place)
+        if new_place is not None:
+            self._add_to_group(task, *new_place)
+        self._update_counts()
+
+    def remove_task(self, task_id: int) -> bool:
+        """Удаление задачи из ее группы без прохода по списку.
+
+        False - задача в списке не найдена (или без id не опознается).
+        """
+        if not task_id:
+            return False
+
+        for widgets in self._task_widgets_cache.values():
+            for key, tile in widgets.items():
+                if tile.task is not None and tile.task.id == task_id:
+                    self._remove_from_group(key, *self._find_place(key))
+                    self._update_counts()
+                    return True
+        return False
+
+    def _find_place(self, key: int) -> Optional[Tuple[str, str]]:
+        """(вкладка, группа), где задача (key - id(task)) сейчас показана"""
+        for tab_type, groups in self._current_tasks.items():
+            for type_name, keys in groups.items():
+                if key in keys:
+                    return tab_type, type_name
+        return None
+
+    def _place_for(self, task: Task) -> Optional[Tuple[str, str]]:
+        """(вкладка, группа) задачи по ее состоянию; None - в списке не показывается"""
+        if task.is_completed:
+            tab_type = 'completed'
+        elif task.quadrant == 0:
+            tab_type = 'active'
+        else:
+            return None
+
+        for task_type in self.task_manager.get_task_types():
+            if task_type.id == task.task_type_id:
+                return tab_type, task_type.name
+        return tab_type, "Без типа"
+
+    def _tab_widgets(self, tab_type: str):
+        """Прокручиваемая область и пустой заполнитель вкладки"""
+        if tab_type == 'active':
+            return self.active_scrollable_frame, self.active_empty_label
+        return self.completed_scrollable_frame, self.completed_empty_label
+
+    def _remove_from_group(self, key: int, tab_type: str, type_name: str):
+        """Удаление виджета задачи (key - id(task)) из группы"""
+        groups = self._current_tasks[tab_type]
+        task_ids = groups[type_name]
+        task_ids.discard(key)
+
+        self._release_task_widget(key, tab_type)
+
+        group_data = self.group_widgets[f"{tab_type}_groups"][type_name]
+        if task_ids:
+            group_data['header_label'].config(text=f"{type_name} ({len(task_ids)})")
+        else:
+            del groups[type_name]
+            group_data['frame'].pack_forget()
+
+        if not groups:
+            _, empty_label = self._tab_widgets(tab_type)
+            if not empty_label.winfo_manager():
+                empty_label.pack(expand=True, pady=20)
+
+    def _add_to_group(self, task: Task, tab_type: str, type_name: str):
+        """Добавление виджета задачи в группу (группа создается при необходимости)"""
+        parent_frame, empty_label = self._tab_widgets(tab_type)
+        if empty_label.winfo_manager():
+            empty_label.pack_forget()
+
+        group_widgets = self.group_widgets.setdefault(f"{tab_type}_groups", {})
+        task_ids = self._current_tasks[tab_type].setdefault(type_name, set())
+        task_ids.add(id(task))
+
+        if type_name not in group_widgets:
+            self._create_group_widget(parent_frame, type_name, [task], tab_type)
+            return
+
+        group_data = group_widgets[type_name]
+        self._create_task_widget(group_data['container'], task, tab_type)
+        group_data['header_label'].config(text=f"{type_name} ({len(task_ids)})")
+        if not group_data['frame'].winfo_manager():
+            group_data['frame'].pack(fill='x', pady=(0, 5))
+
+    def _update_counts(self):
+        """Заголовки вкладок по текущим группам"""
+        self._update_tab_titles(
+            sum(len(ids) for ids in self._current_tasks['active'].values()),
+            sum(len(ids) for ids in self._current_tasks['completed'].values()),
+        )
     
     def _group_tasks_by_type(self, tasks: List[Task], type_map: Dict[int, any]) -> Dict[str, List[Task]]:
         """Группировка задач по типам"""
@@ -180,17 +400,20 @@ class TaskListWidget(SmartUpdateMixin):
             self.group_widgets[group_key] = {}
         
         current_groups = self._current_tasks[tab_type]
-        new_groups = {type_name: {t.id for t in tasks} for type_name, tasks in groups.items()}
+        new_groups = {type_name: {id(t) for t in tasks} for type_name, tasks in groups.items()}
         
         # Определяем изменения на уровне групп
         all_type_names = set(current_groups.keys()) | set(new_groups.keys())
         
         # Если нет задач
         if not groups:
-            # Скрываем все группы
+            # Скрываем все группы, их плитки - в пул
             for widget_data in self.group_widgets[group_key].values():
                 if widget_data['frame'].winfo_exists():
                     widget_data['frame'].pack_forget()
+            for task_ids in current_groups.values():
+                for task_id in task_ids:
+                    self._release_task_widget(task_id, tab_type)
             
             # Показываем пустой заполнитель
             if not empty_label.winfo_manager():
@@ -203,10 +426,16 @@ class TaskListWidget(SmartUpdateMixin):
         if empty_label.winfo_manager():
             empty_label.pack_forget()
         
+        # Сначала все плитки, ушедшие из групп, - в пул: задача, перешедшая в группу
+        # раньше по порядку, иначе получила бы новую плитку до возврата старой
+        for type_name, current_task_ids in current_groups.items():
+            for key in current_task_ids - new_groups.get(type_name, set()):
+                self._release_task_widget(key, tab_type)
+
         # Обновляем группы
         for type_name in sorted(all_type_names):
             if type_name not in new_groups:
-                # Группа удалена
+                # Группа удалена (ее плитки уже в пуле)
                 if type_name in self.group_widgets[group_key]:
                     self.group_widgets[group_key][type_name]['frame'].pack_forget()
             else:
@@ -238,86 +467,27 @@ class TaskListWidget(SmartUpdateMixin):
             if header_label['text'] != new_text:
                 header_label.config(text=new_text)
         
-        # Определяем изменения
+        # Определяем изменения (плитки ушедших задач уже возвращены в пул)
         added_ids = new_ids - current_ids
-        removed_ids = current_ids - new_ids
         common_ids = current_ids & new_ids
         
         container = group_data['container']
-        
-        # Удаляем виджеты удаленных задач
-        for task_id in removed_ids:
-            if task_id in self._task_widgets_cache:
-                widget = self._task_widgets_cache[task_id]
-                if widget.winfo_exists():
-                    widget.destroy()
-                del self._task_widgets_cache[task_id]
+        widgets = self._task_widgets_cache[tab_type]
         
         # Обновляем существующие задачи
         for task in tasks:
-            if task.id in common_ids and task.id in self._task_widgets_cache:
-                widget = self._task_widgets_cache[task.id]
-                if widget.winfo_exists() and self._task_changed(task, widget):
-                    self._update_task_widget_properties(widget, task)
+            if id(task) in common_ids and id(task) in widgets:
+                widgets[id(task)].render(task)
         
         # Добавляем новые задачи
         for task in tasks:
-            if task.id in added_ids:
-                self._create_task_widget(container, task)
+            if id(task) in added_ids:
+                self._create_task_widget(container, task, tab_type)
         
         # Обеспечиваем видимость группы
         if not group_data['frame'].winfo_manager():
             group_data['frame'].pack(fill='x', pady=(0, 5))
     
-    def _task_changed(self, task: Task, widget: tk.Widget) -> bool:
-        """Проверка, изменилась ли задача"""
-        if not hasattr(widget, '_task_state'):
-            return True
-        
-        old_state = widget._task_state
-        new_state = (task.title, task.is_completed, task.priority, task.importance, task.has_duration, task.duration)
-        
-        return old_state != new_state
-    
-    def _update_task_widget_properties(self, widget: tk.Widget, task: Task):
-        """Обновление свойств виджета задачи"""
-        # Обновляем цвет
-        new_color = get_completed_color() if task.is_completed else get_priority_color(task.priority)
-        current_color = widget.cget('bg')
-        
-        if current_color != new_color:
-            widget.config(bg=new_color)
-            # Обновляем дочерние виджеты
-            for child in widget.winfo_children():
-                if isinstance(child, tk.Frame):
-                    child.config(bg=new_color)
-                    for subchild in child.winfo_children():
-                        if isinstance(subchild, tk.Label):
-                            subchild.config(bg=new_color)
-        
-        # Обновляем текст
-        for child in widget.winfo_children():
-            if isinstance(child, tk.Frame):
-                for subchild in child.winfo_children():
-                    if isinstance(subchild, tk.Label) and hasattr(subchild, '_is_title'):
-                        title = task.title
-                        if len(title) > 25:
-                            title = title[:22] + "..."
-                        if task.is_completed:
-                            title = f"✓ {title}"
-                        subchild.config(text=title)
-                    elif isinstance(subchild, tk.Label) and hasattr(subchild, '_is_info'):
-                        info_parts = []
-                        info_parts.append(f"В:{task.importance}")
-                        info_parts.append(f"С:{task.priority}")
-                        if task.has_duration:
-                            info_parts.append(f"Д:{task.duration}м")
-                        info_text = " | ".join(info_parts)
-                        subchild.config(text=info_text)
-        
-        # Сохраняем новое состояние
-        widget._task_state = (task.title, task.is_completed, task.priority, task.importance, task.has_duration, task.duration)
-    
     def _create_group_widget(self, parent_frame, type_name: str, tasks: List[Task], tab_type: str):
         """Создание виджета группы задач"""
         group_frame = tk.Frame(parent_frame, bg='white')
@@ -359,7 +529,7 @@ class TaskListWidget(SmartUpdateMixin):
         
         # Добавляем задачи
         for task in tasks:
-            self._create_task_widget(tasks_container, task)
+            self._create_task_widget(tasks_container, task, tab_type)
         
         # Обработчик сворачивания/разворачивания
         def toggle_group(e):
@@ -380,104 +550,49 @@ class TaskListWidget(SmartUpdateMixin):
             container.pack_forget()
             toggle_widget.config(text="▶")
     
-    def _create_task_widget(self, parent_frame, task: Task):
-        """Создание виджета задачи"""
-        bg_color = get_completed_color() if task.is_completed else get_priority_color(task.priority)
-
-        task_frame = tk.Frame(parent_frame,
-                             bg=bg_color,
-                             relief='solid', bd=1,
-                             cursor='hand2')
-        task_frame.pack(fill='x', pady=2)
-
-        main_info_frame = tk.Frame(task_frame, bg=bg_color)
-        main_info_frame.pack(fill='x', padx=5, pady=(3, 0))
-
-        if task.is_planned:
-            plan_label = tk.Label(main_info_frame, text="📅",
-                                 bg=bg_color,
-                                 font=('Arial', 8))
-            plan_label.pack(side='right', padx=2)
-
-        title = task.title
-        if len(title) > 25:
-            title = title[:22] + "..."
-        
-        if task.is_completed:
-            title = f"✓ {title}"
-
-        title_label = tk.Label(main_info_frame, text=title,
-                              bg=bg_color,
-                              fg='white', font=('Arial', 9, 'bold'),
-                              anchor='w')
-        title_label._is_title = True  # Маркер
-        title_label.pack(fill='x')
-
-        info_frame = tk.Frame(task_frame, bg=bg_color)
-        info_frame.pack(fill='x', padx=5, pady=(0, 3))
-
-        info_parts = []
-        info_parts.append(f"В:{task.importance}")
-        info_parts.append(f"С:{task.priority}")
-        if task.has_duration:
-            info_parts.append(f"Д:{task.duration}м")
-        
-        info_text = " | ".join(info_parts)
-        
-        info_label = tk.Label(info_frame, text=info_text,
-                             bg=bg_color,
-                             fg='white', font=('Arial', 8),
-                             anchor='w')
-        info_label._is_info = True  # Маркер
-        info_label.pack(fill='x')
-
-        # События
-        for widget in [task_frame, main_info_frame, title_label, info_frame, info_label]:
-            widget.bind("<Button-1>", lambda e, t=task: self._on_task_click(e, t))
-            widget.bind("<B1-Motion>", lambda e, t=task, w=task_frame: self._on_task_drag(e, t, w))
-            widget.bind("<ButtonRelease-1>", lambda e: self._on_task_release(e))
-            widget.bind("<Button-3>", lambda e, t=task: self._show_context_menu(e, t))
-        
-        # Сохраняем в кеш
-        self._task_widgets_cache[task.id] = task_frame
-        task_frame._task_state = (task.title, task.is_completed, task.priority, task.importance, task.has_duration, task.duration)
+    def _create_task_widget(self, container, task: Task, tab_type: str):
+        """Плитка задачи в группе: из пула вкладки или новая"""
+        parent_frame, _ = self._tab_widgets(tab_type)
+        tile, _ = self.tile_pool.acquire(
+            ('list', tab_type), lambda: self._build_task_widget(parent_frame))
+        tile.render(task)
+
+        # Плитка - дочерний виджет вкладки, размещается в контейнере группы;
+        # группа, созданная позже плитки, иначе закрыла бы ее
+        tile.frame.pack(in_=container, fill='x', pady=2)
+        tile.frame.lift()
+
+        self._task_widgets_cache[tab_type][id(task)] = tile
+
+    def _release_task_widget(self, key: int, tab_type: str):
+        """Возврат плитки задачи (key - id(task)) в пул вкладки"""
+        tile = self._task_widgets_cache[tab_type].pop(key, None)
+        if tile is not None:
+            tile.task = None
+            self.tile_pool.release(('list', tab_type), tile)
+
+    def _build_task_widget(self, parent_frame) -> TaskListTile:
+        """Создание плитки задачи"""
+        return TaskListTile(
+            parent_frame,
+            on_click=self._on_task_click,
+            on_drag=self._on_task_drag,
+            on_release=self._on_task_release,
+            on_context_menu=self._show_context_menu,
+        )
 
     def _on_task_click(self, event, task: Task):
         """Обработка клика по задаче"""
         self.select_task(task)
-        self.drag_data["task"] = task
-        self.drag_data["start_x"] = event.x_root
-        self.drag_data["start_y"] = event.y_root
+        self.drag.press(event, task)
 
     def _on_task_drag(self, event, task: Task, widget: tk.Widget):
         """Обработка перетаскивания"""
-        if not self.drag_data["widget"]:
-            self.drag_data["widget"] = tk.Toplevel(self.task_manager.root)
-            self.drag_data["widget"].overrideredirect(True)
-            self.drag_data["widget"].attributes("-alpha", 0.8)
-            
-            drag_label = tk.Label(
-                self.drag_data["widget"],
-                text=task.title[:20] + "..." if len(task.title) > 20 else task.title,
-                bg=get_priority_color(task.priority),
-                fg='white',
-                font=('Arial', 9, 'bold'),
-                padx=10,
-                pady=5
-            )
-            drag_label.pack()
-        
-        x = event.x_root - 20
-        y = event.y_root - 10
-        self.drag_data["widget"].geometry(f"+{x}+{y}")
+        self.drag.motion(event)
 
     def _on_task_release(self, event):
-        """Обработка отпускания задачи"""
-        if self.drag_data["widget"]:
-            self.drag_data["widget"].destroy()
-            self.drag_data["widget"] = None
-        
-        self.drag_data["task"] = None
+        """Обработка отпускания задачи (цель определяет контроллер перетаскивания)"""
+        self.drag.release(event)
 
     def select_task(self, task: Task):
         """Выбор задачи"""
@@ -536,13 +651,13 @@ class TaskListWidget(SmartUpdateMixin):
     def move_selected_to_quadrant(self, quadrant: int):
         """Перемещение выбранной задачи в квадрант"""
         if self.selected_task:
-            logger.info(f"Moving task to quadrant {quadrant}")
+            logger.debug("Moving task to quadrant %s", quadrant)
             self.task_manager.move_task_to_quadrant(self.selected_task, quadrant)
 
     def move_selected_to_backlog(self):
         """Перемещение выбранной задачи в бэклог"""
         if self.selected_task:
-            logger.info("Moving task to backlog")
+            logger.debug("Moving task to backlog")
             self.task_manager.move_task_to_backlog(self.selected_task)
 
     def edit_selected_task(self):
@@ -557,4 +672,4 @@ class TaskListWidget(SmartUpdateMixin):
             return
 
         if messagebox.askyesno("Подтверждение", f"Удалить задачу '{self.selected_task.title}'?"):
-            self.task_manager.task_service.delete_task(self.selected_task.id)
\ No newline at end of file
+            self.task_manager.task_service.delete_task(self.selected_task.id, self.selected_task)
\ No newline at end of file
@@ -3,9 +3,9 @@
 Task Manager - Модели данных
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 
 @dataclass
@@ -39,8 +39,83 @@ class Task:
     def __post_init__(self):
         if not self.date_created:
             self.date_created = datetime.now().isoformat()
+        # Отслеживание изменений начинается после создания объекта
+        object.__setattr__(self, '_dirty', set())
+
+    def __setattr__(self, name: str, value: Any):
+        dirty = self.__dict__.get('_dirty')
+        if dirty is not None and name in TASK_TRACKED_FIELDS and self.__dict__.get(name) != value:
+            dirty.add(name)
+        object.__setattr__(self, name, value)
+
+    @property
+    def is_dirty(self) -> bool:
+        """Есть ли несохраненные изменения полей"""
+        return bool(self.__dict__.get('_dirty'))
+
+    def changed_fields(self) -> Set[str]:
+        """Поля, измененные после загрузки или последнего take_changes()"""
+        return set(self.__dict__.get('_dirty', ()))
+
+    def take_changes(self) -> Dict[str, Any]:
+        """Снимок измененных полей со сбросом отметок (вызывать на потоке UI)"""
+        dirty = self.__dict__.get('_dirty')
+        if not dirty:
+            return {}
+        changes = {name: self.__dict__[name] for name in dirty}
+        dirty.clear()
+        return changes
+
+    def mark_clean(self):
+        """Сброс отметок об изменениях (объект совпадает с БД)"""
+        object.__setattr__(self, '_dirty', set())
+
+    def snapshot(self) -> 'Task':
+        """Отсоединенная копия полей для потока записи (вызывать на потоке UI)"""
+        copy = Task.__new__(Task)
+        state = dict(self.__dict__)
+        state['_dirty'] = set()
+        object.__setattr__(copy, '__dict__', state)
+        return copy
 
     @property
     def is_planned(self) -> bool:
         """Запланирована ли задача (перемещена в квадрант)"""
-        return self.quadrant > 0
\ No newline at end of file
+        return self.quadrant > 0
+
+
+# Поля, изменения которых попадают в UPDATE (id и дата создания не меняются)
+TASK_TRACKED_FIELDS = frozenset(f.name for f in fields(Task)) - {'id', 'date_created'}
+
+# Колонки tasks в порядке полей Task - явный список для всех SELECT
+TASK_COLUMNS = tuple(f.name for f in fields(Task))
+
+
+def tasks_from_rows(rows: Iterable[tuple]) -> List[Task]:
+    """Быстрое создание Task из строк SELECT по TASK_COLUMNS.
+
+    Минует __init__/__post_init__ и __setattr__ с отслеживанием изменений:
+    распаковка кортежа и готовый __dict__ на объект.
+    """
+    new = Task.__new__
+    set_dict = object.__setattr__
+    tasks = []
+    append = tasks.append
+
+    for (task_id, title, content, importance, duration, has_duration, priority,
+         task_type_id, is_completed, quadrant, date_created, date_scheduled,
+         is_recurring, recurrence_pattern, move_count) in rows:
+        task = new(Task)
+        set_dict(task, '__dict__', {
+            'id': task_id, 'title': title, 'content': content,
+            'importance': importance, 'duration': duration,
+            'has_duration': bool(has_duration), 'priority': priority,
+            'task_type_id': task_type_id, 'is_completed': bool(is_completed),
+            'quadrant': quadrant, 'date_created': date_created,
+            'date_scheduled': date_scheduled or '', 'is_recurring': bool(is_recurring),
+            'recurrence_pattern': recurrence_pattern or '', 'move_count': move_count or 0,
+            '_dirty': set(),
+        })
+        append(task)
+
+    return tasks
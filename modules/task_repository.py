@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+Task Manager - Репозиторий задач в памяти (identity map)
+"""
+
+from dataclasses import fields
+from typing import Callable, Dict, List, Optional, Set, Tuple
+import logging
+
+from .task_models import Task
+from .database import DatabaseManager
+from .async_database import AsyncDatabase
+
+logger = logging.getLogger(__name__)
+
+BACKLOG = ''  # Ключ бэклога в индексе по датам
+
+
+class TaskRepository:
+    """Один экземпляр Task на id, индексы по дате/квадранту/бэклогу, запись насквозь.
+
+    Память - источник истины для UI: изменения сразу применяются к индексам,
+    а в БД уходят через поток записи AsyncDatabase. База читается в фоне
+    только при первом обращении к дате (или после invalidate).
+    """
+
+    def __init__(self, db: DatabaseManager, async_db: AsyncDatabase):
+        self.db = db
+        self.async_db = async_db
+
+        self._by_id: Dict[int, Task] = {}
+        # дата -> квадрант -> задачи ('' - бэклог)
+        self._by_date: Dict[str, Dict[int, List[Task]]] = {}
+        # id(task) -> (дата, квадрант), под которыми задача лежит в индексе
+        self._positions: Dict[int, Tuple[str, int]] = {}
+        self._loaded_dates: Set[str] = set()
+        self._loading: Dict[str, List[Callable]] = {}  # дата -> callback'и идущего чтения
+
+        self._unsaved: List[Task] = []   # Новые задачи, id которых еще не назначен
+        self._deleting: List[Task] = []  # Удаленные в памяти, но еще не в БД
+
+    # Чтение
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """Каноничный экземпляр задачи по id (только из памяти)"""
+        return self._by_id.get(task_id)
+
+    def is_loaded(self, date_str: str) -> bool:
+        """Загружена ли дата из БД"""
+        return date_str in self._loaded_dates
+
+    def indexed_date(self, task: Task) -> Optional[str]:
+        """Дата, под которой задача лежит в индексе (до применения ее изменений)"""
+        key = self._positions.get(id(task))
+        if key is None and task.id:
+            canonical = self._by_id.get(task.id)
+            if canonical is not None:
+                key = self._positions.get(id(canonical))
+        return key[0] if key is not None else None
+
+    def get_tasks_for_date(self, date_str: str,
+                           on_loaded: Optional[Callable[[List[Task]], None]] = None) -> Dict[int, List[Task]]:
+        """Задачи даты по квадрантам из памяти; промах читается в фоне и сообщается в on_loaded"""
+        if date_str not in self._loaded_dates:
+            self.load_async(date_str, on_loaded or (lambda _: None))
+
+        quadrants = self._by_date.get(date_str, {})
+        return {i: list(quadrants.get(i, ())) for i in range(5)}
+
+    def get_quadrant_tasks(self, date_str: str, quadrant: int) -> List[Task]:
+        """Задачи одного квадранта даты из памяти"""
+        return list(self._by_date.get(date_str, {}).get(quadrant, ()))
+
+    def get_cached_tasks(self, date_str: str) -> List[Task]:
+        """Задачи даты из памяти без обращения к БД"""
+        tasks = []
+        for quadrant_tasks in self._by_date.get(date_str, {}).values():
+            tasks.extend(quadrant_tasks)
+        return tasks
+
+    def load_async(self, date_str: str, callback: Callable[[List[Task]], None]):
+        """Задачи даты (BACKLOG - бэклог) для callback; промах читается в фоне"""
+        if date_str in self._loaded_dates:
+            callback(self.get_cached_tasks(date_str))
+            return
+
+        # Повторные запросы той же даты ждут уже идущего чтения
+        waiting = self._loading.get(date_str)
+        if waiting is not None:
+            waiting.append(callback)
+            return
+        self._loading[date_str] = [callback]
+
+        def on_loaded(tasks: List[Task]):
+            self._merge(tasks, date_str)
+            cached = self.get_cached_tasks(date_str)
+            for waiter in self._loading.pop(date_str, ()):
+                waiter(cached)
+
+        if date_str == BACKLOG:
+            self.async_db.read('get_tasks', include_backlog=True, callback=on_loaded, after_writes=True)
+        else:
+            self.async_db.read('get_tasks', date_str, include_backlog=False,
+                               callback=on_loaded, after_writes=True)
+
+    def invalidate(self, date_str: str = None):
+        """Перечитать дату (или все даты) из БД при следующем обращении"""
+        if date_str is None:
+            self._loaded_dates.clear()
+        else:
+            self._loaded_dates.discard(date_str)
+
+    # Запись (только в памяти - БД обновляет TaskService)
+
+    def add(self, task: Task) -> Task:
+        """Регистрация новой задачи"""
+        if task.id:
+            self._by_id[task.id] = task
+        else:
+            self._unsaved.append(task)
+        self._index(task)
+        return task
+
+    def save(self, task: Task) -> Task:
+        """Применение изменений задачи к индексам; возвращает каноничный экземпляр"""
+        if id(task) in self._positions:
+            self._index(task)
+            return task
+
+        canonical = self._by_id.get(task.id) if task.id else None
+        if canonical is None:
+            return self.add(task)
+
+        # Пришла копия - переносим поля в каноничный экземпляр (с отметками изменений)
+        for field in fields(Task):
+            setattr(canonical, field.name, getattr(task, field.name))
+        self._index(canonical)
+        return canonical
+
+    def remove(self, task: Task):
+        """Удаление задачи из памяти"""
+        self._unindex(task)
+        if task.id and self._by_id.get(task.id) is task:
+            del self._by_id[task.id]
+        self._unsaved = [t for t in self._unsaved if t is not task]
+        self._deleting.append(task)
+
+    def mark_stored(self, task: Task, task_id: int):
+        """Запись задачи в БД завершена (на потоке Tk): новая задача получает id"""
+        if task.id or not task_id:
+            return
+        task.id = task_id
+        if any(t is task for t in self._unsaved):
+            self._unsaved = [t for t in self._unsaved if t is not task]
+            self._by_id[task_id] = task
+
+    def mark_deleted(self, task: Task):
+        """Удаление задачи записано в БД"""
+        self._deleting = [t for t in self._deleting if t is not task]
+
+    # Внутреннее
+
+    def _merge(self, loaded: List[Task], date_str: str):
+        """Слияние прочитанных строк с памятью: известные id остаются прежними экземплярами"""
+        # Чтение идет после записей (after_writes), и ответы записей приходят раньше -
+        # новые задачи выборки уже получили id через mark_stored
+        deleting = {t.id for t in self._deleting if t.id}
+
+        for fresh in loaded:
+            if fresh.id in deleting or fresh.id in self._by_id:
+                # Память новее БД: известная задача остается там, где она в памяти
+                continue
+            self._by_id[fresh.id] = fresh
+            self._index(fresh)
+
+        self._loaded_dates.add(date_str)
+        logger.debug("Merged %d tasks for date %r", len(loaded), date_str)
+
+    def _index(self, task: Task):
+        """Размещение задачи в индексе по ее текущим дате и квадранту"""
+        key = (task.date_scheduled or BACKLOG, task.quadrant)
+        old_key = self._positions.get(id(task))
+        if old_key == key:
+            return
+
+        if old_key is not None:
+            self._unindex(task)
+
+        date_str, quadrant = key
+        self._by_date.setdefault(date_str, {}).setdefault(quadrant, []).append(task)
+        self._positions[id(task)] = key
+
+    def _unindex(self, task: Task):
+        """Удаление задачи из индекса по дате/квадранту"""
+        key = self._positions.pop(id(task), None)
+        if key is None:
+            return
+
+        date_str, quadrant = key
+        quadrants = self._by_date.get(date_str, {})
+        bucket = quadrants.get(quadrant)
+        if bucket is not None:
+            quadrants[quadrant] = [t for t in bucket if t is not task]
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Task Manager - Пул виджетов-плиток задач
+"""
+
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TilePool:
+    """Скрытые плитки для повторного использования вместо destroy/create.
+
+    Плитки хранятся по ключу вида (например, ('quadrant',) или ('list', вкладка)):
+    виджет Tk нельзя перенести к другому родителю, поэтому плитки одного
+    ключа создаются у общего предка и размещаются в нужном контейнере через in_.
+    Свободных плиток ключа не больше high_water - лишние уничтожаются.
+    Плитка - виджет или объект представления с корневым виджетом в атрибуте frame.
+    """
+
+    def __init__(self, high_water: int = 64):
+        self.high_water = high_water
+        self._free: Dict[Hashable, List[Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.destroyed = 0
+
+    def acquire(self, key: Hashable, create: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Плитка из пула (или новая от create); второй элемент - True, если плитка из пула"""
+        free = self._free.get(key)
+        while free:
+            tile = free.pop()
+            if self._frame(tile).winfo_exists():
+                self.hits += 1
+                return tile, True
+        self.misses += 1
+        return create(), False
+
+    def release(self, key: Hashable, tile):
+        """Возврат плитки: снимается с экрана и ждет следующего acquire"""
+        widget = self._frame(tile)
+        if not widget.winfo_exists():
+            return
+
+        manager = widget.winfo_manager()
+        if manager == 'grid':
+            widget.grid_forget()
+        elif manager == 'pack':
+            widget.pack_forget()
+        elif manager == 'place':
+            widget.place_forget()
+
+        free = self._free.setdefault(key, [])
+        if len(free) >= self.high_water:
+            widget.destroy()
+            self.destroyed += 1
+        else:
+            free.append(tile)
+
+    def clear(self, key: Hashable = None):
+        """Уничтожение свободных плиток ключа (или всех)"""
+        keys = [key] if key is not None else list(self._free)
+        for k in keys:
+            for tile in self._free.pop(k, ()):
+                widget = self._frame(tile)
+                if widget.winfo_exists():
+                    widget.destroy()
+                    self.destroyed += 1
+
+    @staticmethod
+    def _frame(tile):
+        return getattr(tile, 'frame', tile)
+
+    def stats(self) -> Dict[str, Any]:
+        """Попадания/промахи и число свободных плиток по ключам"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'destroyed': self.destroyed,
+            'idle': {key: len(free) for key, free in self._free.items()},
+        }
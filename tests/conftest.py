@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Task Manager - Общие фикстуры тестов (без дисплея: БД во временном файле, фоновый поток записи)
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from modules.database import DatabaseManager
+from modules.event_manager import EventManager
+
+
+class FakeAsyncDatabase:
+    """AsyncDatabase без Tk: задания идут в поток записи, результаты - по pump()"""
+
+    def __init__(self, db: DatabaseManager):
+        self.db = db
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="test-writer")
+        self._owner = threading.current_thread()
+        self._done = []
+
+    def write(self, method, *args, callback=None, errback=None, **kwargs):
+        func = getattr(self.db, method) if isinstance(method, str) else method
+
+        def job():
+            assert threading.current_thread() is not self._owner
+            return func(*args, **kwargs)
+
+        future = self._writer.submit(job)
+        self._done.append((future, callback, errback))
+        return future
+
+    def read(self, method, *args, callback=None, errback=None, after_writes=False, **kwargs):
+        return self.write(method, *args, callback=callback, errback=errback, **kwargs)
+
+    def flush(self):
+        """Ожидание всех заданий без доставки результатов"""
+        self._writer.submit(lambda: None).result()
+
+    def pump(self):
+        """Доставка результатов на текущем (\"Tk\") потоке по порядку постановки"""
+        while self._done:
+            future, callback, errback = self._done.pop(0)
+            error = future.exception()
+            if error is not None:
+                if errback is None:
+                    raise error
+                errback(error)
+            elif callback is not None:
+                callback(future.result())
+
+    def shutdown(self):
+        self._writer.shutdown(wait=True)
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "tasks.db"))
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def async_db(db):
+    fake = FakeAsyncDatabase(db)
+    yield fake
+    fake.shutdown()
+
+
+@pytest.fixture
+def events():
+    return EventManager()
+
+
+@pytest.fixture
+def service(db, events, async_db):
+    from main import TaskService
+    return TaskService(db, events, async_db)
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+Task Manager - Тесты DatabaseManager на временной БД
+"""
+
+import sqlite3
+
+import pytest
+
+from modules.database import DatabaseManager
+from modules.task_models import Task
+
+DAY = '2026-10-17'
+NEXT_DAY = '2026-10-18'
+
+
+@pytest.fixture(params=['fts', 'like'])
+def search_db(request, db):
+    """БД с поиском через FTS5 и через запасной LIKE"""
+    if request.param == 'like':
+        db._has_fts = False
+    elif not db.has_fts():
+        pytest.skip("SQLite без FTS5")
+    return db
+
+
+def titles(tasks):
+    return sorted(t.title for t in tasks)
+
+
+def test_search_is_case_insensitive_for_cyrillic(search_db):
+    search_db.save_tasks([
+        Task(title='Купить Молоко'),
+        Task(title='позвонить', content='МАМЕ вечером'),
+        Task(title='Milk', date_scheduled='2026-10-17'),
+    ])
+
+    assert titles(search_db.search_tasks('молоко')) == ['Купить Молоко']
+    assert titles(search_db.search_tasks('КУПИТЬ мол')) == ['Купить Молоко']
+    assert titles(search_db.search_tasks('мама')) == []
+    assert titles(search_db.search_tasks('маме')) == ['позвонить']
+    assert titles(search_db.search_tasks('MILK')) == ['Milk']
+    assert search_db.search_tasks('milk', backlog_only=True) == []
+
+
+def test_search_type_filter(search_db):
+    search_db.save_tasks([Task(title='отчет', task_type_id=1), Task(title='отчет 2', task_type_id=2),
+                          Task(title='отчет без типа', task_type_id=0)])
+    assert titles(search_db.search_tasks('отчет', type_id=2)) == ['отчет 2']
+    assert titles(search_db.search_tasks('отчет', type_id=0)) == ['отчет без типа']
+
+
+def rollup_from_tasks(db):
+    """Эталон daily_rollup: агрегат прямо по tasks"""
+    return db._get_connection().execute('''
+        SELECT date_scheduled, COUNT(*),
+               SUM(CASE WHEN is_completed THEN 1 ELSE 0 END),
+               SUM(CASE WHEN is_completed THEN importance ELSE 0 END),
+               SUM(CASE WHEN has_duration THEN duration ELSE 0 END)
+        FROM tasks
+        WHERE date_scheduled <> ''
+        GROUP BY date_scheduled
+        ORDER BY date_scheduled DESC
+    ''').fetchall()
+
+
+def assert_fts_consistent(db):
+    """Индекс tasks_fts совпадает с таблицей tasks"""
+    if db.has_fts():
+        with db.transaction() as conn:
+            # rank=1 - сверка токенов индекса с текущим текстом строк tasks
+            conn.execute("INSERT INTO tasks_fts (tasks_fts, rank) VALUES ('integrity-check', 1)")
+        count = conn.execute('SELECT COUNT(*) FROM tasks_fts').fetchone()[0]
+        assert count == conn.execute('SELECT COUNT(*) FROM tasks').fetchone()[0]
+
+
+def test_fresh_database_has_all_migrations(db):
+    conn = db._get_connection()
+    assert db.get_schema_version() == len(db.get_migrations()) == 4
+
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(tasks)')}
+    assert 'has_duration' in columns
+
+    names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    assert {'idx_tasks_date_quadrant', 'idx_tasks_day_stats', 'idx_tasks_backlog',
+            'idx_tasks_type', 'daily_rollup', 'trg_tasks_rollup_insert',
+            'trg_tasks_rollup_update', 'trg_tasks_rollup_delete'} <= names
+    if db.has_fts():
+        assert {'trg_tasks_fts_insert', 'trg_tasks_fts_update', 'trg_tasks_fts_delete'} <= names
+
+
+def test_migrations_upgrade_old_database(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    # Схема до миграций: без has_duration, бэклог как NULL
+    conn.execute('''
+        CREATE TABLE tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            content TEXT DEFAULT '',
+            importance INTEGER DEFAULT 1,
+            duration INTEGER DEFAULT 30,
+            priority INTEGER DEFAULT 5,
+            task_type_id INTEGER DEFAULT 1,
+            is_completed BOOLEAN DEFAULT FALSE,
+            quadrant INTEGER DEFAULT 0,
+            date_created TEXT NOT NULL,
+            date_scheduled TEXT,
+            is_recurring BOOLEAN DEFAULT FALSE,
+            recurrence_pattern TEXT DEFAULT '',
+            move_count INTEGER DEFAULT 0
+        )
+    ''')
+    conn.executemany(
+        'INSERT INTO tasks (title, importance, is_completed, date_created, date_scheduled) '
+        'VALUES (?, ?, ?, ?, ?)', [
+            ('Старый отчет', 3, True, '2026-01-01', '2026-10-17'),
+            ('Встреча', 1, False, '2026-01-01', '2026-10-17'),
+            ('Идея', 1, False, '2026-01-01', None),
+        ])
+    conn.commit()
+    conn.close()
+
+    db = DatabaseManager(path)
+    try:
+        assert db.get_schema_version() == 4
+        assert [t.title for t in db.get_tasks(include_backlog=True)] == ['Идея']
+        assert db.get_daily_rollup() == [('2026-10-17', 2, 1, 3, 0)]
+        assert titles(db.search_tasks('отчет')) == ['Старый отчет']
+        assert_fts_consistent(db)
+    finally:
+        db.close()
+
+    # Повторное открытие не применяет миграции заново
+    db = DatabaseManager(path)
+    try:
+        assert db.get_schema_version() == 4
+        assert db.get_daily_rollup() == [('2026-10-17', 2, 1, 3, 0)]
+    finally:
+        db.close()
+
+
+def test_rollup_and_fts_follow_insert_update_move_delete(db):
+    a, b, c = (Task(title='Отчет', importance=5, duration=60, has_duration=True, date_scheduled=DAY),
+               Task(title='Почта', importance=2, date_scheduled=DAY),
+               Task(title='Идея', content='черновик'))
+    a.id, b.id, c.id = db.save_tasks([a, b, c])
+    assert db.get_daily_rollup() == rollup_from_tasks(db) == [(DAY, 2, 0, 0, 60)]
+    assert_fts_consistent(db)
+
+    # Выполнение и правка текста
+    db.update_task_fields(a.id, {'is_completed': True, 'title': 'Квартальный отчет'})
+    assert db.get_daily_rollup() == rollup_from_tasks(db) == [(DAY, 2, 1, 5, 60)]
+    assert titles(db.search_tasks('квартальный')) == ['Квартальный отчет']
+    assert db.search_tasks('почта') and not db.search_tasks('черновой')
+    assert_fts_consistent(db)
+
+    # Перенос на другой день и из бэклога
+    db.update_tasks_fields([(a.id, {'date_scheduled': NEXT_DAY}), (c.id, {'date_scheduled': DAY})])
+    assert db.get_daily_rollup() == rollup_from_tasks(db) == [
+        (NEXT_DAY, 1, 1, 5, 60), (DAY, 2, 0, 0, 0)]
+
+    # Полное сохранение и перенос в бэклог
+    b.date_scheduled = ''
+    b.content = 'входящие'
+    db.save_tasks([b])
+    assert db.get_daily_rollup() == rollup_from_tasks(db) == [
+        (NEXT_DAY, 1, 1, 5, 60), (DAY, 1, 0, 0, 0)]
+    assert titles(db.search_tasks('входящие', backlog_only=True)) == ['Почта']
+    assert_fts_consistent(db)
+
+    # Удаление последней задачи дня убирает строку дня
+    db.delete_tasks([a.id, c.id])
+    assert db.get_daily_rollup() == rollup_from_tasks(db) == []
+    assert db.search_tasks('отчет') == [] and db.search_tasks('черновик') == []
+    assert_fts_consistent(db)
+
+    db.rebuild_daily_rollup()
+    assert db.get_daily_rollup() == []
+
+
+def test_update_tasks_fields_groups_by_changed_columns(db):
+    tasks = [Task(title=f't{i}', date_scheduled=DAY) for i in range(4)]
+    ids = db.save_tasks(tasks)
+
+    statements = []
+    conn = db._get_connection()
+    conn.set_trace_callback(statements.append)
+    try:
+        updated = db.update_tasks_fields([
+            (ids[0], {'quadrant': 1}),
+            (ids[1], {'quadrant': 2}),
+            (ids[2], {'title': 'x', 'priority': 9}),
+            (ids[3], {}),  # Без изменений - не пишется
+        ])
+    finally:
+        conn.set_trace_callback(None)
+
+    assert updated == 3
+    # Трассировка повторяет текст UPDATE для каждого шага триггеров - сравниваем множества
+    updates = {s for s in statements if s.startswith('UPDATE tasks')}
+    # Один executemany на набор колонок: две строки quadrant и одна priority+title
+    assert updates == {
+        f'UPDATE tasks SET quadrant=1 WHERE id={ids[0]}',
+        f'UPDATE tasks SET quadrant=2 WHERE id={ids[1]}',
+        f"UPDATE tasks SET priority=9, title='x' WHERE id={ids[2]}",
+    }
+
+    by_id = {t.id: t for t in db.get_tasks(DAY)}
+    assert [by_id[i].quadrant for i in ids] == [1, 2, 0, 0]
+    assert (by_id[ids[2]].title, by_id[ids[2]].priority) == ('x', 9)
+    assert db.update_tasks_fields([(ids[0], {})]) == 0
+
+
+def test_update_tasks_fields_rejects_unknown_columns(db):
+    task_id = db.save_task(Task(title='a'))
+    with pytest.raises(ValueError):
+        db.update_tasks_fields([(task_id, {'id': 5})])
+    with pytest.raises(ValueError):
+        db.update_task_fields(task_id, {'title = title; --': 'x'})
+
+
+def test_take_changes_gives_minimal_update(db):
+    task = Task(title='a', date_scheduled=DAY)
+    task.id = db.save_task(task)
+    task.mark_clean()
+
+    task.quadrant = 3
+    task.quadrant = 3
+    task.title = 'a'  # То же значение - не изменение
+    changes = task.take_changes()
+    assert changes == {'quadrant': 3}
+    assert task.take_changes() == {}
+
+    assert db.update_task_fields(task.id, changes)
+    assert not db.update_task_fields(task.id, task.take_changes())
+    assert db.get_tasks(DAY)[0].quadrant == 3
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Task Manager - Тесты EventManager: фильтры подписок и события из рабочих потоков
+"""
+
+import threading
+
+from modules.event_manager import EventFilter, EventManager, EventType
+from modules.task_models import Task
+
+
+class FakeRoot:
+    """Заглушка root: after() только запоминается, вызовы - вручную через run_due()"""
+
+    def __init__(self):
+        self.owner = threading.current_thread()
+        self.jobs = {}
+        self.foreign_calls = 0
+        self._ids = 0
+
+    def _check_thread(self):
+        if threading.current_thread() is not self.owner:
+            self.foreign_calls += 1
+
+    def after(self, delay_ms, callback, *args):
+        self._check_thread()
+        self._ids += 1
+        self.jobs[self._ids] = (callback, args)
+        return self._ids
+
+    def after_idle(self, callback, *args):
+        return self.after(0, callback, *args)
+
+    def after_cancel(self, after_id):
+        self._check_thread()
+        self.jobs.pop(after_id, None)
+
+    def run_due(self):
+        jobs, self.jobs = self.jobs, {}
+        for callback, args in jobs.values():
+            callback(*args)
+
+
+def test_worker_thread_events_never_touch_root():
+    root = FakeRoot()
+    events = EventManager(root)
+    received = []
+    events.subscribe(EventType.TASK_CREATED, lambda event: received.append(event.data))
+
+    task = Task(id=1, title='a')
+    worker = threading.Thread(target=lambda: [events.emit_now(EventType.TASK_CREATED, task)
+                                              for _ in range(3)])
+    worker.start()
+    worker.join()
+
+    assert root.foreign_calls == 0
+    assert received == []
+    root.run_due()  # Опрос очереди на потоке "Tk"
+    assert received == [task, task, task]
+    events.close()
+    assert root.jobs == {}
+
+
+def test_filtered_subscribers_get_only_their_dates():
+    events = EventManager()
+    day, other, backlog, ranged = [], [], [], []
+    events.subscribe(EventType.TASK_UPDATED, lambda e: day.append(e.data.id),
+                     where=EventFilter.on_date('2026-10-17'))
+    events.subscribe(EventType.TASK_UPDATED, lambda e: other.append(e.data.id),
+                     where=EventFilter.on_date('2026-10-18') | EventFilter.task(3))
+    events.subscribe(EventType.TASK_UPDATED, lambda e: backlog.append(e.data.id),
+                     where=EventFilter.backlog())
+    events.subscribe(EventType.TASK_UPDATED, lambda e: ranged.append(e.data.id),
+                     where=EventFilter.between('2026-10-01', '2026-10-31'))
+
+    events.emit_now(EventType.TASK_UPDATED, Task(id=1, date_scheduled='2026-10-17'))
+    events.emit_now(EventType.TASK_UPDATED, Task(id=2))
+    events.emit_now(EventType.TASK_UPDATED, Task(id=3, date_scheduled='2026-10-17'))
+    # Перенос между датами: событие касается обеих
+    events.emit_now(EventType.TASK_UPDATED, Task(id=4, date_scheduled='2026-10-18'),
+                    dates={'2026-10-18', ''})
+
+    assert day == [1, 3]
+    assert other == [3, 4]
+    assert backlog == [2, 4]
+    assert ranged == [1, 3, 4]
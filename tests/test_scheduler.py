@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Task Manager - Тесты общего планировщика (без Tk: root.after - заглушка)
+"""
+
+import time
+
+from modules.scheduler import Scheduler
+
+
+class FakeRoot:
+    """Один взведенный after, как у планировщика; fire() - его срабатывание"""
+
+    def __init__(self):
+        self.pending = {}
+        self._ids = 0
+
+    def after(self, delay_ms, callback):
+        self._ids += 1
+        self.pending[self._ids] = callback
+        return self._ids
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def fire(self):
+        pending, self.pending = self.pending, {}
+        for callback in pending.values():
+            callback()
+
+
+def expire(scheduler):
+    """Все задачи кучи становятся просроченными"""
+    scheduler._heap = [(0.0, seq, job) for _, seq, job in scheduler._heap]
+    for _, _, job in scheduler._heap:
+        job.deadline = 0.0
+
+
+def test_jobs_run_in_deadline_order_with_one_timer():
+    root = FakeRoot()
+    scheduler = Scheduler(root)
+    calls = []
+    scheduler.call_later(30, calls.append, 'c')
+    scheduler.call_later(10, calls.append, 'a')
+    cancelled = scheduler.call_later(20, calls.append, 'x')
+    scheduler.call_later(20, calls.append, 'b')
+    cancelled.cancel()
+
+    assert len(root.pending) == 1
+    time.sleep(0.04)
+    root.fire()
+    assert calls == ['a', 'b', 'c']
+    assert root.pending == {} and scheduler.pending_count() == 0
+
+
+def test_suspend_parks_only_visual_jobs():
+    root = FakeRoot()
+    scheduler = Scheduler(root)
+    calls = []
+    scheduler.call_later(0, calls.append, 'clock', visual=True)
+    scheduler.call_later(0, calls.append, 'db poll')
+
+    scheduler.suspend()
+    scheduler.call_later(0, calls.append, 'events')
+    scheduler.call_later(0, calls.append, 'refresh', visual=True)
+    expire(scheduler)
+    root.fire()
+    assert calls == ['db poll', 'events']
+    assert root.pending == {}  # Свернутое окно с одними визуальными задачами не просыпается
+    assert scheduler.pending_count() == 2
+
+    scheduler.resume()
+    expire(scheduler)
+    root.fire()
+    assert sorted(calls[2:]) == ['clock', 'refresh']
+
+
+def test_visual_repeat_is_parked_while_suspended():
+    root = FakeRoot()
+    scheduler = Scheduler(root)
+    ticks = []
+    scheduler.call_every(1, lambda: (ticks.append(1), scheduler.suspend()), visual=True)
+    expire(scheduler)
+    root.fire()
+    assert ticks == [1]
+    assert scheduler._heap == [] and len(scheduler._parked) == 1
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Task Manager - Тесты кешей плиток списка задач (без дисплея: виджеты-заглушки)
+"""
+
+from modules.task_list_widget import TaskListWidget
+from modules.task_models import Task, TaskType
+from modules.tile_pool import TilePool
+
+
+class FakeWidget:
+    """Заглушка виджета Tk: только то, что трогают кеш и пул"""
+
+    def __init__(self, text=''):
+        self.manager = ''
+        self.container = None
+        self.text = text
+        self.alive = True
+
+    def pack(self, in_=None, **kwargs):
+        self.manager = 'pack'
+        self.container = in_
+
+    def pack_forget(self):
+        self.manager = ''
+        self.container = None
+
+    def winfo_manager(self):
+        return self.manager
+
+    def winfo_exists(self):
+        return self.alive
+
+    def destroy(self):
+        self.alive = False
+
+    def lift(self):
+        pass
+
+    def config(self, text=None, **kwargs):
+        self.text = text
+
+    def __getitem__(self, key):
+        return self.text
+
+
+class FakeTile:
+    def __init__(self):
+        self.frame = FakeWidget()
+        self.task = None
+
+    def render(self, task):
+        self.task = task
+
+
+class FakeNotebook:
+    def __init__(self):
+        self.titles = {0: '', 1: ''}
+
+    def tab(self, index, option=None, text=None):
+        if text is None:
+            return self.titles[index]
+        self.titles[index] = text
+
+
+class FakeTaskManager:
+    TYPES = [TaskType(1, 'Работа'), TaskType(2, 'Дом')]  # 'Дом' раньше по сортировке
+
+    def get_task_types(self):
+        return self.TYPES
+
+
+def make_widget():
+    widget = TaskListWidget.__new__(TaskListWidget)
+    widget.task_manager = FakeTaskManager()
+    widget.tile_pool = TilePool()
+    widget.notebook = FakeNotebook()
+    widget.group_widgets = {}
+    widget.group_states = {}
+    widget._task_widgets_cache = {'active': {}, 'completed': {}}
+    widget._current_tasks = {'active': {}, 'completed': {}}
+    widget.active_scrollable_frame, widget.active_empty_label = FakeWidget(), FakeWidget()
+    widget.completed_scrollable_frame, widget.completed_empty_label = FakeWidget(), FakeWidget()
+    widget.created_tiles = []
+
+    def build_tile(parent_frame):
+        tile = FakeTile()
+        widget.created_tiles.append(tile)
+        return tile
+
+    widget._build_task_widget = build_tile
+
+    def create_group(parent_frame, type_name, tasks, tab_type):
+        group = {'frame': FakeWidget(), 'container': FakeWidget(),
+                 'header_label': FakeWidget(f"{type_name} ({len(tasks)})")}
+        group['frame'].pack()
+        widget.group_widgets[f"{tab_type}_groups"][type_name] = group
+        for task in tasks:
+            widget._create_task_widget(group['container'], task, tab_type)
+
+    widget._create_group_widget = create_group
+    return widget
+
+
+def shown(widget, tab_type='active'):
+    """Задачи по контейнерам групп: что действительно размещено на экране"""
+    containers = {id(group['container']): name
+                  for name, group in widget.group_widgets.get(f"{tab_type}_groups", {}).items()}
+    result = {}
+    for tile in widget._task_widgets_cache[tab_type].values():
+        if tile.frame.manager:
+            result.setdefault(containers[id(tile.frame.container)], set()).add(tile.task.title)
+    return result
+
+
+def test_move_to_group_that_sorts_earlier():
+    widget = make_widget()
+    home = Task(title='home', task_type_id=2)
+    moving = Task(title='moving', task_type_id=1)
+    work = Task(title='work', task_type_id=1)
+    widget.update_tasks([home, moving, work])
+
+    moving.task_type_id = 2
+    widget.update_tasks([home, moving, work])
+
+    assert shown(widget) == {'Дом': {'home', 'moving'}, 'Работа': {'work'}}
+    # На экране только плитки из кеша: старая плитка не осталась в прежней группе
+    cached = list(widget._task_widgets_cache['active'].values())
+    assert [t for t in widget.created_tiles if t.frame.manager and t not in cached] == []
+
+
+def test_unsaved_tasks_get_separate_tiles():
+    widget = make_widget()
+    first, second = Task(title='a', task_type_id=1), Task(title='b', task_type_id=1)
+    widget.update_tasks([first, second])
+    assert shown(widget) == {'Работа': {'a', 'b'}}
+
+    first.id = 7  # id назначен после записи - ключ плитки тот же
+    first.is_completed = True
+    widget.update_task(first)
+    assert shown(widget) == {'Работа': {'b'}}
+    assert shown(widget, 'completed') == {'Работа': {'a'}}
+
+
+def test_remove_task_reports_whether_it_was_shown():
+    widget = make_widget()
+    task = Task(id=3, title='a', task_type_id=1)
+    widget.update_tasks([task])
+
+    assert widget.remove_task(3) is True
+    assert shown(widget) == {}
+    assert widget.remove_task(3) is False  # Уже не показана - нужен полный проход
+    assert widget.remove_task(0) is False
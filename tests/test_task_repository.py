@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Task Manager - Тесты TaskRepository: identity map и слияние чтений с памятью
+"""
+
+import pytest
+
+from modules.task_models import Task
+from modules.task_repository import BACKLOG, TaskRepository
+
+DAY = '2026-10-17'
+
+
+@pytest.fixture
+def repository(db, async_db):
+    return TaskRepository(db, async_db)
+
+
+def load(repository, async_db, date_str):
+    """Чтение даты через поток чтения с доставкой результата"""
+    loaded = []
+    repository.load_async(date_str, loaded.append)
+    async_db.pump()
+    return loaded[0]
+
+
+def test_loaded_tasks_keep_identity(repository, async_db, db):
+    task_id = db.save_task(Task(title='a', date_scheduled=DAY))
+
+    first = load(repository, async_db, DAY)
+    repository.invalidate(DAY)
+    second = load(repository, async_db, DAY)
+
+    assert len(first) == 1 and first[0] is second[0]
+    assert repository.get(task_id) is first[0]
+
+
+def test_memory_wins_over_stale_rows(repository, async_db, db):
+    db.save_task(Task(title='a', date_scheduled=DAY))
+    task = load(repository, async_db, DAY)[0]
+
+    # Изменение в памяти еще не записано - перечитанная строка его не затирает
+    task.title = 'b'
+    task.date_scheduled = ''
+    repository.save(task)
+    repository.invalidate()
+    assert load(repository, async_db, DAY) == []
+    assert load(repository, async_db, BACKLOG) == [task]
+    assert task.title == 'b'
+
+
+def test_copy_is_merged_into_canonical_instance(repository, async_db, db):
+    db.save_task(Task(title='a', date_scheduled=DAY))
+    task = load(repository, async_db, DAY)[0]
+
+    copy = task.snapshot()
+    copy.quadrant = 3
+    assert repository.save(copy) is task
+    assert task.quadrant == 3 and task.take_changes() == {'quadrant': 3}
+    assert repository.get_quadrant_tasks(DAY, 3) == [task]
+    assert repository.get_quadrant_tasks(DAY, 0) == []
+
+
+def test_concurrent_loads_share_one_read(repository, async_db, db):
+    db.save_task(Task(title='a', date_scheduled=DAY))
+    first, second = [], []
+    repository.load_async(DAY, first.append)
+    repository.load_async(DAY, second.append)
+    assert len(async_db._done) == 1
+    async_db.pump()
+    assert first == second and len(first[0]) == 1
+
+
+def test_deleted_task_is_not_resurrected_by_read(repository, async_db, db):
+    db.save_task(Task(title='a', date_scheduled=DAY))
+    task = load(repository, async_db, DAY)[0]
+
+    repository.remove(task)  # Удаление еще не записано в БД
+    repository.invalidate(DAY)
+    assert load(repository, async_db, DAY) == []
+    assert repository.indexed_date(task) is None
+
+    db.delete_task(task.id)
+    repository.mark_deleted(task)
+    assert repository.get(task.id) is None
+
+
+def test_new_task_gets_id_on_mark_stored(repository, db):
+    task = repository.add(Task(title='new', date_scheduled=DAY))
+    assert repository.indexed_date(task) == DAY
+
+    task_id = db.save_task(task.snapshot())
+    repository.mark_stored(task, task_id)
+    assert task.id == task_id and repository.get(task_id) is task
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Task Manager - Тесты TaskService: запись через поток записи и пакеты событий
+"""
+
+import threading
+
+from modules.event_manager import EventType
+from modules.task_models import Task
+
+DAY = '2026-10-17'
+
+
+def batches(events):
+    """Список для полученных BATCH_COMPLETED"""
+    received = []
+    events.subscribe(EventType.BATCH_COMPLETED, lambda event: received.append(event.data))
+    return received
+
+
+def test_writer_thread_does_not_touch_live_task(service, async_db, db):
+    task = service.create_task(Task(title='a', date_scheduled=DAY))
+    task.title = 'b'
+    service.update_task(task)  # Поставлено до назначения id
+
+    async_db.flush()
+    assert task.id == 0
+
+    async_db.pump()
+    assert task.id
+    assert service.repository.get(task.id) is task
+    assert [(t.id, t.title) for t in db.get_tasks(DAY)] == [(task.id, 'b')]
+
+
+def test_delete_of_unsaved_task(service, async_db, db):
+    task = service.create_task(Task(title='gone', date_scheduled=DAY))
+    service.delete_task(task.id, task)
+    async_db.pump()
+    assert db.get_tasks(DAY) == []
+
+
+def test_batch_ids_for_mixed_create_move_delete(service, events, async_db):
+    existing = service.create_task(Task(title='t1', date_scheduled=DAY))
+    async_db.pump()
+    received = batches(events)
+
+    with service.bulk():
+        b = service.create_task(Task(title='B', date_scheduled=DAY))
+        service.move_task_to_quadrant(b, 2)
+        existing.title = 't1*'
+        service.update_task(existing)
+        c = service.create_task(Task(title='C', date_scheduled=DAY))
+        service.delete_task(c.id, c)
+
+    assert received == []  # Ждет назначения id новым задачам
+    async_db.pump()
+
+    assert len(received) == 1
+    batch = received[0]
+    assert b.id and c.id
+    assert batch.created == {b.id, c.id}
+    assert batch.moved == {b.id}
+    assert batch.updated == {existing.id}
+    assert batch.deleted == {c.id}
+    assert not batch.unresolved
+    assert len(batch) == 5
+
+
+def test_batch_without_new_tasks_is_emitted_at_once(service, events, async_db):
+    task = service.create_task(Task(title='a', date_scheduled=DAY))
+    async_db.pump()
+    received = batches(events)
+
+    with service.bulk():
+        service.move_task_to_quadrant(task, 1)
+
+    assert [batch.moved for batch in received] == [{task.id}]
+
+
+def test_bulk_writes_queued_before_batch_completed(service, events, async_db, db):
+    task = service.create_task(Task(title='a', date_scheduled=DAY))
+    async_db.pump()
+    gate = threading.Event()
+    async_db.write(gate.wait)  # Поток записи занят до проверки
+
+    queued = []
+    events.subscribe(EventType.BATCH_COMPLETED,
+                     lambda event: queued.append(not service._bulk_writes))
+    with service.bulk():
+        service.move_task_to_quadrant(task, 3)
+    gate.set()
+    async_db.pump()
+
+    assert queued == [True]
+    assert db.get_tasks(DAY)[0].quadrant == 3
+
+
+def test_service_writes_keep_rollup_and_fts_consistent(service, async_db, db):
+    from tests.test_database import assert_fts_consistent, rollup_from_tasks
+
+    a = service.create_task(Task(title='Отчет', date_scheduled=DAY))
+    b = service.create_task(Task(title='Почта', duration=45, has_duration=True, date_scheduled=DAY))
+    c = service.create_task(Task(title='Идея'))
+    async_db.pump()
+
+    service.toggle_task_completion(a, True)
+    service.move_task_to_quadrant(a, 1)  # importance растет - меняется и сводка
+    b.title = 'Входящие'
+    b.date_scheduled = '2026-10-18'
+    service.update_task(b)
+    with service.bulk():
+        c.date_scheduled = DAY
+        service.update_task(c)
+        service.delete_task(a.id, a)
+    async_db.flush()
+    async_db.pump()
+
+    assert db.get_daily_rollup() == rollup_from_tasks(db) == [
+        ('2026-10-18', 1, 0, 0, 45), (DAY, 1, 0, 0, 0)]
+    assert [t.title for t in db.search_tasks('входящие')] == ['Входящие']
+    assert db.search_tasks('отчет') == [] and db.search_tasks('почта') == []
+    assert_fts_consistent(db)
+
+
+def test_bulk_update_writes_only_changed_columns(service, async_db, db):
+    tasks = service.create_tasks([Task(title=f't{i}', date_scheduled=DAY) for i in range(3)])
+    async_db.pump()
+
+    statements = []
+    async_db.write(lambda: db._get_connection().set_trace_callback(statements.append))
+    with service.bulk():
+        service.move_task_to_quadrant(tasks[0], 2)
+        service.move_task_to_quadrant(tasks[1], 2)
+        tasks[2].title = 'x'
+        service.update_task(tasks[2])
+        tasks[2].content = 'y'
+        service.update_task(tasks[2])
+    async_db.write(lambda: db._get_connection().set_trace_callback(None))
+    async_db.flush()
+    async_db.pump()
+
+    # Трассировка повторяет текст UPDATE для каждого шага триггеров - сравниваем множества
+    updates = {s for s in statements if s.startswith('UPDATE tasks')}
+    assert updates == {
+        f'UPDATE tasks SET importance=2, move_count=1, priority=2, quadrant=2 WHERE id={tasks[0].id}',
+        f'UPDATE tasks SET importance=2, move_count=1, priority=2, quadrant=2 WHERE id={tasks[1].id}',
+        f"UPDATE tasks SET content='y', title='x' WHERE id={tasks[2].id}",
+    }
+    assert statements.count('BEGIN IMMEDIATE') == 1